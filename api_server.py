@@ -10,6 +10,7 @@ import uvicorn
 import traceback
 import asyncio
 import json
+import threading
 from fastapi.responses import StreamingResponse
 
 # 프로젝트 경로 추가
@@ -19,7 +20,13 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 os.makedirs("temp_images", exist_ok=True)
 
 # 환경 설정
-from src.config import setup_environment
+from src.config import (
+    setup_environment,
+    get_webdriver_pool_size,
+    get_webdriver_max_pages,
+    get_job_max_workers,
+    get_job_max_attempts,
+)
 
 setup_environment()
 
@@ -28,6 +35,7 @@ from src.application.analysis_logic import (
     analyze_single_keyword_fully,
     perform_category_analysis,
 )
+from src.data.festival_catalog import get_festival_catalog
 from src.data.festival_loader import (
     get_cat1_choices,
     get_cat2_choices,
@@ -36,12 +44,25 @@ from src.data.festival_loader import (
 )
 from src.application.utils import (
     create_driver,
+    get_cache_key,
     load_cached_analysis,
     save_analysis_to_cache,
     generate_recommendation_analysis,
     generate_comparison_recommendation,
 )
 from src.application import seasonal_analysis
+from src.application.single_flight import SingleFlight
+from src.application.job_manager import JobManager
+from src.infrastructure.database.job_store import JobStore, FINISHED_STATUSES
+from src.infrastructure.web.driver_pool import WebDriverPool
+from src.infrastructure.web.http_client import get_naver_http_client
+from src.infrastructure.database.db_manager import get_connection_stats, prepare_search_indexes
+from src.infrastructure.database.place_repository import find_nearby_attractions, PLACE_TABLES, ATTRACTION_TYPES
+from src.infrastructure.cache.memory_cache import get_memory_cache
+from src.infrastructure.cache.analysis_cache_store import get_analysis_cache_backend
+from src.infrastructure.cache.blog_content_store import get_blog_content_store
+from src.infrastructure.cache.post_result_store import get_post_result_store
+from src.infrastructure.cache.trend_store import get_trend_store
 from src.infrastructure.reporting import seasonal_wordcloud
 
 # FastAPI 앱 생성
@@ -63,8 +84,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 전역 WebDriver (재사용)
-driver = None
+# 전역 WebDriver 풀 (요청/작업자마다 드라이버를 빌려 사용)
+driver_pool = WebDriverPool(
+    create_driver,
+    size=get_webdriver_pool_size(),
+    max_pages=get_webdriver_max_pages(),
+)
+
+
+# 백그라운드 분석 작업 관리자 (작업 상태는 database/jobs.db에 저장)
+job_manager = JobManager(JobStore(), max_workers=get_job_max_workers(), max_attempts=get_job_max_attempts())
+
+# 같은 키워드/리뷰 수의 분석이 동시에 요청되면 한 번만 실행하고 결과를 공유합니다.
+keyword_flights = SingleFlight("KeywordAnalysis")
 
 
 # 캐싱을 지원하는 분석 헬퍼 함수
@@ -73,110 +105,71 @@ def analyze_with_cache(
     num_reviews: int,
     log_details: bool = True,
     progress_desc: str = "분석",
+    progress=None,
 ) -> dict:
-    """캐싱을 지원하는 키워드 분석 함수"""
-    global driver
+    """캐싱을 지원하는 키워드 분석 함수
 
+    같은 키워드/리뷰 수의 분석이 이미 실행 중이면 새로 실행하지 않고 그 결과를 함께 받습니다.
+    progress를 넘기면 실행 중인 분석의 진행률도 함께 전달받습니다.
+    """
     # 1. 캐시 확인
     cached_results = load_cached_analysis(keyword, num_reviews)
     if cached_results:
         print(f"[CACHE HIT] 캐시된 결과 사용: {keyword}")
         return cached_results
 
-    # 2. 캐시가 없으면 새로운 분석 실행
-    print(f"[CACHE MISS] 새로운 분석 실행: {keyword}")
-    if not driver:
-        driver = create_driver()
+    def run_analysis(flight_progress):
+        # 합류를 기다리는 사이에 다른 요청이 분석을 끝냈을 수 있으므로 캐시를 다시 확인합니다.
+        cached = load_cached_analysis(keyword, num_reviews)
+        if cached:
+            return cached
+
+        # 2. 캐시가 없으면 새로운 분석 실행
+        print(f"[CACHE MISS] 새로운 분석 실행: {keyword}")
+        results = analyze_single_keyword_fully(
+            keyword=keyword,
+            num_reviews=num_reviews,
+            driver=driver_pool,
+            log_details=log_details,
+            progress=flight_progress,
+            progress_desc=progress_desc,
+        )
 
-    class DummyProgress:
-        def __call__(self, *args, **kwargs):
-            pass
+        if "error" in results:
+            return results
 
-    progress = DummyProgress()
+        # 3. API 응답 형식으로 변환
+        response = format_single_keyword_response(results, keyword)
 
-    results = analyze_single_keyword_fully(
-        keyword=keyword,
-        num_reviews=num_reviews,
-        driver=driver,
-        log_details=log_details,
-        progress=progress,
-        progress_desc=progress_desc,
-    )
+        # 4. 캐시에 저장
+        save_analysis_to_cache(keyword, num_reviews, response)
 
-    if "error" in results:
-        return results
-
-    # 3. API 응답 형식으로 변환
-    response = {
-        "status": results.get("status", "분석 완료"),
-        "keyword": keyword,
-        "total_pos": results.get("total_pos", 0),
-        "total_neg": results.get("total_neg", 0),
-        "avg_satisfaction": results.get("avg_satisfaction", 3.0),
-        "satisfaction_counts": results.get("satisfaction_counts", {}),
-        "distribution_interpretation": results.get("distribution_interpretation", ""),
-        "all_scores": results.get("all_scores", []),
-        "outliers": results.get("outliers", []),
-        "seasonal_data": results.get("seasonal_data", {}),
-        "blog_results": (
-            results.get("blog_results_df", {}).to_dict("records")
-            if hasattr(results.get("blog_results_df"), "to_dict")
-            else []
-        ),
-        "negative_summary": results.get("negative_summary", ""),
-        "overall_summary": results.get("overall_summary", ""),
-        "trend_metrics": results.get("trend_metrics", {}),
-        "url_markdown": results.get("url_markdown", ""),
-        "trend_graph": results.get("trend_graph"),
-        "focused_trend_graph": results.get("focused_trend_graph"),
-        "seasonal_word_clouds": results.get("seasonal_word_clouds"),
-        "addr1": results.get("addr1", "N/A"),
-        "addr2": results.get("addr2", "N/A"),
-        "areaCode": results.get("areaCode", "N/A"),
-        "eventStartDate": (
-            results.get("festival_start_date").strftime("%Y-%m-%d")
-            if results.get("festival_start_date")
-            else "N/A"
-        ),
-        "eventEndDate": (
-            results.get("festival_end_date").strftime("%Y-%m-%d")
-            if results.get("festival_end_date")
-            else "N/A"
-        ),
-        "eventPeriod": results.get("event_period", "N/A"),
-        "sentiment_score": results.get("total_sentiment_score", 0),
-        "satisfaction_delta": results.get("satisfaction_delta", 0),
-        "emotion_keyword_freq": results.get("emotion_keyword_freq", {}),
-    }
-
-    # 4. 캐시에 저장
-    save_analysis_to_cache(keyword, num_reviews, response)
+        return response
 
-    return response
+    return keyword_flights.do(
+        get_cache_key(keyword, num_reviews), run_analysis, progress=progress
+    )
 
 
 @app.on_event("startup")
 async def startup_event():
-    """서버 시작 시 WebDriver 초기화"""
-    global driver
-    try:
-        driver = create_driver()
-        print("[OK] WebDriver initialized successfully")
-    except Exception as e:
-        print(f"[WARN] WebDriver initialization failed: {e}")
-        driver = None
+    """서버 시작 시 WebDriver 풀 설정 출력 (드라이버는 처음 필요할 때 생성), 검색 인덱스 준비, 축제 카탈로그 로드"""
+    print(
+        f"[OK] WebDriver pool ready (size={driver_pool.size}, max_pages={driver_pool.max_pages})"
+    )
+    indexes = prepare_search_indexes()
+    print(f"[OK] Search indexes ready (title={indexes['title_index']}, spatial={indexes['spatial_index']})")
+    catalog = get_festival_catalog()
+    print(f"[OK] Festival catalog ready ({len(catalog.names)} festivals)")
+    job_manager.resume_unfinished()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """서버 종료 시 WebDriver 정리"""
-    global driver
-    if driver:
-        try:
-            driver.quit()
-            print("[OK] WebDriver closed")
-        except:
-            pass
+    """서버 종료 시 WebDriver 풀 정리"""
+    job_manager.shutdown()
+    driver_pool.close()
+    print("[OK] WebDriver pool closed")
 
 
 # Pydantic 모델
@@ -259,6 +252,33 @@ async def root():
     }
 
 
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """분석 캐시(메모리/디스크)와 블로그 본문, 글 단위 결과, 검색어 트렌드 저장소의 통계 반환"""
+    try:
+        return {
+            "memory": get_memory_cache().stats(),
+            "analysis": get_analysis_cache_backend().stats(),
+            "blog_contents": get_blog_content_store().stats(),
+            "post_results": get_post_result_store().stats(),
+            "trends": get_trend_store().stats(),
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/http/stats")
+async def get_http_stats():
+    """네이버 오픈 API 엔드포인트별 요청 수, 실패 수, 응답 시간 통계 반환"""
+    return {"naver_openapi": get_naver_http_client().stats()}
+
+
+@app.get("/api/db/stats")
+async def get_db_stats():
+    """축제 DB(tour_data.db) 연결 생성 수와 읽기 쿼리 수 반환"""
+    return get_connection_stats()
+
+
 @app.get("/api/config/categories")
 async def get_categories():
     """카테고리 1단계 목록 반환"""
@@ -296,6 +316,44 @@ async def get_festival_list(cat1: str, cat2: str, cat3: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/festivals/nearby")
+async def get_nearby_attractions(
+    festival_name: str = Query(..., description="Festival name"),
+    radius_km: float = Query(5.0, gt=0, le=100, description="Search radius in km"),
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of places"),
+    place_types: str = Query(
+        ",".join(ATTRACTION_TYPES),
+        description="Comma-separated place types: festival, culture_facility, travel_course",
+    ),
+):
+    """
+    축제 주변 장소(문화시설, 여행코스 등) 조회
+
+    Returns:
+        - festival: 기준 축제 정보 (좌표 포함)
+        - places: 가까운 순 장소 목록 (distance_km 포함)
+    """
+    types = [t.strip() for t in place_types.split(",") if t.strip()]
+    unknown = [t for t in types if t not in PLACE_TABLES]
+    if unknown or not types:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 장소 종류: {', '.join(unknown) or place_types}")
+
+    nearby = find_nearby_attractions(festival_name, radius_km, limit, types)
+    if nearby is None:
+        raise HTTPException(status_code=404, detail=f"'{festival_name}' 축제를 찾을 수 없습니다.")
+    return {"festival_name": festival_name, "radius_km": radius_km, **nearby}
+
+
+def _nearby_attractions_for_response(keyword: str) -> list:
+    """분석 응답에 붙일 축제 주변 관광지 목록. 축제를 찾지 못하거나 조회에 실패하면 빈 목록"""
+    try:
+        nearby = find_nearby_attractions(keyword)
+    except Exception as e:
+        print(f"[WARN] 주변 관광지 조회 실패 ({keyword}): {e}")
+        return []
+    return nearby["places"] if nearby else []
+
+
 @app.post("/api/analyze/keyword")
 async def analyze_keyword(request: KeywordAnalysisRequest):
     """
@@ -309,6 +367,7 @@ async def analyze_keyword(request: KeywordAnalysisRequest):
         - charts: 차트 데이터 (만족도, 이상치, 절대점수 등)
         - blog_results: 개별 블로그 분석 결과
         - seasonal_data: 계절별 데이터
+        - nearby_attractions: 축제 주변 문화시설/여행코스 (가까운 순)
     """
     try:
         print(f"📊 분석 시작: {request.keyword}, {request.num_reviews}개 리뷰")
@@ -342,10 +401,6 @@ async def analyze_category(request: CategoryAnalysisRequest):
 
     선택한 카테고리의 모든 축제를 분석하여 종합 결과 제공
     """
-    global driver
-    if not driver:
-        driver = create_driver()
-
     try:
         print(
             f"📊 카테고리 분석 시작: {request.cat1} > {request.cat2} > {request.cat3}"
@@ -362,7 +417,7 @@ async def analyze_category(request: CategoryAnalysisRequest):
             cat2=request.cat2,
             cat3=request.cat3,
             num_reviews=request.num_reviews,
-            driver=driver,
+            driver=driver_pool,
             log_details=True,
             progress=progress,
             initial_progress=0,
@@ -485,10 +540,6 @@ async def analyze_category_comparison(request: CategoryComparisonRequest):
 
     두 개의 카테고리를 동시에 분석하여 시간 절약
     """
-    global driver
-    if not driver:
-        driver = create_driver()
-
     try:
         category_a = f"{request.cat1_a} > {request.cat2_a} > {request.cat3_a}"
         category_b = f"{request.cat1_b} > {request.cat2_b} > {request.cat3_b}"
@@ -510,7 +561,7 @@ async def analyze_category_comparison(request: CategoryComparisonRequest):
                 cat2=request.cat2_a,
                 cat3=request.cat3_a,
                 num_reviews=request.num_reviews,
-                driver=driver,
+                driver=driver_pool,
                 log_details=True,
                 progress=progress,
                 initial_progress=0,
@@ -526,7 +577,7 @@ async def analyze_category_comparison(request: CategoryComparisonRequest):
                 cat2=request.cat2_b,
                 cat3=request.cat3_b,
                 num_reviews=request.num_reviews,
-                driver=driver,
+                driver=driver_pool,
                 log_details=True,
                 progress=progress,
                 initial_progress=0,
@@ -656,10 +707,6 @@ async def recommend_category_analysis(request: CategoryRecommendationRequest):
     """
     카테고리 분석 결과를 바탕으로 지역과 계절을 고려한 AI 추천 분석
     """
-    global driver
-    if not driver:
-        driver = create_driver()
-
     try:
         category = f"{request.cat1} > {request.cat2} > {request.cat3}"
         print(
@@ -678,7 +725,7 @@ async def recommend_category_analysis(request: CategoryRecommendationRequest):
             cat2=request.cat2,
             cat3=request.cat3,
             num_reviews=request.num_reviews,
-            driver=driver,
+            driver=driver_pool,
             log_details=True,
             progress=progress,
             initial_progress=0,
@@ -799,10 +846,6 @@ async def recommend_category_comparison_analysis(
     """
     카테고리 비교 분석 결과를 바탕으로 지역과 계절을 고려한 AI 비교 추천 분석 (병렬 처리)
     """
-    global driver
-    if not driver:
-        driver = create_driver()
-
     try:
         category_a = f"{request.cat1_a} > {request.cat2_a} > {request.cat3_a}"
         category_b = f"{request.cat1_b} > {request.cat2_b} > {request.cat3_b}"
@@ -826,7 +869,7 @@ async def recommend_category_comparison_analysis(
                 cat2=request.cat2_a,
                 cat3=request.cat3_a,
                 num_reviews=request.num_reviews,
-                driver=driver,
+                driver=driver_pool,
                 log_details=True,
                 progress=progress,
                 initial_progress=0,
@@ -842,7 +885,7 @@ async def recommend_category_comparison_analysis(
                 cat2=request.cat2_b,
                 cat3=request.cat3_b,
                 num_reviews=request.num_reviews,
-                driver=driver,
+                driver=driver_pool,
                 log_details=True,
                 progress=progress,
                 initial_progress=0,
@@ -1028,20 +1071,22 @@ async def get_festival_trend(
 class ProgressCallback:
     def __init__(self, queue: asyncio.Queue):
         self.queue = queue
-
-    def __call__(self, percent, desc=""):
+        # 분석 스레드에서 호출되므로, 생성 시점(요청 처리 중)의 이벤트 루프를 기억해 둡니다.
         try:
-            # 이벤트 루프가 실행 중인지 확인하고, 실행 중이면 큐에 작업을 넣습니다.
-            loop = asyncio.get_running_loop()
-            loop.call_soon_threadsafe(
-                self.queue.put_nowait,
-                {"type": "progress", "percent": percent, "message": desc},
-            )
+            self.loop = asyncio.get_running_loop()
         except RuntimeError:
+            self.loop = None
+
+    def __call__(self, percent, desc=""):
+        self.emit({"type": "progress", "percent": percent, "message": desc})
+
+    def emit(self, message: dict):
+        """진행률 외의 SSE 이벤트를 큐에 넣습니다. 어느 스레드에서 호출해도 됩니다."""
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, message)
+        else:
             # 이벤트 루프가 없는 경우 (예: 테스트 환경)
-            self.queue.put_nowait(
-                {"type": "progress", "percent": percent, "message": desc}
-            )
+            self.queue.put_nowait(message)
 
 
 async def run_analysis_in_thread(target_func, *args, **kwargs):
@@ -1100,6 +1145,7 @@ def format_single_keyword_response(results: dict, keyword: str) -> dict:
         "sentiment_score": results.get("total_sentiment_score", 0),
         "satisfaction_delta": results.get("satisfaction_delta", 0),
         "emotion_keyword_freq": results.get("emotion_keyword_freq", {}),
+        "nearby_attractions": _nearby_attractions_for_response(keyword),
     }
 
 
@@ -1152,23 +1198,19 @@ async def analyze_keyword_stream(request: KeywordAnalysisRequest):
     progress_callback = ProgressCallback(queue)
 
     async def analysis_generator():
-        global driver
-        if not driver:
-            driver = create_driver()
-
         yield format_sse_message(
             {"type": "progress", "percent": 0, "message": "분석 시작..."}
         )
 
+        # 같은 키워드 분석이 이미 실행 중이면 그 진행률과 결과를 함께 받습니다.
         analysis_task = asyncio.create_task(
             run_analysis_in_thread(
-                analyze_single_keyword_fully,
+                analyze_with_cache,
                 keyword=request.keyword,
                 num_reviews=request.num_reviews,
-                driver=driver,
                 log_details=request.log_details,
-                progress=progress_callback,
                 progress_desc="스트리밍 분석",
+                progress=progress_callback,
             )
         )
 
@@ -1185,9 +1227,7 @@ async def analyze_keyword_stream(request: KeywordAnalysisRequest):
         if "error" in results:
             yield format_sse_message({"type": "error", "message": results["error"]})
         else:
-            response = format_single_keyword_response(results, request.keyword)
-            save_analysis_to_cache(request.keyword, request.num_reviews, response)
-            yield format_sse_message({"type": "result", "data": response})
+            yield format_sse_message({"type": "result", "data": results})
 
     return StreamingResponse(analysis_generator(), media_type="text/event-stream")
 
@@ -1201,10 +1241,6 @@ async def analyze_comparison_stream(request: ComparisonRequest):
     progress_b = ProgressCallback(queue_b)
 
     async def analysis_generator():
-        global driver
-        if not driver:
-            driver = create_driver()
-
         yield format_sse_message(
             {"type": "progress", "percent": 0, "message": "비교 분석 시작..."}
         )
@@ -1264,52 +1300,72 @@ async def analyze_comparison_stream(request: ComparisonRequest):
 
 @app.post("/api/analyze/category/stream")
 async def analyze_category_stream(request: CategoryAnalysisRequest):
-    """카테고리별 축제 분석 (스트리밍)"""
+    """카테고리별 축제 분석 (스트리밍)
+
+    축제 하나의 분석이 끝날 때마다 해당 축제의 결과 행과 누적 집계를 담은
+    {"type": "festival_result", ...} 이벤트를 보내고, 마지막에 전체 결과를 보냅니다.
+    클라이언트 연결이 끊기면 아직 시작하지 않은 축제 분석은 취소합니다.
+    """
     queue = asyncio.Queue()
     progress_callback = ProgressCallback(queue)
+    cancel_event = threading.Event()
 
-    async def analysis_generator():
-        global driver
-        if not driver:
-            driver = create_driver()
-
-        yield format_sse_message(
-            {"type": "progress", "percent": 0, "message": "카테고리 분석 시작..."}
-        )
+    def on_festival_done(event: dict):
+        progress_callback.emit({"type": "festival_result", **event})
 
-        analysis_task = asyncio.create_task(
-            run_analysis_in_thread(
-                perform_category_analysis,
-                cat1=request.cat1,
-                cat2=request.cat2,
-                cat3=request.cat3,
-                num_reviews=request.num_reviews,
-                driver=driver,
-                log_details=True,
-                progress=progress_callback,
-                initial_progress=0,
-                total_steps=1,
+    async def analysis_generator():
+        analysis_task = None
+        try:
+            yield format_sse_message(
+                {"type": "progress", "percent": 0, "message": "카테고리 분석 시작..."}
             )
-        )
-
-        while not analysis_task.done():
-            try:
-                message = await asyncio.wait_for(queue.get(), timeout=0.1)
-                yield format_sse_message(message)
-            except asyncio.TimeoutError:
-                await asyncio.sleep(0.1)
-                continue
-
-        results = await analysis_task
 
-        if "error" in results:
-            yield format_sse_message({"type": "error", "message": results["error"]})
-        else:
-            # 2. --- `/api/analyze/category/stream` 호출 수정 ---
-            response = format_category_response(
-                results, request.cat1, request.cat2, request.cat3
+            analysis_task = asyncio.create_task(
+                run_analysis_in_thread(
+                    perform_category_analysis,
+                    cat1=request.cat1,
+                    cat2=request.cat2,
+                    cat3=request.cat3,
+                    num_reviews=request.num_reviews,
+                    driver=driver_pool,
+                    log_details=True,
+                    progress=progress_callback,
+                    initial_progress=0,
+                    total_steps=1,
+                    on_festival_done=on_festival_done,
+                    cancel_event=cancel_event,
+                )
             )
-            yield format_sse_message({"type": "result", "data": response})
+
+            while not analysis_task.done():
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=0.1)
+                    yield format_sse_message(message)
+                except asyncio.TimeoutError:
+                    await asyncio.sleep(0.1)
+                    continue
+
+            results = await analysis_task
+
+            # 분석 종료 직전에 들어온 축제 결과 이벤트를 마저 보냅니다.
+            while not queue.empty():
+                message = queue.get_nowait()
+                if message.get("type") == "festival_result":
+                    yield format_sse_message(message)
+
+            if "error" in results:
+                yield format_sse_message({"type": "error", "message": results["error"]})
+            else:
+                # 2. --- `/api/analyze/category/stream` 호출 수정 ---
+                response = format_category_response(
+                    results, request.cat1, request.cat2, request.cat3
+                )
+                yield format_sse_message({"type": "result", "data": response})
+        finally:
+            # 클라이언트가 연결을 끊어 스트림이 중간에 닫힌 경우 남은 분석을 취소합니다.
+            if analysis_task is not None and not analysis_task.done():
+                print(f"⏹️ 클라이언트 연결 종료로 카테고리 분석 취소 요청: {request.cat1} > {request.cat2} > {request.cat3}")
+                cancel_event.set()
 
     return StreamingResponse(analysis_generator(), media_type="text/event-stream")
 
@@ -1326,10 +1382,6 @@ async def analyze_category_comparison_stream(request: CategoryComparisonRequest)
     category_b_name = f"{request.cat1_b}>{request.cat2_b}>{request.cat3_b}"
 
     async def analysis_generator():
-        global driver
-        if not driver:
-            driver = create_driver()
-
         yield format_sse_message(
             {"type": "progress", "percent": 0, "message": "카테고리 비교 분석 시작..."}
         )
@@ -1341,7 +1393,7 @@ async def analyze_category_comparison_stream(request: CategoryComparisonRequest)
                 cat2=request.cat2_a,
                 cat3=request.cat3_a,
                 num_reviews=request.num_reviews,
-                driver=driver,
+                driver=driver_pool,
                 log_details=True,
                 progress=progress_a,
                 initial_progress=0,
@@ -1355,7 +1407,7 @@ async def analyze_category_comparison_stream(request: CategoryComparisonRequest)
                 cat2=request.cat2_b,
                 cat3=request.cat3_b,
                 num_reviews=request.num_reviews,
-                driver=driver,
+                driver=driver_pool,
                 log_details=True,
                 progress=progress_b,
                 initial_progress=0,
@@ -1443,6 +1495,114 @@ async def analyze_category_comparison_stream(request: CategoryComparisonRequest)
     return StreamingResponse(analysis_generator(), media_type="text/event-stream")
 
 
+# ==================== Background Jobs ====================
+
+
+def run_keyword_job(params: dict, progress) -> dict:
+    """키워드 분석 작업 실행 함수"""
+    return analyze_with_cache(
+        keyword=params["keyword"],
+        num_reviews=params["num_reviews"],
+        log_details=params.get("log_details", True),
+        progress_desc="백그라운드 분석",
+        progress=progress,
+    )
+
+
+def run_category_job(params: dict, progress) -> dict:
+    """카테고리 분석 작업 실행 함수"""
+    results = perform_category_analysis(
+        cat1=params["cat1"],
+        cat2=params["cat2"],
+        cat3=params["cat3"],
+        num_reviews=params["num_reviews"],
+        driver=driver_pool,
+        log_details=True,
+        progress=progress,
+        initial_progress=0,
+        total_steps=1,
+    )
+    if "error" in results:
+        return results
+    return format_category_response(
+        results, params["cat1"], params["cat2"], params["cat3"]
+    )
+
+
+job_manager.register("keyword", run_keyword_job)
+job_manager.register("category", run_category_job)
+
+
+def format_job_response(job: dict) -> dict:
+    """작업 정보를 API 응답 형식으로 변환합니다."""
+    return {
+        "job_id": job["job_id"],
+        "job_type": job["job_type"],
+        "params": job["params"],
+        "status": job["status"],
+        "progress": job["progress"],
+        "message": job["message"],
+        "error": job["error"],
+        "attempts": job["attempts"],
+        "created_at": job["created_at"],
+        "updated_at": job["updated_at"],
+        "finished_at": job["finished_at"],
+        "result": job["result"],
+    }
+
+
+@app.post("/api/jobs/keyword")
+async def create_keyword_job(request: KeywordAnalysisRequest):
+    """키워드 분석을 백그라운드 작업으로 등록하고 작업 ID 반환"""
+    job_id = job_manager.submit("keyword", request.dict())
+    return {"job_id": job_id, "status": "queued"}
+
+
+@app.post("/api/jobs/category")
+async def create_category_job(request: CategoryAnalysisRequest):
+    """카테고리 분석을 백그라운드 작업으로 등록하고 작업 ID 반환"""
+    job_id = job_manager.submit("category", request.dict())
+    return {"job_id": job_id, "status": "queued"}
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """작업 상태, 진행률, 결과 조회"""
+    job = await asyncio.to_thread(job_manager.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+    return format_job_response(job)
+
+
+@app.get("/api/jobs/{job_id}/stream")
+async def stream_job(job_id: str):
+    """작업 진행률과 결과를 SSE로 전달 (작업 진행 중에 연결이 끊겨도 작업은 계속 실행됨)"""
+    # SQLite 조회가 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+    if await asyncio.to_thread(job_manager.get, job_id) is None:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+
+    async def job_generator():
+        last_progress = None
+        while True:
+            job = await asyncio.to_thread(job_manager.get, job_id)
+            current = (job["progress"], job["message"])
+            if current != last_progress:
+                last_progress = current
+                yield format_sse_message(
+                    {"type": "progress", "percent": job["progress"], "message": job["message"]}
+                )
+            if job["status"] in FINISHED_STATUSES:
+                break
+            await asyncio.sleep(0.5)
+
+        if job["status"] == "succeeded":
+            yield format_sse_message({"type": "result", "data": job["result"]})
+        else:
+            yield format_sse_message({"type": "error", "message": job["error"]})
+
+    return StreamingResponse(job_generator(), media_type="text/event-stream")
+
+
 # 서버 실행
 if __name__ == "__main__":
     print("[START] GradioNaverSentiment API Server Starting...")
@@ -226,7 +226,21 @@ export interface ProgressEvent {
   message: string;
 }
 
+// 카테고리 스트리밍 중 축제 하나의 분석이 끝날 때마다 전달되는 이벤트
+export interface FestivalResultEvent {
+  festival: string;
+  index: number;
+  completed: number;
+  total_festivals: number;
+  row: Record<string, any>;
+  total_pos: number;
+  total_neg: number;
+  satisfaction_counts: Record<string, number>;
+  avg_satisfaction: number;
+}
+
 type ProgressCallback = (progress: ProgressEvent) => void;
+type FestivalResultCallback = (event: FestivalResultEvent) => void;
 type ResultCallback<T> = (result: T) => void;
 type ErrorCallback = (error: string) => void;
 
@@ -235,7 +249,8 @@ async function fetchStream<T>(
   body: any,
   onProgress: ProgressCallback,
   onResult: ResultCallback<T>,
-  onError: ErrorCallback
+  onError: ErrorCallback,
+  onFestivalResult?: FestivalResultCallback
 ) {
   try {
     const response = await fetch(`/api${url}`, {
@@ -269,6 +284,8 @@ async function fetchStream<T>(
               const parsed = JSON.parse(jsonString);
               if (parsed.type === 'progress') {
                 onProgress(parsed);
+              } else if (parsed.type === 'festival_result') {
+                onFestivalResult?.(parsed);
               } else if (parsed.type === 'result') {
                 onResult(parsed.data);
               } else if (parsed.type === 'error') {
@@ -319,14 +336,16 @@ export const analyzeCategoryStream = (
   numReviews: number,
   onProgress: ProgressCallback,
   onResult: ResultCallback<CategoryAnalysisResponse>,
-  onError: ErrorCallback
+  onError: ErrorCallback,
+  onFestivalResult?: FestivalResultCallback
 ) => {
   fetchStream(
     '/analyze/category/stream',
     { cat1, cat2, cat3, num_reviews: numReviews },
     onProgress,
     onResult,
-    onError
+    onError,
+    onFestivalResult
   );
 };
 
@@ -5,30 +5,49 @@
 네이버 트렌드 API를 호출하여 검색량 데이터를 수집하고
 festival_trends_summary.csv로 저장합니다.
 
+- 축제 기간이 가까운 축제를 최대 5개씩 묶어 데이터랩 요청 한 번으로 수집합니다.
+- 여러 작업자가 동시에 요청하되, 토큰 버킷으로 초당 요청 수(--qps)를 정확히 맞춥니다.
+- 결과는 받는 즉시 festival_trends_summary.csv에 한 줄씩 덧붙이므로 중간에 멈춰도 수집한 결과는 남고,
+  마지막에 한 번만 중복 제거와 정렬을 합니다.
+- 실패한 축제는 festival_trends_failures.csv에 따로 기록하고 --retry-failures로 다시 수집합니다.
+
 실행 방법:
-    python scripts/collect_all_trends.py
+    python scripts/collect_all_trends.py                      # 전체 수집
+    python scripts/collect_all_trends.py --resume             # 이미 수집한 축제는 건너뛰고 이어서 수집
+    python scripts/collect_all_trends.py --only-season 여름 --since 20240101
+    python scripts/collect_all_trends.py --retry-failures     # 실패 목록만 다시 수집
 
-주의: 네이버 API 쿼터 제한이 있으므로 시간이 오래 걸립니다 (약 1-2시간)
+주의: 네이버 데이터랩 API는 하루 호출 한도가 있으므로 --qps를 너무 높이지 마세요
 """
 
+import argparse
+import csv
 import os
 import sys
 import pandas as pd
 import datetime
-import time
-import random
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from tqdm import tqdm
 
 # 프로젝트 루트를 Python path에 추가
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, PROJECT_ROOT)
 
-from src.infrastructure.web.naver_trend_api import get_trend_data
+from src.infrastructure.web.naver_trend_api import get_trend_data_batch, DATALAB_MAX_KEYWORD_GROUPS
+from src.infrastructure.web.rate_limiter import TokenBucket
 from src.config import get_naver_trend_api_keys
 
 # 파일 경로
 CSV_PATH = os.path.join(PROJECT_ROOT, "database", "축제공연행사csv.CSV")
 OUTPUT_PATH = os.path.join(PROJECT_ROOT, "database", "festival_trends_summary.csv")
+FAILURES_PATH = os.path.join(PROJECT_ROOT, "database", "festival_trends_failures.csv")
+
+OUTPUT_COLUMNS = ['festival_name', 'event_start_date', 'event_end_date', 'season', 'max_ratio', 'mean_ratio', 'max_date', 'data_points']
+FAILURE_COLUMNS = ['festival_name', 'eventstartdate', 'eventenddate', 'reason', 'failed_at']
+SEASONS = ["봄", "여름", "가을", "겨울"]
+
+# 한 요청으로 묶을 축제들의 전체 조회 기간(일) 상한. 너무 길면 응답이 커지고 작은 값의 정밀도가 떨어집니다.
+MAX_BATCH_SPAN_DAYS = 120
 
 def classify_season(month: int) -> str:
     """월 정보를 기반으로 계절 분류"""
@@ -41,61 +60,182 @@ def classify_season(month: int) -> str:
     else:  # 12, 1, 2
         return "겨울"
 
-def collect_trend_for_festival(festival_name: str, start_date_str: str, end_date_str: str):
+def get_api_window(start_date_str, end_date_str):
     """
-    단일 축제의 트렌드 데이터를 수집하고 요약 통계를 반환
+    축제의 (시작일, 종료일, API 조회 시작일, API 조회 종료일)을 반환합니다.
+    조회 기간은 축제 시작 30일 전 ~ 종료 30일 후이며, 아직 시작하지 않은 축제는 None
+    """
+    start_date = datetime.datetime.strptime(str(int(start_date_str)), "%Y%m%d")
+    end_date = datetime.datetime.strptime(str(int(end_date_str)), "%Y%m%d")
+
+    # 오늘 날짜 이후의 축제는 스킵
+    if start_date.date() > datetime.date.today():
+        return None
+
+    api_start = start_date - datetime.timedelta(days=30)
+    api_end = min(end_date + datetime.timedelta(days=30), datetime.datetime.now())
+    return start_date, end_date, api_start.date(), api_end.date()
 
-    Args:
-        festival_name: 축제명
-        start_date_str: 행사 시작일 (YYYYMMDD)
-        end_date_str: 행사 종료일 (YYYYMMDD)
+def build_trend_batches(festivals: list) -> list:
+    """
+    (축제명, 시작일, 종료일, API 시작일, API 종료일) 목록을 조회 기간이 가까운 축제끼리 최대 5개씩 묶습니다.
+    묶음의 전체 조회 기간은 MAX_BATCH_SPAN_DAYS일을 넘지 않으며, 같은 이름의 축제는 한 묶음에 넣지 않습니다.
+    """
+    batches, current = [], []
+    for festival in sorted(festivals, key=lambda f: f[3]):
+        if current:
+            span_start = min(f[3] for f in current)
+            span_end = max(max(f[4] for f in current), festival[4])
+            if (len(current) >= DATALAB_MAX_KEYWORD_GROUPS
+                    or (span_end - span_start).days > MAX_BATCH_SPAN_DAYS
+                    or any(f[0] == festival[0] for f in current)):
+                batches.append(current)
+                current = []
+        current.append(festival)
+    if current:
+        batches.append(current)
+    return batches
+
+def summarize_trend(festival_name: str, start_date, end_date, df_trend: pd.DataFrame):
+    """
+    축제 조회 기간의 트렌드 데이터로 요약 통계를 계산합니다.
 
     Returns:
         dict: 요약 통계 (max_ratio, mean_ratio, max_date 등)
-              실패 시 None
+              데이터가 없으면 None
     """
-    try:
-        # 날짜 변환
-        start_date = datetime.datetime.strptime(str(int(start_date_str)), "%Y%m%d")
-        end_date = datetime.datetime.strptime(str(int(end_date_str)), "%Y%m%d")
-
-        # 오늘 날짜 이후의 축제는 스킵
-        today = datetime.date.today()
-        if start_date.date() > today:
-            return None
-
-        # API 호출 기간: 축제 시작 30일 전 ~ 종료 30일 후
-        api_start = start_date - datetime.timedelta(days=30)
-        api_end = min(end_date + datetime.timedelta(days=30), datetime.datetime.now())
-
-        # 네이버 트렌드 API 호출
-        df_trend = get_trend_data(festival_name, api_start.date(), api_end.date())
-
-        if df_trend.empty:
-            return None
-
-        # 통계 계산
-        max_ratio = float(df_trend['ratio'].max())
-        mean_ratio = float(df_trend['ratio'].mean())
-        max_date = df_trend.loc[df_trend['ratio'].idxmax(), 'period']
-
-        return {
-            'festival_name': festival_name,
-            'event_start_date': start_date.strftime("%Y-%m-%d"),
-            'event_end_date': end_date.strftime("%Y-%m-%d"),
-            'season': classify_season(start_date.month),
-            'max_ratio': round(max_ratio, 2),
-            'mean_ratio': round(mean_ratio, 2),
-            'max_date': max_date.strftime("%Y-%m-%d"),
-            'data_points': len(df_trend)
-        }
+    if df_trend.empty or df_trend['ratio'].max() <= 0:
+        return None
 
+    # 통계 계산
+    max_ratio = float(df_trend['ratio'].max())
+    mean_ratio = float(df_trend['ratio'].mean())
+    max_date = df_trend.loc[df_trend['ratio'].idxmax(), 'period']
+
+    return {
+        'festival_name': festival_name,
+        'event_start_date': start_date.strftime("%Y-%m-%d"),
+        'event_end_date': end_date.strftime("%Y-%m-%d"),
+        'season': classify_season(start_date.month),
+        'max_ratio': round(max_ratio, 2),
+        'mean_ratio': round(mean_ratio, 2),
+        'max_date': max_date.strftime("%Y-%m-%d"),
+        'data_points': len(df_trend)
+    }
+
+def collect_trend_batch(batch: list, rate_limiter: TokenBucket) -> list:
+    """
+    축제 묶음의 트렌드 데이터를 한 번의 요청으로 수집하고 축제별 (축제, 요약 통계, 실패 사유) 목록을 반환합니다.
+    성공하면 실패 사유가 None, 실패하면 요약 통계가 None입니다.
+
+    묶음 전체 기간으로 요청한 뒤 축제마다 자신의 조회 기간만 잘라 최댓값이 100이 되도록 다시 정규화하므로,
+    축제 하나씩 자신의 기간으로 요청한 결과와 같은 기준의 값이 됩니다.
+    값이 모두 0으로 내려가 따로 다시 요청하는 축제가 있어도 HTTP 요청마다 rate_limiter 토큰을 하나씩 사용합니다.
+    """
+    span_start = min(f[3] for f in batch)
+    span_end = max(f[4] for f in batch)
+    try:
+        trends = get_trend_data_batch([f[0] for f in batch], span_start, span_end, before_request=rate_limiter.acquire)
     except Exception as e:
-        print(f"❌ {festival_name} 처리 중 오류: {e}")
-        return None
+        tqdm.write(f"❌ {', '.join(f[0] for f in batch)} 처리 중 오류: {e}")
+        return [(festival, None, "error") for festival in batch]
+
+    results = []
+    for festival in batch:
+        festival_name, start_date, end_date, api_start, api_end = festival
+        if festival_name not in trends:
+            results.append((festival, None, "request_failed"))
+            continue
+        df_trend = trends[festival_name]
+        if not df_trend.empty:
+            in_window = (df_trend['period'].dt.date >= api_start) & (df_trend['period'].dt.date <= api_end)
+            df_trend = df_trend[in_window].reset_index(drop=True)
+            if not df_trend.empty and df_trend['ratio'].max() > 0:
+                df_trend['ratio'] = df_trend['ratio'] / df_trend['ratio'].max() * 100
+        summary = summarize_trend(festival_name, start_date, end_date, df_trend)
+        results.append((festival, summary, None if summary else "no_data"))
+    return results
+
+def append_rows(path: str, columns: list, rows: list):
+    """CSV 파일에 행을 덧붙입니다. 파일이 없으면 헤더를 먼저 씁니다."""
+    if not rows:
+        return
+    is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, 'a', newline='', encoding='utf-8-sig' if is_new else 'utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+        if is_new:
+            writer.writeheader()
+        writer.writerows(rows)
+        f.flush()
+
+def load_targets(args) -> pd.DataFrame:
+    """수집 대상 축제(title, eventstartdate, eventenddate)를 불러옵니다. --retry-failures면 실패 목록을 사용합니다."""
+    if args.retry_failures:
+        if not os.path.exists(FAILURES_PATH):
+            return pd.DataFrame(columns=['title', 'eventstartdate', 'eventenddate'])
+        failures = pd.read_csv(FAILURES_PATH)
+        failures = failures.drop_duplicates(subset=['festival_name', 'eventstartdate'], keep='last')
+        return failures.rename(columns={'festival_name': 'title'})[['title', 'eventstartdate', 'eventenddate']]
+
+    df_festivals = pd.read_csv(CSV_PATH, encoding='cp949', usecols=['title', 'eventstartdate', 'eventenddate'])
+    return df_festivals.dropna(subset=['eventstartdate', 'eventenddate'])
+
+def select_festivals(df_festivals: pd.DataFrame, args, collected: set):
+    """
+    조회 기간을 계산하고 필터(--only-season, --since, --resume/--retry-failures)를 적용한
+    (축제명, 시작일, 종료일, API 시작일, API 종료일) 목록과 날짜 오류 행(실패 기록용)을 반환합니다.
+    """
+    since = datetime.datetime.strptime(args.since, "%Y%m%d") if args.since else None
+    festivals, invalid_rows = [], []
+    for title, start_str, end_str in df_festivals[['title', 'eventstartdate', 'eventenddate']].itertuples(index=False):
+        if (args.resume or args.retry_failures) and title in collected:
+            continue
+        try:
+            window = get_api_window(start_str, end_str)
+        except (TypeError, ValueError):
+            invalid_rows.append({'festival_name': title, 'eventstartdate': start_str, 'eventenddate': end_str, 'reason': "invalid_date"})
+            continue
+        if window is None:
+            continue  # 아직 시작하지 않은 축제
+        start_date = window[0]
+        if args.only_season and classify_season(start_date.month) != args.only_season:
+            continue
+        if since and start_date < since:
+            continue
+        festivals.append((title, *window))
+    return festivals, invalid_rows
+
+def compact_output():
+    """덧붙여 쓴 결과 파일에서 축제별 마지막 결과만 남기고 max_ratio 순으로 정렬해 다시 씁니다."""
+    final_df = pd.read_csv(OUTPUT_PATH)
+    final_df = final_df.drop_duplicates(subset=['festival_name'], keep='last')
+    final_df = final_df.sort_values('max_ratio', ascending=False).reset_index(drop=True)
+    temp_path = OUTPUT_PATH + ".tmp"
+    final_df.to_csv(temp_path, index=False, encoding='utf-8-sig')
+    os.replace(temp_path, OUTPUT_PATH)
+    return final_df
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="축제별 네이버 트렌드 데이터 수집")
+    parser.add_argument("--resume", action="store_true", help="이미 수집한 축제는 건너뛰고 실패 기록을 이어서 씁니다")
+    parser.add_argument("--only-season", choices=SEASONS, help="축제 시작 월 기준 해당 계절의 축제만 수집")
+    parser.add_argument("--since", help="이 날짜(YYYYMMDD) 이후에 시작한 축제만 수집")
+    parser.add_argument("--retry-failures", action="store_true", help=f"{os.path.basename(FAILURES_PATH)}의 축제만 다시 수집")
+    parser.add_argument("--qps", type=float, default=2.0, help="초당 데이터랩 요청 수 (기본 2)")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 요청하는 작업자 수 (기본 4)")
+    args = parser.parse_args()
+    if args.since:
+        try:
+            datetime.datetime.strptime(args.since, "%Y%m%d")
+        except ValueError:
+            parser.error("--since는 YYYYMMDD 형식이어야 합니다.")
+    if args.qps <= 0 or args.workers < 1:
+        parser.error("--qps는 0보다 크고 --workers는 1 이상이어야 합니다.")
+    return args
 
 def main():
     """메인 실행 함수"""
+    args = parse_args()
     print("=" * 60)
     print("🎪 축제별 네이버 트렌드 데이터 수집 시작")
     print("=" * 60)
@@ -109,95 +249,86 @@ def main():
         print("config.py 또는 환경변수에서 API 키를 설정해주세요.")
         return
 
-    # CSV 파일 로드
-    print(f"\n📂 축제 데이터 로드 중: {CSV_PATH}")
+    # 수집 대상 로드
+    print(f"\n📂 축제 데이터 로드 중: {FAILURES_PATH if args.retry_failures else CSV_PATH}")
     try:
-        df_festivals = pd.read_csv(CSV_PATH, encoding='cp949')
+        df_festivals = load_targets(args)
         print(f"✅ 총 {len(df_festivals)}개 축제 로드 완료")
     except Exception as e:
         print(f"❌ CSV 파일 로드 실패: {e}")
         return
 
-    # 필요한 컬럼만 추출
-    df_festivals = df_festivals[['title', 'eventstartdate', 'eventenddate']].copy()
-    df_festivals = df_festivals.dropna(subset=['eventstartdate', 'eventenddate'])
-
-    print(f"✅ 유효한 축제 {len(df_festivals)}개 필터링 완료")
-
-    # 기존 데이터 확인 (이어서 수집)
+    # 기존 데이터 확인 (--resume이면 이어서 수집)
+    collected = set()
     if os.path.exists(OUTPUT_PATH):
-        existing_df = pd.read_csv(OUTPUT_PATH)
-        existing_festivals = set(existing_df['festival_name'].tolist())
-        print(f"\n📊 기존 수집 데이터 발견: {len(existing_festivals)}개")
-
-        # 아직 수집하지 않은 축제만 필터링
-        df_festivals = df_festivals[~df_festivals['title'].isin(existing_festivals)]
-        print(f"✅ 남은 수집 대상: {len(df_festivals)}개")
-
-        if len(df_festivals) == 0:
-            print("✅ 모든 축제 데이터가 이미 수집되었습니다!")
-            return
-    else:
-        existing_df = None
+        collected = set(pd.read_csv(OUTPUT_PATH, usecols=['festival_name'])['festival_name'])
+        print(f"\n📊 기존 수집 데이터 발견: {len(collected)}개" + ("" if args.resume else " (--resume 없이 실행하면 다시 수집합니다)"))
+
+    festivals, invalid_rows = select_festivals(df_festivals, args, collected)
+    batches = build_trend_batches(festivals)
+    print(f"✅ 남은 수집 대상: {len(festivals)}개 (요청 {len(batches)}회)")
+
+    # 실패 기록도 덧붙여 쓰며, 처음부터 다시 수집할 때(--resume, --retry-failures 없이)만 새로 시작합니다.
+    # 재시도할 때는 이미 수집에 성공한 축제를 실패 목록에서 제외하고 불러옵니다.
+    if not (args.resume or args.retry_failures) and os.path.exists(FAILURES_PATH):
+        os.remove(FAILURES_PATH)
+    now = datetime.datetime.now().isoformat(timespec='seconds')
+    append_rows(FAILURES_PATH, FAILURE_COLUMNS, [{**row, 'failed_at': now} for row in invalid_rows])
+
+    if not batches:
+        print("✅ 수집할 축제가 없습니다!")
+        return
 
     # 트렌드 데이터 수집
-    results = []
-    failed_count = 0
+    success_count, failed_count = 0, len(invalid_rows)
+    rate_limiter = TokenBucket(args.qps, burst=1)
 
-    print(f"\n🚀 트렌드 데이터 수집 시작...")
-    print(f"⏱️  예상 소요 시간: 약 {len(df_festivals) * 1.5 / 60:.1f}분")
+    print(f"\n🚀 트렌드 데이터 수집 시작... (작업자 {args.workers}개, 초당 {args.qps}회 요청)")
+    print(f"⏱️  예상 소요 시간: 약 {len(batches) / args.qps / 60:.1f}분 이상 (값이 0인 축제는 따로 다시 요청)")
     print("=" * 60)
 
-    for idx, row in tqdm(df_festivals.iterrows(), total=len(df_festivals), desc="수집 진행"):
-        festival_name = row['title']
-        start_date = row['eventstartdate']
-        end_date = row['eventenddate']
-
-        # 트렌드 데이터 수집
-        result = collect_trend_for_festival(festival_name, start_date, end_date)
-
-        if result:
-            results.append(result)
-
-            # 진행 상황 출력 (10개마다)
-            if len(results) % 10 == 0:
-                tqdm.write(f"✅ 진행: {len(results)}개 수집 완료, {failed_count}개 실패")
-        else:
-            failed_count += 1
-
-        # API Rate Limiting (1.2초 대기)
-        time.sleep(1.2 + random.uniform(0, 0.3))
-
-        # 중간 저장 (100개마다)
-        if len(results) % 100 == 0 and len(results) > 0:
-            temp_df = pd.DataFrame(results)
-            if existing_df is not None:
-                temp_df = pd.concat([existing_df, temp_df], ignore_index=True)
-            temp_df.to_csv(OUTPUT_PATH, index=False, encoding='utf-8-sig')
-            tqdm.write(f"💾 중간 저장 완료: {len(temp_df)}개")
+    # 결과 파일 쓰기는 메인 스레드에서만 하고, 작업자에게는 처리 중인 요청의 두 배까지만 미리 넘깁니다.
+    remaining = iter(batches)
+    with ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix="trend-collector") as executor, \
+            tqdm(total=len(festivals), desc="수집 진행") as progress_bar:
+        pending = set()
+        while True:
+            for batch in remaining:
+                pending.add(executor.submit(collect_trend_batch, batch, rate_limiter))
+                if len(pending) >= args.workers * 2:
+                    break
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results = future.result()
+                now = datetime.datetime.now().isoformat(timespec='seconds')
+                append_rows(OUTPUT_PATH, OUTPUT_COLUMNS, [summary for _, summary, _ in results if summary])
+                append_rows(FAILURES_PATH, FAILURE_COLUMNS, [
+                    {
+                        'festival_name': festival[0],
+                        'eventstartdate': festival[1].strftime("%Y%m%d"),
+                        'eventenddate': festival[2].strftime("%Y%m%d"),
+                        'reason': reason,
+                        'failed_at': now,
+                    }
+                    for festival, summary, reason in results if not summary
+                ])
+                batch_success = sum(1 for _, summary, _ in results if summary)
+                success_count += batch_success
+                failed_count += len(results) - batch_success
+                progress_bar.update(len(results))
+                progress_bar.set_postfix(success=success_count, failed=failed_count)
 
     print("\n" + "=" * 60)
     print(f"✅ 수집 완료!")
-    print(f"   - 성공: {len(results)}개")
-    print(f"   - 실패: {failed_count}개")
+    print(f"   - 성공: {success_count}개")
+    print(f"   - 실패: {failed_count}개" + (f" (기록: {FAILURES_PATH})" if failed_count else ""))
     print("=" * 60)
 
-    # 최종 데이터프레임 생성
-    if len(results) > 0:
-        new_df = pd.DataFrame(results)
-
-        # 기존 데이터와 병합
-        if existing_df is not None:
-            final_df = pd.concat([existing_df, new_df], ignore_index=True)
-        else:
-            final_df = new_df
-
-        # 중복 제거 및 정렬
-        final_df = final_df.drop_duplicates(subset=['festival_name'], keep='last')
-        final_df = final_df.sort_values('max_ratio', ascending=False).reset_index(drop=True)
-
-        # CSV 저장
-        final_df.to_csv(OUTPUT_PATH, index=False, encoding='utf-8-sig')
+    # 최종 데이터프레임 생성 (중복 제거 및 정렬)
+    if os.path.exists(OUTPUT_PATH):
+        final_df = compact_output()
 
         print(f"\n📂 저장 완료: {OUTPUT_PATH}")
         print(f"   - 총 축제 수: {len(final_df)}개")
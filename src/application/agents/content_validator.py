@@ -1,3 +1,5 @@
+import json
+import re
 from src.domain.state import LLMGraphState
 from src.infrastructure.llm_client import get_llm_client
 
@@ -10,6 +12,13 @@ def agent_content_validator(state: LLMGraphState):
     keyword = state["keyword"]
     title = state["title"]
     text = state["original_text"]
+
+    # 일괄 검증(validate_candidates_batch)에서 이미 관련 글로 판별된 경우 개별 검증을 생략합니다.
+    if state.get("pre_validated"):
+        if state["log_details"]:
+            print(f"   [검증 생략] 일괄 검증에서 '{keyword}' 관련글로 판별되었습니다.")
+        return {"is_relevant": True}
+
     llm = get_llm_client()
 
     try:
@@ -41,4 +50,64 @@ def agent_content_validator(state: LLMGraphState):
 
     except Exception as e:
         print(f"LLM 내용 검증 중 오류 발생: {e}")
-        return {"is_relevant": False}  # 오류 발생 시 관련 없는 것으로 처리
+        return {"is_relevant": False, "llm_error": True}  # 오류 발생 시 관련 없는 것으로 처리
+
+
+def validate_candidates_batch(keyword: str, candidates: list[dict], log_details: bool = False) -> list:
+    """
+    여러 후보 블로그의 (제목, 발췌문)을 한 번의 LLM 요청으로 검증합니다.
+
+    Args:
+        keyword: 검색 키워드
+        candidates: {"title": ..., "excerpt": ...} 형태의 후보 목록
+        log_details: 상세 로그 출력 여부
+
+    Returns:
+        후보 순서대로 True(관련 있음) / False(관련 없음) / None(판별 실패) 목록.
+        응답을 해석하지 못하면 모든 후보가 None이므로, 호출 측은 개별 검증으로 넘기면 됩니다.
+    """
+    if not candidates:
+        return []
+    if log_details:
+        print(f"\n--- [Agent 0: Content Validator] 후보 {len(candidates)}개 일괄 검증 시작: {keyword} ---")
+
+    items = "\n".join(
+        f"{i}. 제목: {c.get('title', '')}\n   발췌: {(c.get('excerpt') or '')[:300]}"
+        for i, c in enumerate(candidates)
+    )
+    prompt = f"""당신은 블로그 게시물의 주제를 정확하게 판별하는 전문가입니다. 사용자는 '{keyword}'에 대한 '진짜 후기'를 찾고 있습니다. 아래의 조건에 따라 각 블로그의 제목과 발췌문이 검색 의도에 부합하는지 판별해주세요.
+
+[판별 조건]
+1. **주제 일치:** 게시물의 '주된 내용'이 '{keyword}'에 대한 경험이나 후기여야 합니다. 단순히 언급만 되거나 부수적인 내용이면 안 됩니다.
+2. **유사 행사 제외:** '{keyword}'와 이름이 비슷한 다른 행사(예: '세계 {keyword}')에 대한 후기는 아닌지 확인해야 합니다.
+3. **다른 주제 제외:** 게시물의 주된 내용이 '{keyword}'가 아닌, 특정 장소(카페, 식당), 제품, 서비스 등에 대한 비교나 추천이 아닌지 확인해야 합니다. (예: '{keyword} 기념 카페 A, B 비교 후기')
+
+[판별할 블로그 목록]
+{items}
+
+[출력]
+각 블로그에 대해 번호(index)와 판별 결과(relevant)를 담은 JSON 배열만 출력해주세요. 다른 설명은 절대 추가하지 마세요.
+예시: [{{"index": 0, "relevant": true}}, {{"index": 1, "relevant": false}}]"""
+
+    verdicts = [None] * len(candidates)
+    try:
+        llm = get_llm_client()
+        response = llm.invoke(prompt)
+        answer = response.content.strip()
+        match = re.search(r"\[.*\]", answer, re.DOTALL)
+        if not match:
+            print(f"LLM 일괄 검증 응답 형식 오류: {answer[:200]}")
+            return verdicts
+        for item in json.loads(match.group(0)):
+            index = item.get("index") if isinstance(item, dict) else None
+            if isinstance(index, int) and 0 <= index < len(candidates) and isinstance(item.get("relevant"), bool):
+                verdicts[index] = item["relevant"]
+    except Exception as e:
+        print(f"LLM 일괄 검증 중 오류 발생: {e}")
+        return [None] * len(candidates)
+
+    if log_details:
+        accepted = sum(1 for v in verdicts if v is True)
+        rejected = sum(1 for v in verdicts if v is False)
+        print(f"   [일괄 검증] 관련 {accepted}개, 무관 {rejected}개, 판별 실패 {len(candidates) - accepted - rejected}개")
+    return verdicts
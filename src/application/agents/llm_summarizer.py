@@ -59,6 +59,7 @@ def agent_llm_summarizer(state: LLMGraphState):
 
     summary = ""
     aspect_pairs = []
+    llm_error = False
     try:
         response = llm.invoke(user_prompt)
         raw_content = response.content.strip()
@@ -88,6 +89,7 @@ def agent_llm_summarizer(state: LLMGraphState):
         # 오류 발생 시 빈 결과 반환
         summary = state.get("llm_summary", "") # 이전 요약이라도 유지
         aspect_pairs = state.get("aspect_sentiment_pairs", [])
+        llm_error = True
 
     if state["log_details"]:
         print("--- LLM 핵심 경험 요약 결과 ---")
@@ -97,4 +99,4 @@ def agent_llm_summarizer(state: LLMGraphState):
         print(aspect_pairs if aspect_pairs else "[추출된 쌍이 없습니다]")
         print("--------------------------------")
 
-    return {"llm_summary": summary, "aspect_sentiment_pairs": aspect_pairs, "feedback_message": None}
+    return {"llm_summary": summary, "aspect_sentiment_pairs": aspect_pairs, "feedback_message": None, "llm_error": llm_error}
@@ -0,0 +1,92 @@
+import re
+from src.domain.state import LLMGraphState
+from src.config import get_prefilter_enabled, get_prefilter_threshold
+
+# 협찬/광고성 글에 자주 등장하는 표현
+AD_MARKERS = ["협찬", "원고료", "소정의", "제공받아", "제공 받아", "지원받아", "지원 받아", "업체로부터", "광고 포스팅", "유료광고", "파트너스 활동"]
+MIN_CONTENT_LENGTH = 200
+SHORT_CONTENT_LENGTH = 500
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", "", text or "").lower()
+
+
+def _strip_edition(keyword: str) -> str:
+    """'제17회', '2025' 같은 회차/연도 표기는 글마다 쓰거나 빼므로 키워드 비교에서 제외합니다."""
+    return re.sub(r"제?\d+회|\d{4}년?", "", keyword)
+
+
+def _bigrams(text: str) -> set:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _coverage(keyword_bigrams: set, text_bigrams: set) -> float:
+    """키워드 bigram 중 text에 들어 있는 비율 (띄어쓰기, 일부만 쓴 축제 이름도 부분 점수를 받습니다)"""
+    if not keyword_bigrams:
+        return 0.0
+    return len(keyword_bigrams & text_bigrams) / len(keyword_bigrams)
+
+
+def score_relevance(keyword: str, title: str, text: str) -> tuple[float, str | None]:
+    """
+    키워드와 제목/본문의 어휘 겹침(bigram), 광고 표현, 길이로 관련성 점수를 계산합니다.
+
+    모든 규칙은 점수에만 반영되며, 제외 여부는 호출 측이 PREFILTER_THRESHOLD와 비교해 정합니다.
+    공식 축제 이름과 다르게 쓴 글("부산 록 페스티벌" ↔ "제17회 부산국제록페스티벌")도 겹치는 만큼 점수를 받습니다.
+
+    Returns:
+        (점수, 가장 크게 감점된 사유 또는 None)
+    """
+    norm_keyword = _normalize(_strip_edition(keyword)) or _normalize(keyword)
+    norm_title = _normalize(title)
+    norm_text = _normalize(text)
+    keyword_bigrams = _bigrams(norm_keyword)
+
+    title_coverage = _coverage(keyword_bigrams, _bigrams(norm_title))
+    text_coverage = _coverage(keyword_bigrams, _bigrams(norm_text))
+
+    score = 0.4 * title_coverage + 0.3 * text_coverage
+    if norm_keyword and norm_keyword in norm_text:
+        score += min(norm_text.count(norm_keyword), 5) * 0.04
+
+    reason = None
+    if max(title_coverage, text_coverage) < 0.5:
+        reason = "제목과 본문에 키워드가 거의 없음"
+
+    ad_hits = [marker for marker in AD_MARKERS if _normalize(marker) in norm_text]
+    if ad_hits:
+        score -= 0.4
+        reason = f"광고 표현 ({ad_hits[0]})"
+
+    if len(norm_text) < SHORT_CONTENT_LENGTH:
+        score -= 0.15
+
+    # 검증 프롬프트가 경고하는 '세계 {keyword}' 같은 유사 행사
+    if not norm_keyword.startswith("세계") and f"세계{norm_keyword}" in norm_title:
+        score -= 0.5
+        reason = f"유사 행사 제목 ('세계 {keyword}')"
+
+    if len(norm_text) < MIN_CONTENT_LENGTH:
+        score -= 0.5
+        reason = f"본문이 너무 짧음 ({len(norm_text)}자)"
+
+    return score, reason
+
+
+def agent_relevance_prefilter(state: LLMGraphState):
+    """LLM 관련성 검증 전에 규칙 기반으로 명백히 무관한 글을 걸러냅니다. (PREFILTER_ENABLED=true일 때만)"""
+    if not get_prefilter_enabled():
+        return {"prefilter_rejected": False}
+
+    keyword = state["keyword"]
+    threshold = get_prefilter_threshold()
+    score, reason = score_relevance(keyword, state["title"], state["original_text"])
+
+    if score >= threshold:
+        return {"prefilter_score": score, "prefilter_rejected": False}
+
+    if state["log_details"]:
+        print(f"\n--- [Relevance Prefilter] 사전 제외: {state['title']} ---")
+        print(f"   [사전 제외] 점수 {score:.2f} < 기준 {threshold:.2f}" + (f" ({reason})" if reason else ""))
+    return {"prefilter_score": score, "prefilter_rejected": True, "is_relevant": False}
@@ -9,21 +9,36 @@ import matplotlib
 matplotlib.use('Agg') # For non-GUI environments
 import matplotlib.pyplot as plt
 import uuid
+import functools
+import threading
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 from ..data import festival_loader
 from .utils import (
     get_season, summarize_negative_feedback, calculate_trend_metrics,
     generate_overall_summary, load_cached_analysis, save_analysis_to_cache,
     load_raw_cached_analysis, save_raw_analysis_to_cache,
-    load_category_cached_analysis, save_category_analysis_to_cache
+    load_category_cached_analysis, save_category_analysis_to_cache,
+    get_category_cache_key
 )
-from ..application.graph import app_llm_graph
-from ..infrastructure.web.naver_api import search_naver_blog_page
-from ..infrastructure.web.scraper import scrape_blog_content
-from ..infrastructure.web.naver_trend_api import create_trend_graph, create_focused_trend_graph
-from ..infrastructure.web.tour_api_client import get_festival_period
+from ..application.graph import app_llm_graph, LLM_PIPELINE_VERSION
+from ..infrastructure.web.naver_api import iter_naver_blog_pages
+from ..infrastructure.web.scraper import scrape_blog_content, fetch_blog_content_http
+from ..infrastructure.web.driver_pool import WebDriverPool
+from ..infrastructure.cache.blog_content_store import get_blog_content_store
+from ..infrastructure.cache.post_result_store import get_post_result_store, compute_pipeline_version
+from ..infrastructure.cache.category_checkpoint_store import get_category_checkpoint_store
+from ..infrastructure.web.naver_trend_api import (
+    create_trend_graph, create_focused_trend_graph, hint_trend_keywords, get_trend_history_window
+)
+from ..infrastructure.web.tour_api_client import get_festival_details, get_festival_details_bulk
 from ..infrastructure.reporting.wordclouds import create_sentiment_wordclouds
 from collections import Counter
 from src.domain.knowledge_base import knowledge_base
+from src.application.agents.content_validator import validate_candidates_batch
+from src.config import get_analysis_max_workers, get_batch_validation_size, get_group_analysis_max_workers
 
 # 계절 영문 매핑
 SEASON_EN_MAP = {
@@ -33,14 +48,156 @@ SEASON_EN_MAP = {
     "겨울": "winter"
 }
 
-def analyze_single_keyword_fully(keyword: str, num_reviews: int, driver, log_details: bool, progress: gr.Progress, progress_desc: str):
+# 단일 WebDriver는 프레임 전환 상태를 공유하므로 프로세스 전체에서 한 번에 한 스레드만 사용합니다.
+_single_driver_lock = threading.Lock()
+
+def _is_valid_content(content) -> bool:
+    return bool(content) and "오류" not in content and "찾을 수 없습니다" not in content
+
+def _fetch_candidate(driver, url: str, driver_lock) -> str:
+    """
+    먼저 브라우저 없이 HTTP로 본문을 가져오고, 실패한 경우에만 Selenium을 사용합니다.
+    driver가 WebDriverPool이면 드라이버를 빌려서 크롤링하고,
+    단일 WebDriver이면 한 번에 한 스레드만 사용하도록 잠금을 잡고 크롤링합니다.
+    """
+    content = fetch_blog_content_http(url)
+    if content:
+        return content
+    if isinstance(driver, WebDriverPool):
+        with driver.lease() as pooled_driver:
+            return scrape_blog_content(pooled_driver, url, fast_path=False)
+    with driver_lock:
+        return scrape_blog_content(driver, url, fast_path=False)
+
+def _scrape_candidate(driver, url: str, driver_lock) -> str:
+    """저장된 본문이 있으면 네트워크 요청 없이 반환하고, 없으면 크롤링한 뒤 저장합니다."""
+    store = get_blog_content_store()
+    content = store.get(url)
+    if content:
+        return content
+    content = _fetch_candidate(driver, url, driver_lock)
+    if _is_valid_content(content):
+        store.put(url, content)
+    return content
+
+def _evaluate_candidate(blog_data: dict, keyword: str, driver, driver_lock, log_details: bool):
+    """후보 블로그 하나를 크롤링하고 LLM 그래프로 평가합니다.
+
+    Returns:
+        (content, final_state) 튜플. 크롤링에 실패하거나 일괄 검증에서 제외된 후보는 (None, None)을 반환합니다.
+    """
+    if blog_data.get("batch_rejected"):
+        return None, None
+    pre_validated = bool(blog_data.get("pre_validated"))
+    try:
+        content = _scrape_candidate(driver, blog_data["link"], driver_lock)
+        if not _is_valid_content(content):
+            return None, None
+
+        max_content_length = 30000
+        if len(content) > max_content_length:
+            content = content[:max_content_length] + "... (내용 일부 생략)"
+
+        # 같은 키워드로 이미 평가한 글(본문 동일)은 저장된 결과를 재사용합니다.
+        result_store = get_post_result_store()
+        pipeline_version = compute_pipeline_version(LLM_PIPELINE_VERSION, knowledge_base.dic_path)
+        if pre_validated:
+            pipeline_version += "+batch"
+        final_state = result_store.get(keyword, blog_data["link"], content, pipeline_version)
+        if final_state is not None:
+            if log_details:
+                print(f"   [결과 재사용] 저장된 분석 결과를 사용합니다: {blog_data['title']}")
+            return content, final_state
+
+        final_state = app_llm_graph.invoke({
+            "original_text": content, "keyword": keyword, "title": blog_data["title"],
+            "log_details": log_details, "re_summarize_count": 0, "is_relevant": False,
+            "pre_validated": pre_validated
+        })
+        # 사전 필터 제외 결과는 다시 계산해도 비용이 들지 않으므로 저장하지 않습니다.
+        if final_state and not final_state.get("llm_error") and not final_state.get("prefilter_rejected"):
+            result_store.put(keyword, blog_data["link"], content, pipeline_version, final_state)
+        return content, final_state
+    except Exception as e:
+        print(f"블로그 분석 중 오류 ({keyword}, {blog_data.get('link', 'N/A')}): {e}")
+        traceback.print_exc()
+        return None, None
+
+def _prefilter_candidates(candidate_blogs, keyword: str, batch_size: int, log_details: bool):
+    """
+    후보를 batch_size개씩 묶어 제목과 검색 결과 발췌문(description)으로 일괄 검증하며 순서대로 생성합니다.
+
+    다음 묶음은 소비 측이 필요로 할 때 검증하므로, 분석이 일찍 끝나면 남은 후보는 검증하지 않습니다.
+    관련 있다고 판별된 후보에는 pre_validated, 관련 없다고 판별된 후보에는 batch_rejected 표시를 붙입니다.
+    제외된 후보도 그대로 생성해 연속 실패 집계가 기존과 같게 유지됩니다.
+    """
+    candidates = iter(candidate_blogs)
+    while True:
+        batch = list(islice(candidates, batch_size))
+        if not batch:
+            return
+        verdicts = validate_candidates_batch(keyword, [
+            {"title": b["title"], "excerpt": re.sub(r'<[^>]+>', '', b.get("description", ""))}
+            for b in batch
+        ], log_details=log_details)
+        for blog_data, verdict in zip(batch, verdicts):
+            if verdict is True:
+                blog_data = {**blog_data, "pre_validated": True}
+            elif verdict is False:
+                blog_data = {**blog_data, "batch_rejected": True}
+            yield blog_data
+
+def _iter_candidate_evaluations(candidate_blogs, evaluate, max_workers: int):
+    """후보 블로그를 후보 순서대로 (blog_data, get_result) 형태로 생성합니다.
+
+    get_result()는 해당 후보의 (content, final_state)를 반환합니다.
+    max_workers가 1이면 get_result() 호출 시점에 평가하므로 기존 순차 처리와 동일하게 동작하고,
+    2 이상이면 최대 max_workers개의 후보를 미리 병렬로 평가합니다. 어느 경우든 결과는 후보 순서대로
+    소비되므로 집계 결과가 같으며, 소비 측이 순회를 멈추면 아직 시작되지 않은 작업은 취소됩니다.
+    """
+    if max_workers <= 1:
+        for blog_data in candidate_blogs:
+            yield blog_data, functools.partial(evaluate, blog_data)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="blog-eval")
+    candidates = iter(candidate_blogs)
+    pending = deque()
+    try:
+        for blog_data in candidates:
+            pending.append((blog_data, executor.submit(evaluate, blog_data)))
+            if len(pending) >= max_workers:
+                break
+        while pending:
+            blog_data, future = pending.popleft()
+            next_blog = next(candidates, None)
+            if next_blog is not None:
+                pending.append((next_blog, executor.submit(evaluate, next_blog)))
+            yield blog_data, future.result
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def analyze_single_keyword_fully(keyword: str, num_reviews: int, driver, log_details: bool, progress: gr.Progress, progress_desc: str, max_workers: int = None, festival_details: dict = None, cancel_event: threading.Event = None):
+    """
+    키워드 하나에 대해 블로그 수집, LLM 평가, 트렌드/워드클라우드 생성까지 전체 분석을 수행합니다.
+
+    driver: 단일 WebDriver 또는 WebDriverPool. 풀을 넘기면 작업자마다 별도의 드라이버를 빌려 사용합니다.
+    max_workers: 동시에 크롤링/평가할 블로그 후보 수. None이면 ANALYSIS_MAX_WORKERS 설정을 따르며,
+                 1이면 기존과 같이 한 건씩 순차 처리합니다.
+    festival_details: get_festival_details_bulk로 미리 조회한 축제 정보. None이면 DB에서 조회하고,
+                      DB에 없는 축제는 빈 dict를 넘기면 다시 조회하지 않습니다.
+    cancel_event: 설정되면 새 후보를 평가하지 않고, 아직 시작하지 않은 평가는 취소한 뒤 취소 오류를 반환합니다.
+    """
     # 캐시 확인
     cached_result = load_raw_cached_analysis(keyword, num_reviews)
     if cached_result:
         return cached_result
 
-    # TourAPI에서 축제 기간 가져오기
-    start_date_str, end_date_str = get_festival_period(keyword)
+    # DB에서 축제 상세 정보(기간, 주소 등) 가져오기. 그룹 분석은 미리 일괄 조회한 값을 넘겨받습니다.
+    if festival_details is None:
+        festival_details = get_festival_details(keyword)
+    start_date_str = festival_details.get('start_date') if festival_details else None
+    end_date_str = festival_details.get('end_date') if festival_details else None
     event_period = None
     if start_date_str and end_date_str:
         try:
@@ -52,9 +209,6 @@ def analyze_single_keyword_fully(keyword: str, num_reviews: int, driver, log_det
     else:
         start_date, end_date = None, None
 
-    # TourAPI에서 축제 상세 정보 가져오기
-    from ..infrastructure.web.tour_api_client import get_festival_details
-    festival_details = get_festival_details(keyword)
     addr1 = festival_details.get('addr1') if festival_details else None
     addr2 = festival_details.get('addr2') if festival_details else None
     areaCode = festival_details.get('areacode') if festival_details else None
@@ -68,146 +222,189 @@ def analyze_single_keyword_fully(keyword: str, num_reviews: int, driver, log_det
     all_scores = []  # 만족도 계산을 위한 전체 점수 수집
     seasonal_aspect_pairs = {"봄": [], "여름": [], "가을": [], "겨울": [], "정보없음": []}
     seasonal_texts = {"봄": [], "여름": [], "가을": [], "겨울": [], "정보없음": []}
-    total_pos, total_neg, total_searched, start_index = 0, 0, 0, 1
+    total_pos, total_neg, total_searched = 0, 0, 0
     total_strong_pos, total_strong_neg = 0, 0
     seasonal_data = {"봄": {"pos": 0, "neg": 0}, "여름": {"pos": 0, "neg": 0}, "가을": {"pos": 0, "neg": 0}, "겨울": {"pos": 0, "neg": 0}, "정보없음": {"pos": 0, "neg": 0}}
 
-    try:
+    search_state = {"exhausted": False, "error": False}
+
+    def iter_candidate_blogs():
+        """검색 결과 페이지를 받는 대로 후보 블로그를 생성합니다. 뒤 페이지는 앞 후보를 평가하는 동안 미리 받아 둡니다."""
+        nonlocal total_searched
         max_api_calls = 10
-        for call_num in range(max_api_calls):
-            if len(candidate_blogs) >= max_candidates: break
-            progress((call_num + 1) / max_api_calls * 0.2, desc=f"[{progress_desc}] {keyword} 블로그 후보 수집 중... ({len(candidate_blogs)}/{max_candidates})")
-            api_results = search_naver_blog_page(search_keyword, start_index=start_index)
-            if not api_results: break
-            total_searched += len(api_results)
-            for item in api_results:
-                if "blog.naver.com" in item["link"]:
-                    item['title'] = re.sub(r'<[^>]+>', '', item['title']).strip()
-                    if item['title'] and item["link"]:
-                        candidate_blogs.append(item)
-                    if len(candidate_blogs) >= max_candidates: break
-            start_index += 100
-            if start_index > 901: break
-    except Exception as e:
-        print(f"블로그 후보 수집 중 오류 ({keyword}): {e}")
-        traceback.print_exc()
-        return {"error": f"'{search_keyword}' 블로그 후보 수집 중 오류 발생"}
+        try:
+            with closing(iter_naver_blog_pages(search_keyword, max_pages=max_api_calls, expected_items=max_candidates)) as pages:
+                for api_results in pages:
+                    total_searched += len(api_results)
+                    for item in api_results:
+                        if "blog.naver.com" in item["link"]:
+                            item['title'] = re.sub(r'<[^>]+>', '', item['title']).strip()
+                            if item['title'] and item["link"]:
+                                candidate_blogs.append(item)
+                                yield item
+                            if len(candidate_blogs) >= max_candidates: return
+        except Exception as e:
+            print(f"블로그 후보 수집 중 오류 ({keyword}): {e}")
+            traceback.print_exc()
+            search_state["error"] = True
+        finally:
+            search_state["exhausted"] = True
 
-    if not candidate_blogs: return {"error": f"'{search_keyword}'에 대한 네이버 블로그를 찾을 수 없습니다."}
+    def num_candidates_to_process():
+        # 검색이 끝나기 전에는 수집할 최대 후보 수를 기준으로 진행률을 계산합니다.
+        return len(candidate_blogs) if search_state["exhausted"] else max_candidates
 
+    progress(0.0, desc=f"[{progress_desc}] {keyword} 블로그 후보 수집 중... (최대 {max_candidates}개)")
     valid_blogs_data = []
-    num_candidates_to_process = len(candidate_blogs)
     initial_progress = 0.2
 
     # 연속 검증 실패 카운터 추가
     consecutive_failures = 0
     max_consecutive_failures = 15  # 연속으로 15번 실패하면 조기 종료
-
-    for i, blog_data in enumerate(candidate_blogs):
-        if len(valid_blogs_data) >= num_reviews: break
-
-        # 연속 실패가 너무 많으면 조기 종료
-        if consecutive_failures >= max_consecutive_failures:
-            print(f"⚠️ [{keyword}] 연속 {max_consecutive_failures}번 검증 실패로 분석 중단. (유효 블로그 {len(valid_blogs_data)}개 수집)")
-            break
-
-        progress(initial_progress + (i + 1) / num_candidates_to_process * 0.8, desc=f"[{progress_desc}] {keyword} 분석 중... ({len(valid_blogs_data)}/{num_reviews} 완료, {i+1}/{num_candidates_to_process} 확인)")
-
-        try:
-            content = scrape_blog_content(driver, blog_data["link"])
-            if not content or "오류" in content or "찾을 수 없습니다" in content:
-                consecutive_failures += 1
-                continue
-
-            max_content_length = 30000
-            if len(content) > max_content_length:
-                content = content[:max_content_length] + "... (내용 일부 생략)"
-
-            final_state = app_llm_graph.invoke({
-                "original_text": content, "keyword": keyword, "title": blog_data["title"],
-                "log_details": log_details, "re_summarize_count": 0, "is_relevant": False
-            })
-
-            if not final_state or not final_state.get("is_relevant"):
-                consecutive_failures += 1
-                continue
-
-            # 검증 성공 시 카운터 리셋
-            consecutive_failures = 0
-
-            judgments = final_state.get("final_judgments", [])
-            if not judgments:
-                consecutive_failures += 1  # 판정 결과가 없어도 실패로 간주
-                continue
-
-            # 감성어 추출 로직 보강
-            all_sentiment_words = set(knowledge_base.adjectives.keys()) | \
-                                  set(knowledge_base.adverbs.keys()) | \
-                                  set(knowledge_base.sentiment_nouns.keys()) | \
-                                  set(knowledge_base.idioms.keys())
-
-            for j in judgments:
-                keyword_found = False
-                if j.get("sentiment_keyword"):
-                    emotion_keywords.append(j["sentiment_keyword"])
-                    keyword_found = True
+    prefilter_saved_calls = 0  # 규칙 기반 사전 필터로 생략한 LLM 검증 호출 수
+    llm_failures = 0  # LLM 호출 오류로 판정하지 못한 후보 수
+
+    if max_workers is None:
+        max_workers = get_analysis_max_workers()
+    driver_lock = _single_driver_lock
+
+    def is_cancelled():
+        return cancel_event is not None and cancel_event.is_set()
+
+    def evaluate(blog_data):
+        # 미리 제출된 평가도 취소된 뒤에는 크롤링/LLM 호출을 시작하지 않습니다.
+        if is_cancelled():
+            return None, None
+        return _evaluate_candidate(blog_data, keyword, driver, driver_lock, log_details)
+
+    candidate_source = iter_candidate_blogs()
+    candidates = candidate_source
+    batch_validation_size = get_batch_validation_size()
+    if batch_validation_size > 0:
+        candidates = _prefilter_candidates(candidates, keyword, batch_validation_size, log_details)
+
+    # 분석이 일찍 끝나면 미리 요청해 둔 검색 페이지도 함께 취소되도록 후보 생성기를 명시적으로 닫습니다.
+    with closing(candidate_source), closing(_iter_candidate_evaluations(candidates, evaluate, max_workers)) as evaluations:
+        for i, (blog_data, get_result) in enumerate(evaluations):
+            if len(valid_blogs_data) >= num_reviews: break
+            if is_cancelled():
+                print(f"⏹️ [{keyword}] 분석이 취소되어 블로그 평가를 중단합니다. (유효 블로그 {len(valid_blogs_data)}개 수집)")
+                return {"error": f"'{keyword}' 분석이 취소되었습니다.", "cancelled": True, "retryable": True}
+
+            # 연속 실패가 너무 많으면 조기 종료
+            if consecutive_failures >= max_consecutive_failures:
+                print(f"⚠️ [{keyword}] 연속 {max_consecutive_failures}번 검증 실패로 분석 중단. (유효 블로그 {len(valid_blogs_data)}개 수집)")
+                break
+
+            total_candidates = max(i + 1, num_candidates_to_process())
+            progress(initial_progress + (i + 1) / total_candidates * 0.8, desc=f"[{progress_desc}] {keyword} 분석 중... ({len(valid_blogs_data)}/{num_reviews} 완료, {i+1}/{total_candidates} 확인)")
+
+            try:
+                content, final_state = get_result()
+                if content is None:
+                    consecutive_failures += 1
+                    continue
+
+                if final_state and final_state.get("prefilter_rejected"):
+                    prefilter_saved_calls += 1
+                if final_state and final_state.get("llm_error"):
+                    llm_failures += 1
+
+                if not final_state or not final_state.get("is_relevant"):
+                    consecutive_failures += 1
+                    continue
+
+                # 검증 성공 시 카운터 리셋
+                consecutive_failures = 0
+
+                judgments = final_state.get("final_judgments", [])
+                if not judgments:
+                    consecutive_failures += 1  # 판정 결과가 없어도 실패로 간주
+                    continue
+
+                # 감성어 추출 로직 보강
+                all_sentiment_words = set(knowledge_base.adjectives.keys()) | \
+                                      set(knowledge_base.adverbs.keys()) | \
+                                      set(knowledge_base.sentiment_nouns.keys()) | \
+                                      set(knowledge_base.idioms.keys())
+
+                for j in judgments:
+                    keyword_found = False
+                    if j.get("sentiment_keyword"):
+                        emotion_keywords.append(j["sentiment_keyword"])
+                        keyword_found = True
                 
-                # LLM이 키워드를 못찾았을 경우, 규칙 기반으로 재탐색
-                if not keyword_found and j.get("final_verdict") in ["긍정", "부정"]:
-                    sentence_words = j.get("sentence", "").split()
-                    for word in sentence_words:
-                        if word in all_sentiment_words:
-                            emotion_keywords.append(word)
-                            break # 문장 당 첫번째 키워드만 추가
+                    # LLM이 키워드를 못찾았을 경우, 규칙 기반으로 재탐색
+                    if not keyword_found and j.get("final_verdict") in ["긍정", "부정"]:
+                        sentence_words = j.get("sentence", "").split()
+                        for word in sentence_words:
+                            if word in all_sentiment_words:
+                                emotion_keywords.append(word)
+                                break # 문장 당 첫번째 키워드만 추가
             
-            season = get_season(blog_data.get('postdate', ''))
-            seasonal_texts[season].append(content)
+                season = get_season(blog_data.get('postdate', ''))
+                seasonal_texts[season].append(content)
             
-            aspect_pairs = final_state.get("aspect_sentiment_pairs", [])
-            if aspect_pairs:
-                seasonal_aspect_pairs[season].extend(aspect_pairs)
-
-            # 점수 수집 (만족도 계산용)
-            for j in judgments:
-                if "score" in j:
-                    all_scores.append(j["score"])
-
-            blog_judgments_list.append(judgments)
-            pos_count = sum(1 for res in judgments if res["final_verdict"] == "긍정")
-            neg_count = sum(1 for res in judgments if res["final_verdict"] == "부정")
-
-            strong_pos_count = sum(1 for res in judgments if res["final_verdict"] == "긍정" and res["score"] >= 1.0)
-            strong_neg_count = sum(1 for res in judgments if res["final_verdict"] == "부정" and res["score"] < -1.0)
-
-            total_pos += pos_count
-            total_neg += neg_count
-            total_strong_pos += strong_pos_count
-            total_strong_neg += strong_neg_count
-            all_negative_sentences.extend([res["sentence"] for res in judgments if res["final_verdict"] == "부정"])
+                aspect_pairs = final_state.get("aspect_sentiment_pairs", [])
+                if aspect_pairs:
+                    seasonal_aspect_pairs[season].extend(aspect_pairs)
+
+                # 점수 수집 (만족도 계산용)
+                for j in judgments:
+                    if "score" in j:
+                        all_scores.append(j["score"])
+
+                blog_judgments_list.append(judgments)
+                pos_count = sum(1 for res in judgments if res["final_verdict"] == "긍정")
+                neg_count = sum(1 for res in judgments if res["final_verdict"] == "부정")
+
+                strong_pos_count = sum(1 for res in judgments if res["final_verdict"] == "긍정" and res["score"] >= 1.0)
+                strong_neg_count = sum(1 for res in judgments if res["final_verdict"] == "부정" and res["score"] < -1.0)
+
+                total_pos += pos_count
+                total_neg += neg_count
+                total_strong_pos += strong_pos_count
+                total_strong_neg += strong_neg_count
+                all_negative_sentences.extend([res["sentence"] for res in judgments if res["final_verdict"] == "부정"])
             
-            seasonal_data[season]["pos"] += pos_count
-            seasonal_data[season]["neg"] += neg_count
+                seasonal_data[season]["pos"] += pos_count
+                seasonal_data[season]["neg"] += neg_count
             
-            sentiment_frequency = pos_count + neg_count
-            sentiment_score = ((strong_pos_count - strong_neg_count) / sentiment_frequency * 50 + 50) if sentiment_frequency > 0 else 50.0
-            pos_perc = (pos_count/sentiment_frequency*100) if sentiment_frequency > 0 else 0.0
-            neg_perc = (neg_count/sentiment_frequency*100) if sentiment_frequency > 0 else 0.0
-
-            blog_results_list.append({
-                "블로그 제목": blog_data["title"], "링크": blog_data["link"], "감성 빈도": sentiment_frequency, 
-                "감성 점수": f"{sentiment_score:.1f}", "긍정 문장 수": pos_count, "부정 문장 수": neg_count,
-                "긍정 비율 (%)": f"{pos_perc:.1f}", "부정 비율 (%)": f"{neg_perc:.1f}",
-                "긍/부정 문장 요약": "\n---\n".join([f"[{res['final_verdict']}] {res['sentence']}" for res in judgments]),
-                "judgments": judgments # 원본 judgments 리스트 추가
-            })
-            valid_blogs_data.append(blog_data)
-        except Exception as e:
-            print(f"블로그 분석 중 오류 ({keyword}, {blog_data.get('link', 'N/A')}): {e}")
-            traceback.print_exc()
-            consecutive_failures += 1  # 예외 발생도 실패로 간주
-            continue
+                sentiment_frequency = pos_count + neg_count
+                sentiment_score = ((strong_pos_count - strong_neg_count) / sentiment_frequency * 50 + 50) if sentiment_frequency > 0 else 50.0
+                pos_perc = (pos_count/sentiment_frequency*100) if sentiment_frequency > 0 else 0.0
+                neg_perc = (neg_count/sentiment_frequency*100) if sentiment_frequency > 0 else 0.0
+
+                blog_results_list.append({
+                    "블로그 제목": blog_data["title"], "링크": blog_data["link"], "감성 빈도": sentiment_frequency, 
+                    "감성 점수": f"{sentiment_score:.1f}", "긍정 문장 수": pos_count, "부정 문장 수": neg_count,
+                    "긍정 비율 (%)": f"{pos_perc:.1f}", "부정 비율 (%)": f"{neg_perc:.1f}",
+                    "긍/부정 문장 요약": "\n---\n".join([f"[{res['final_verdict']}] {res['sentence']}" for res in judgments]),
+                    "judgments": judgments # 원본 judgments 리스트 추가
+                })
+                valid_blogs_data.append(blog_data)
+            except Exception as e:
+                print(f"블로그 분석 중 오류 ({keyword}, {blog_data.get('link', 'N/A')}): {e}")
+                traceback.print_exc()
+                consecutive_failures += 1  # 예외 발생도 실패로 간주
+                continue
+
+    # 평가 중에 취소되었으면 일부만 모인 결과를 캐시하지 않도록 여기서 끝냅니다.
+    if is_cancelled():
+        return {"error": f"'{keyword}' 분석이 취소되었습니다.", "cancelled": True, "retryable": True}
+
+    if not candidate_blogs:
+        if search_state["error"]:
+            return {"error": f"'{search_keyword}' 블로그 후보 수집 중 오류 발생", "retryable": True}
+        return {"error": f"'{search_keyword}'에 대한 네이버 블로그를 찾을 수 없습니다."}
+
+    if prefilter_saved_calls:
+        print(f"🧹 [{keyword}] 규칙 기반 사전 필터로 LLM 검증 {prefilter_saved_calls}회 생략")
 
-    if not valid_blogs_data: return {"error": f"'{keyword}'에 대한 유효한 후기 블로그를 찾지 못했습니다 (후보 {len(candidate_blogs)}개 확인)."}
+    if not valid_blogs_data:
+        # LLM 오류로 판정하지 못한 후보가 있었다면 후기가 없다고 단정할 수 없으므로 다시 시도할 수 있는 오류로 표시합니다.
+        return {"error": f"'{keyword}'에 대한 유효한 후기 블로그를 찾지 못했습니다 (후보 {len(candidate_blogs)}개 확인).",
+                "retryable": llm_failures > 0}
 
     # 만족도 5단계 분류 계산
     from .utils import calculate_satisfaction_boundaries, map_score_to_level, generate_distribution_interpretation
@@ -424,9 +621,221 @@ def create_category_trend_graph(trend_dfs: list, title: str, focused_dates: tupl
         traceback.print_exc()
         return None
 
-def perform_festival_group_analysis(festivals_to_analyze: list, group_name: str, num_reviews: int, driver, log_details: bool, progress: gr.Progress, initial_progress: float, total_steps: int):
+def _analyze_festival_for_group(festival_name: str, num_reviews: int, driver, log_details: bool, progress_callback, festival_details: dict = None, cancel_event: threading.Event = None):
+    """
+    그룹 분석용으로 축제 하나를 분석하고 부정 의견 요약까지 생성합니다.
+    유효한 결과가 없으면 None을, 검색/LLM 오류나 취소처럼 다시 시도하면 결과가 달라질 수 있는 실패는
+    오류 dict({"error": ..., "retryable": True})를 반환합니다.
+    """
+    result = analyze_single_keyword_fully(festival_name, num_reviews, driver, log_details, progress_callback, "그룹 분석",
+                                          festival_details=festival_details, cancel_event=cancel_event)
+
+    if result.get("retryable"):
+        print(f"   [{festival_name}] 일시적인 오류로 분석하지 못했습니다: {result['error']}")
+        return {"error": result["error"], "retryable": True}
+    if "error" in result or result.get("blog_results_df", pd.DataFrame()).empty:
+        print(f"   [{festival_name}] 분석 결과가 없거나 오류 발생.")
+        return None
+
+    # 부정 문장 요약 생성
+    negative_sentences_list = result.get("negative_sentences", [])
+    negative_summary = summarize_negative_feedback(negative_sentences_list)
+
+    if not negative_summary and result.get("total_neg", 0) > 0:
+        negative_summary = f"부정 판정 {result.get('total_neg', 0)}건이 있으나 구체적인 불만 내용을 추출하지 못했습니다."
+
+    result['precomputed_negative_summary'] = negative_summary
+    return result
+
+def _build_festival_row(festival_name: str, result: dict) -> dict:
+    """individual_festival_results_df의 축제 한 행을 만듭니다."""
+    return {
+        "축제명": festival_name,
+        '감성 빈도': result.get("total_sentiment_frequency", 0),
+        '감성 점수': f"{result.get('total_sentiment_score', 50.0):.1f}",
+        "긍정 문장 수": result.get("total_pos", 0),
+        "부정 문장 수": result.get("total_neg", 0),
+        "긍정 비율 (%)": f"{(result.get('total_pos', 0) / result.get('total_sentiment_frequency', 1) * 100):.1f}",
+        "부정 비율 (%)": f"{(result.get('total_neg', 0) / result.get('total_sentiment_frequency', 1) * 100):.1f}",
+        '축제 기간 (일)': result.get('event_period', 'N/A'),
+        '트렌드 지수 (%)': result.get("trend_metrics", {}).get('trend_index', 'N/A'),
+        '만족도 변화': f"{result.get('satisfaction_delta', 0):.1f}",
+        '주요 감성 키워드': str(result.get('emotion_keyword_freq', {})),
+        '주요 불만 사항 요약': result['precomputed_negative_summary'] or "없음"
+    }
+
+def _satisfaction_distribution(scores: list):
+    """
+    점수 목록의 만족도 5단계 분포를 계산합니다.
+
+    Returns:
+        (boundaries, outliers, satisfaction_counts, avg_satisfaction) 튜플
+    """
+    from .utils import calculate_satisfaction_boundaries, map_score_to_level
+    import numpy as np
+
+    if not scores:
+        return {}, [], Counter(), 3.0
+    boundary_results = calculate_satisfaction_boundaries(scores)
+    boundaries = boundary_results["boundaries"]
+    levels = [map_score_to_level(score, boundaries) for score in scores]
+    level_map = {1: "매우 불만족", 2: "불만족", 3: "보통", 4: "만족", 5: "매우 만족"}
+    satisfaction_counts = Counter([level_map.get(level, "보통") for level in levels])
+    avg_satisfaction = np.mean(levels) if levels else 3.0
+    return boundaries, boundary_results["outliers"], satisfaction_counts, avg_satisfaction
+
+def _iter_festival_analyses(pending_festivals: list, analyze, max_workers: int):
+    """
+    (index, festival_name) 목록의 축제별 분석 결과를 (index, festival_name, result) 형태로 생성합니다.
+
+    max_workers가 1이면 기존과 같이 순서대로 한 축제씩 분석하고, 2 이상이면 축제들을 작업자 풀에 나눠
+    분석이 끝나는 순서대로 생성합니다. 소비 측이 순회를 멈추면 아직 시작되지 않은 축제는 취소됩니다.
+    """
+    if max_workers <= 1:
+        for index, festival_name in pending_festivals:
+            yield index, festival_name, analyze(index, festival_name)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="festival-analysis")
+    try:
+        futures = {
+            executor.submit(analyze, index, festival_name): (index, festival_name)
+            for index, festival_name in pending_festivals
+        }
+        for future in as_completed(futures):
+            index, festival_name = futures[future]
+            yield index, festival_name, future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def perform_festival_group_analysis(festivals_to_analyze: list, group_name: str, num_reviews: int, driver, log_details: bool, progress: gr.Progress, initial_progress: float, total_steps: int, max_workers: int = None, on_festival_done=None, cancel_event: threading.Event = None, checkpoint_key: str = None):
+    """
+    축제 목록을 각각 분석한 뒤 그룹(카테고리) 단위로 집계합니다.
+
+    max_workers: 동시에 분석할 축제 수. None이면 GROUP_ANALYSIS_MAX_WORKERS 설정을 따르며,
+                 driver로 WebDriverPool을 넘기면 축제마다 별도의 드라이버를 빌려 쓰고,
+                 단일 WebDriver를 넘기면 Selenium 크롤링만 한 번에 하나씩 처리됩니다.
+    on_festival_done: 축제 하나의 분석이 끝날 때마다 호출할 함수. 해당 축제의 결과 행과
+                      지금까지의 누적 긍/부정 수, 만족도 분포를 담은 dict를 인자로 받습니다.
+    cancel_event: 설정되면 아직 시작하지 않은 축제는 분석하지 않고, 분석 중인 축제도 다음 블로그 후보에서 멈춘 뒤
+                  취소 오류를 반환합니다.
+    checkpoint_key: 지정하면 축제 하나가 끝날 때마다 결과를 체크포인트로 저장하고,
+                    같은 키로 다시 실행하면 이미 끝난 축제는 분석하지 않고 저장된 결과를 사용합니다.
+                    검색/LLM 오류나 취소로 끝나지 못한 축제는 저장하지 않아 다음 실행 때 다시 분석합니다.
+                    집계가 끝나도 체크포인트는 지우지 않습니다. recompute_category_analysis가 크롤링 없이
+                    다시 집계할 때 사용하며, 유효 기간(max_age_days)이 지나면 다음 실행 때 삭제됩니다.
+
+    이번 실행에서 다시 시도해야 하는 축제가 있었다면 결과의 "retry_festivals"에 이름 목록을 담습니다.
+    """
     if not festivals_to_analyze: return {"error": f"'{group_name}' 그룹에서 분석할 축제를 찾을 수 없습니다."}
 
+    total_festivals = len(festivals_to_analyze)
+    if os.environ.get("LOG_DEBUG") == "true":
+        print(f"[DEBUG][CategoryAnalysis] Initial total_festivals: {total_festivals}")
+
+    # --- 개별 축제 분석 (GROUP_ANALYSIS_MAX_WORKERS > 1 이면 병렬) ---
+    # 축제별 진행률을 따로 기록하고 합산해서 보고하므로, 병렬로 실행해도 전체 진행률이 앞뒤로 흔들리지 않습니다.
+    festival_progress = [0.0] * total_festivals
+    progress_lock = threading.Lock()
+
+    def analyze_festival(i, festival_name):
+        if cancel_event is not None and cancel_event.is_set():
+            return {"error": f"'{festival_name}' 분석이 취소되었습니다.", "retryable": True}
+
+        def nested_progress_callback(p, desc=""):
+            with progress_lock:
+                festival_progress[i] = p
+                done = sum(festival_progress)
+            progress(initial_progress + done / total_festivals / total_steps, desc=f"분석 중: {festival_name} ({i+1}/{total_festivals}) - {desc}")
+
+        result = _analyze_festival_for_group(festival_name, num_reviews, driver, log_details, nested_progress_callback,
+                                             festival_details=festival_details_map.get(festival_name) or {},
+                                             cancel_event=cancel_event)
+        with progress_lock:
+            festival_progress[i] = 1.0
+        return result
+
+    completed_results = {}
+    running_pos, running_neg, running_scores = 0, 0, []
+
+    def record_result(i, festival_name, result):
+        nonlocal running_pos, running_neg
+        completed_results[i] = (festival_name, result)
+        if on_festival_done is None:
+            return
+        running_pos += result.get("total_pos", 0)
+        running_neg += result.get("total_neg", 0)
+        running_scores.extend(result.get("all_scores", []))
+        _, _, running_counts, running_avg = _satisfaction_distribution(running_scores)
+        on_festival_done({
+            "festival": festival_name,
+            "index": i,
+            "completed": len(completed_results),
+            "total_festivals": total_festivals,
+            # 최종 individual_results와 같은 형식이 되도록 DataFrame 레코드로 변환합니다.
+            "row": pd.DataFrame([_build_festival_row(festival_name, result)]).to_dict("records")[0],
+            "total_pos": running_pos,
+            "total_neg": running_neg,
+            "satisfaction_counts": dict(running_counts),
+            "avg_satisfaction": float(running_avg),
+        })
+
+    # 체크포인트가 있으면 이미 끝난 축제는 저장된 결과를 사용하고 나머지만 분석합니다.
+    checkpoint_store = get_category_checkpoint_store() if checkpoint_key else None
+    finished = checkpoint_store.start(checkpoint_key, group_name, festivals_to_analyze) if checkpoint_store else {}
+    pending_festivals = []
+    for i, festival_name in enumerate(festivals_to_analyze):
+        if festival_name not in finished:
+            pending_festivals.append((i, festival_name))
+            continue
+        festival_progress[i] = 1.0
+        if finished[festival_name] is not None:
+            record_result(i, festival_name, finished[festival_name])
+    if finished:
+        print(f"♻️ [{group_name}] 체크포인트에서 완료된 축제 {total_festivals - len(pending_festivals)}개를 불러왔습니다. (남은 축제 {len(pending_festivals)}개)")
+
+    # 남은 축제의 기간/주소 정보를 축제마다 따로 조회하지 않고 DB 연결 하나로 한 번에 가져옵니다.
+    festival_details_map = get_festival_details_bulk([festival_name for _, festival_name in pending_festivals]) if pending_festivals else {}
+
+    # 축제별 1년 트렌드는 조회 기간이 같으므로, 데이터랩 요청 하나에 최대 5개 축제씩 묶어 받도록 알려 둡니다.
+    hint_trend_keywords([festival_name for _, festival_name in pending_festivals], *get_trend_history_window())
+
+    if max_workers is None:
+        max_workers = get_group_analysis_max_workers()
+    retry_festivals = []
+    with closing(_iter_festival_analyses(pending_festivals, analyze_festival, max_workers)) as analyses:
+        for i, festival_name, result in analyses:
+            if cancel_event is not None and cancel_event.is_set():
+                print(f"⏹️ [{group_name}] 분석이 취소되어 남은 축제 분석을 중단합니다. ({len(completed_results)}/{total_festivals} 완료)")
+                return {"error": f"'{group_name}' 그룹 분석이 취소되었습니다."}
+            if result is not None and result.get("retryable"):
+                # 일시적인 실패는 완료로 기록하지 않습니다. (다음 실행 때 다시 분석)
+                retry_festivals.append(festival_name)
+                continue
+            if checkpoint_store:
+                try:
+                    checkpoint_store.save_festival(checkpoint_key, festival_name, result)
+                except Exception as e:
+                    print(f"⚠️ [{group_name}] '{festival_name}' 체크포인트 저장 실패: {e}")
+            if result is None:
+                continue
+            record_result(i, festival_name, result)
+
+    results = aggregate_festival_group_results(festivals_to_analyze, completed_results, group_name)
+    if retry_festivals and "error" not in results:
+        print(f"⚠️ [{group_name}] 일시적인 오류로 분석하지 못한 축제 {len(retry_festivals)}개를 제외하고 집계했습니다.")
+        results["retry_festivals"] = retry_festivals
+    return results
+
+def aggregate_festival_group_results(festivals_to_analyze: list, completed_results: dict, group_name: str, use_llm: bool = True):
+    """
+    축제별 분석 결과를 그룹(카테고리) 단위로 종합합니다. 크롤링/검색/트렌드 API는 호출하지 않습니다.
+
+    completed_results: {축제 목록상의 index: (festival_name, result)}
+    use_llm: False이면 만족도 분포 해석, 부정 의견 요약, 종합 요약을 LLM 없이 생략하거나 기본 문구로 채웁니다.
+    """
+    total_festivals = len(festivals_to_analyze)
+
     # --- 집계 변수 초기화 ---
     category_results, all_blog_posts_list = [], []
     festival_full_results = []
@@ -445,29 +854,9 @@ def perform_festival_group_analysis(festivals_to_analyze: list, group_name: str,
     agg_trend_dfs = []
     agg_focused_trend_dfs = []
 
-    total_festivals = len(festivals_to_analyze)
-    if os.environ.get("LOG_DEBUG") == "true":
-        print(f"[DEBUG][CategoryAnalysis] Initial total_festivals: {total_festivals}")
-
-    # --- 개별 축제 분석 루프 ---
-    for i, festival_name in enumerate(festivals_to_analyze):
-        def nested_progress_callback(p, desc=""):
-            progress(initial_progress + (i + p) / total_festivals / total_steps, desc=f"분석 중: {festival_name} ({i+1}/{total_festivals}) - {desc}")
-
-        result = analyze_single_keyword_fully(festival_name, num_reviews, driver, log_details, nested_progress_callback, "그룹 분석")
-        
-        if "error" in result or result.get("blog_results_df", pd.DataFrame()).empty:
-            print(f"   [{festival_name}] 분석 결과가 없거나 오류 발생.")
-            continue
-
-        # 부정 문장 요약 생성
-        negative_sentences_list = result.get("negative_sentences", [])
-        negative_summary = summarize_negative_feedback(negative_sentences_list)
-
-        if not negative_summary and result.get("total_neg", 0) > 0:
-            negative_summary = f"부정 판정 {result.get('total_neg', 0)}건이 있으나 구체적인 불만 내용을 추출하지 못했습니다."
-
-        result['precomputed_negative_summary'] = negative_summary
+    # 완료 순서와 상관없이 축제 목록 순서대로 집계해 결과 표와 목록 순서를 유지합니다.
+    for i in sorted(completed_results):
+        festival_name, result = completed_results[i]
         festival_full_results.append(result)
 
         # --- 데이터 집계 ---
@@ -503,20 +892,7 @@ def perform_festival_group_analysis(festivals_to_analyze: list, group_name: str,
         total_festivals_sentiment_score += result.get('total_sentiment_score', 50.0)
         analyzed_festivals_count += 1
         
-        category_results.append({
-            "축제명": festival_name,
-            '감성 빈도': result.get("total_sentiment_frequency", 0),
-            '감성 점수': f"{result.get('total_sentiment_score', 50.0):.1f}",
-            "긍정 문장 수": result.get("total_pos", 0),
-            "부정 문장 수": result.get("total_neg", 0),
-            "긍정 비율 (%)": f"{(result.get('total_pos', 0) / result.get('total_sentiment_frequency', 1) * 100):.1f}",
-            "부정 비율 (%)": f"{(result.get('total_neg', 0) / result.get('total_sentiment_frequency', 1) * 100):.1f}",
-            '축제 기간 (일)': result.get('event_period', 'N/A'),
-            '트렌드 지수 (%)': result.get("trend_metrics", {}).get('trend_index', 'N/A'),
-            '만족도 변화': f"{result.get('satisfaction_delta', 0):.1f}",
-            '주요 감성 키워드': str(result.get('emotion_keyword_freq', {})),
-            '주요 불만 사항 요약': result['precomputed_negative_summary'] or "없음"
-        })
+        category_results.append(_build_festival_row(festival_name, result))
 
         if "blog_results_df" in result and not result["blog_results_df"].empty:
             all_blog_posts_list.append(result["blog_results_df"])
@@ -527,24 +903,11 @@ def perform_festival_group_analysis(festivals_to_analyze: list, group_name: str,
     # --- 루프 후 종합 분석 수행 ---
 
     # 1. 카테고리 전체 만족도 분석
-    from .utils import calculate_satisfaction_boundaries, map_score_to_level, generate_distribution_interpretation
-    import numpy as np
-    
+    from .utils import generate_distribution_interpretation
+
     category_distribution_interpretation = ""
-    category_satisfaction_counts = {}
-    category_avg_satisfaction = 3.0
-    category_boundaries = {}
-    category_outliers = []
-
-    if agg_all_scores:
-        category_boundary_results = calculate_satisfaction_boundaries(agg_all_scores)
-        category_boundaries = category_boundary_results["boundaries"]
-        category_outliers = category_boundary_results["outliers"]
-        
-        category_all_satisfaction_levels = [map_score_to_level(score, category_boundaries) for score in agg_all_scores]
-        level_map = {1: "매우 불만족", 2: "불만족", 3: "보통", 4: "만족", 5: "매우 만족"}
-        category_satisfaction_counts = Counter([level_map.get(level, "보통") for level in category_all_satisfaction_levels])
-        category_avg_satisfaction = np.mean(category_all_satisfaction_levels) if category_all_satisfaction_levels else 3.0
+    category_boundaries, category_outliers, category_satisfaction_counts, category_avg_satisfaction = \
+        _satisfaction_distribution(agg_all_scores)
 
     # 2. 카테고리 전체 트렌드 분석
     category_trend_graph_url = create_category_trend_graph(agg_trend_dfs, group_name)
@@ -559,7 +922,9 @@ def perform_festival_group_analysis(festivals_to_analyze: list, group_name: str,
     ) if min_start and max_end else None
 
     # 3. 카테고리 전체 AI 분포 해석 생성
-    if agg_all_scores:
+    if agg_all_scores and not use_llm:
+        category_distribution_interpretation = f"카테고리 평균 만족도: {category_avg_satisfaction:.2f} / 5.0"
+    elif agg_all_scores:
         try:
             # 카테고리 레벨에서는 트렌드 지수를 직접 계산하기 어려우므로 N/A 처리
             category_trend_metrics = {"trend_index": "N/A"}
@@ -600,9 +965,9 @@ def perform_festival_group_analysis(festivals_to_analyze: list, group_name: str,
         if neg_wc_path: category_seasonal_word_clouds[season]['negative'] = f"/images/{os.path.basename(neg_wc_path)}"
 
     # 카테고리 종합 LLM 요약
-    category_negative_summary = summarize_negative_feedback(agg_negative_sentences)
+    category_negative_summary = summarize_negative_feedback(agg_negative_sentences) if use_llm else ""
     category_overall_summary = ""
-    if analyzed_festivals_count > 0:
+    if analyzed_festivals_count > 0 and use_llm:
         category_temp_results = {
             "keyword": group_name, "total_pos": agg_pos, "total_neg": agg_neg,
             "trend_metrics": {"trend_index": 0},
@@ -649,7 +1014,7 @@ def perform_festival_group_analysis(festivals_to_analyze: list, group_name: str,
     }
 
 # 기존 함수는 새로 만든 그룹 분석 함수를 호출하는 래퍼(wrapper)가 됨
-def perform_category_analysis(cat1, cat2, cat3, num_reviews, driver, log_details, progress: gr.Progress, initial_progress, total_steps):
+def perform_category_analysis(cat1, cat2, cat3, num_reviews, driver, log_details, progress: gr.Progress, initial_progress, total_steps, on_festival_done=None, cancel_event: threading.Event = None):
     category_name = cat3 or cat2 or cat1
 
     # 1. 캐시 확인
@@ -658,10 +1023,38 @@ def perform_category_analysis(cat1, cat2, cat3, num_reviews, driver, log_details
         return cached_result
 
     festivals_to_analyze = festival_loader.get_festivals(cat1, cat2, cat3)
-    results = perform_festival_group_analysis(festivals_to_analyze, category_name, num_reviews, driver, log_details, progress, initial_progress, total_steps)
+    results = perform_festival_group_analysis(
+        festivals_to_analyze, category_name, num_reviews, driver, log_details, progress, initial_progress, total_steps,
+        on_festival_done=on_festival_done, cancel_event=cancel_event,
+        checkpoint_key=get_category_cache_key(cat1, cat2, cat3, num_reviews)
+    )
     
-    # 2. 캐시 저장
-    if "error" not in results:
+    # 2. 캐시 저장 (일시적인 오류로 빠진 축제가 있으면 다음 요청 때 마저 분석하도록 저장하지 않음)
+    if "error" not in results and not results.get("retry_festivals"):
         save_category_analysis_to_cache(cat1, cat2, cat3, num_reviews, results)
     
-    return results
\ No newline at end of file
+    return results
+
+
+def recompute_category_analysis(cat1, cat2, cat3, num_reviews, use_llm: bool = False):
+    """
+    체크포인트에 저장된 축제별 결과만으로 카테고리 집계를 다시 계산합니다.
+    크롤링이나 검색 API는 호출하지 않으며, use_llm=False이면 LLM 요약도 생략합니다.
+    """
+    checkpoint_key = get_category_cache_key(cat1, cat2, cat3, num_reviews)
+    store = get_category_checkpoint_store()
+    manifest = store.load_manifest(checkpoint_key)
+    if manifest is None:
+        return {"error": f"'{cat3 or cat2 or cat1}' 카테고리의 분석 체크포인트가 없습니다."}
+
+    festivals = manifest["festivals"]
+    saved_results = store.load_results(checkpoint_key)
+    completed_results = {
+        i: (festival_name, saved_results[festival_name])
+        for i, festival_name in enumerate(festivals)
+        if saved_results.get(festival_name) is not None
+    }
+    missing = [name for name in festivals if name not in saved_results]
+    if missing:
+        print(f"⚠️ [{manifest['group_name']}] 체크포인트에 없는 축제 {len(missing)}개를 제외하고 집계합니다.")
+    return aggregate_festival_group_results(festivals, completed_results, manifest["group_name"], use_llm=use_llm)
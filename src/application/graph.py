@@ -1,9 +1,18 @@
 from langgraph.graph import StateGraph, END
 from src.domain.state import LLMGraphState
+from src.application.agents.relevance_prefilter import agent_relevance_prefilter
 from src.application.agents.content_validator import agent_content_validator
 from src.application.agents.llm_summarizer import agent_llm_summarizer
 from src.application.agents.rule_scorer import agent_rule_scorer_on_summary
 
+# 프롬프트나 그래프 구성을 바꾸면 이 값을 올려서 저장된 글 단위 분석 결과를 무효화합니다.
+LLM_PIPELINE_VERSION = "1"
+
+def route_after_prefilter(state: LLMGraphState):
+    if state.get("prefilter_rejected"):
+        return "__end__"
+    return "content_validator"
+
 def route_after_validation(state: LLMGraphState):
     if not state.get("is_relevant"):
         return "__end__"
@@ -17,11 +26,17 @@ def route_after_scoring(state: LLMGraphState):
 
 def create_llm_workflow():
     llm_workflow = StateGraph(LLMGraphState)
+    llm_workflow.add_node("relevance_prefilter", agent_relevance_prefilter)
     llm_workflow.add_node("content_validator", agent_content_validator)
     llm_workflow.add_node("llm_summarizer", agent_llm_summarizer)
     llm_workflow.add_node("rule_scorer", agent_rule_scorer_on_summary)
 
-    llm_workflow.set_entry_point("content_validator")
+    llm_workflow.set_entry_point("relevance_prefilter")
+    llm_workflow.add_conditional_edges(
+        "relevance_prefilter",
+        route_after_prefilter,
+        {"content_validator": "content_validator", "__end__": END},
+    )
     llm_workflow.add_conditional_edges(
         "content_validator",
         route_after_validation,
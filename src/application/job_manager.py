@@ -0,0 +1,143 @@
+# src/application/job_manager.py
+"""
+백그라운드 분석 작업 관리
+
+분석을 HTTP 요청 안에서 실행하지 않고 작업으로 등록한 뒤 작업자 풀에서 실행합니다.
+작업 상태, 진행률, 결과는 JobStore(SQLite)에 기록되므로 클라이언트 연결이 끊겨도 결과를 조회할 수 있고,
+서버가 재시작되면 끝나지 않은 작업을 다시 실행합니다.
+
+작업 종류별 실행 함수는 register()로 등록합니다. 실행 함수는 (params, progress)를 받아
+JSON으로 저장할 수 있는 결과 dict를 반환하며, 결과에 "error" 키가 있으면 실패로 기록됩니다.
+
+작업자는 데몬 스레드이므로 서버 종료를 막지 않습니다. 종료 시점에 실행 중이던 작업은 저장소에
+실행 중 상태로 남아 다음 실행 때 다시 시작되며, max_attempts번 시작하고도 끝나지 않은 작업은 실패로 기록합니다.
+"""
+import queue
+import threading
+import time
+import traceback
+
+from ..infrastructure.database.job_store import JobStore
+
+
+class JobManager:
+    def __init__(self, store: JobStore, max_workers: int = 1, progress_interval: float = 0.5, max_attempts: int = 3):
+        """
+        Args:
+            store: 작업 상태 저장소
+            max_workers: 동시에 실행할 작업 수
+            progress_interval: 진행률을 저장소에 기록하는 최소 간격(초)
+            max_attempts: 작업 하나를 시작할 수 있는 최대 횟수 (재시작으로 다시 실행되는 경우 포함)
+        """
+        self.store = store
+        self.max_workers = max(1, max_workers)
+        self.progress_interval = progress_interval
+        self.max_attempts = max(1, max_attempts)
+        self._runners = {}
+        self._queue = queue.Queue()
+        self._active = set()
+        self._closed = False
+        self._lock = threading.Lock()
+        for i in range(self.max_workers):
+            threading.Thread(target=self._worker, name=f"analysis-job_{i}", daemon=True).start()
+
+    def register(self, job_type: str, runner):
+        """작업 종류별 실행 함수를 등록합니다."""
+        self._runners[job_type] = runner
+
+    def submit(self, job_type: str, params: dict) -> str:
+        """작업을 등록하고 작업자 풀에 넣은 뒤 작업 ID를 반환합니다."""
+        if job_type not in self._runners:
+            raise ValueError(f"등록되지 않은 작업 종류입니다: {job_type}")
+        job_id = self.store.create(job_type, params)
+        self._enqueue(job_id)
+        print(f"[JobManager] 작업 등록: {job_type} ({job_id})")
+        return job_id
+
+    def _enqueue(self, job_id: str):
+        with self._lock:
+            if self._closed:
+                # 저장소에는 대기 상태로 남으므로 다음 실행 때 재개됩니다.
+                raise RuntimeError("JobManager가 이미 종료되었습니다.")
+            if job_id in self._active:
+                return
+            self._active.add(job_id)
+        self._queue.put(job_id)
+
+    def _worker(self):
+        while True:
+            job_id = self._queue.get()
+            if job_id is None:
+                return
+            self._run(job_id)
+
+    def resume_unfinished(self) -> int:
+        """서버 재시작 전에 끝나지 않은 작업을 다시 실행하고, 다시 실행한 작업 수를 반환합니다."""
+        job_ids = self.store.list_unfinished()
+        for job_id in job_ids:
+            self._enqueue(job_id)
+        if job_ids:
+            print(f"[JobManager] 끝나지 않은 작업 {len(job_ids)}개를 다시 실행합니다.")
+        return len(job_ids)
+
+    def _make_progress(self, job_id: str):
+        last_write = [0.0]
+
+        def progress(percent, desc=""):
+            now = time.monotonic()
+            if now - last_write[0] < self.progress_interval:
+                return
+            last_write[0] = now
+            try:
+                self.store.update_progress(job_id, float(percent), desc)
+            except Exception as e:
+                print(f"[JobManager] 진행률 기록 실패 ({job_id}): {e}")
+
+        return progress
+
+    def _run(self, job_id: str):
+        try:
+            job = self.store.get(job_id)
+            if job is None:
+                return
+            runner = self._runners.get(job["job_type"])
+            if runner is None:
+                self.store.mark_failed(job_id, f"등록되지 않은 작업 종류입니다: {job['job_type']}")
+                return
+            if job["attempts"] >= self.max_attempts:
+                print(f"[JobManager] 최대 시도 횟수 초과로 실패 처리: {job['job_type']} ({job_id})")
+                self.store.mark_failed(job_id, f"작업을 {job['attempts']}번 시작했지만 완료하지 못했습니다.")
+                return
+
+            self.store.mark_running(job_id)
+            print(f"[JobManager] 작업 시작: {job['job_type']} ({job_id}, {job['attempts'] + 1}번째 시도)")
+            result = runner(job["params"], self._make_progress(job_id))
+            if isinstance(result, dict) and "error" in result:
+                self.store.mark_failed(job_id, result["error"])
+            else:
+                self.store.mark_succeeded(job_id, result)
+            print(f"[JobManager] 작업 종료: {job['job_type']} ({job_id})")
+        except Exception as e:
+            traceback.print_exc()
+            self.store.mark_failed(job_id, str(e))
+        finally:
+            with self._lock:
+                self._active.discard(job_id)
+
+    def get(self, job_id: str) -> dict | None:
+        return self.store.get(job_id)
+
+    def shutdown(self):
+        """새 작업을 받지 않고, 대기 중인 작업은 다음 실행 때 재개되도록 그대로 둡니다."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        # 대기열의 작업은 저장소에 대기 상태로 남아 있으므로 버리고, 작업자마다 종료 신호를 넣습니다.
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        for _ in range(self.max_workers):
+            self._queue.put(None)
@@ -13,8 +13,7 @@ import matplotlib.dates as mdates
 from matplotlib import font_manager
 import datetime
 import uuid
-from src.data.festival_loader import load_festival_data
-from functools import lru_cache
+from src.data.festival_catalog import get_festival_catalog
 from src.infrastructure.web.naver_trend_api import get_trend_data
 
 # 프로젝트 루트
@@ -30,22 +29,12 @@ SEASON_COLORS = {
     "겨울": ["#000000", "#0B60B0", "#2081C3", "#40A2D8", "#F0EDCF"]
 }
 
-@lru_cache(maxsize=1)
 def get_festival_to_category_map():
     """
-    JSON 파일들을 읽어 {축제명: {cat1, cat2, cat3}} 형태의 역방향 맵을 생성합니다.
-    이 맵은 한 번만 생성되어 캐시됩니다.
+    {축제명: {cat1, cat2, cat3}} 형태의 역방향 맵을 반환합니다.
+    축제 카탈로그를 만들 때 함께 계산해 둔 맵의 읽기 전용 뷰이므로, 수정하려면 복사해서 사용하세요.
     """
-    print("[Cache] Creating festival-to-category map from JSON files...")
-    festival_data = load_festival_data()
-    mapping = {}
-    for cat1, cat1_data in festival_data.items():
-        for cat2, cat2_data in cat1_data.items():
-            for cat3, festivals in cat2_data.items():
-                for festival_name in festivals:
-                    mapping[festival_name] = {"cat1": cat1, "cat2": cat2, "cat3": cat3}
-    print(f"[Cache] Map created with {len(mapping)} entries.")
-    return mapping
+    return get_festival_catalog().category_map
 
 def load_seasonal_data(season: str = None):
     """
@@ -0,0 +1,107 @@
+# src/application/single_flight.py
+"""
+동일 작업 중복 실행 방지 (single-flight)
+
+캐시가 비어 있을 때 같은 키워드/리뷰 수 요청이 동시에 들어오면 각 요청이 크롤링과 LLM 분석을
+따로 실행하게 됩니다. SingleFlight는 같은 키의 작업이 이미 실행 중이면 새 요청(follower)을
+실행 중인 작업(leader)에 합류시켜 결과를 함께 받게 합니다.
+
+follower도 진행률 콜백을 넘기면 leader의 진행률을 함께 받으며, 늦게 합류한 경우에는
+마지막 진행률을 먼저 한 번 전달받습니다.
+"""
+import threading
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+        self._subscribers = []
+        self._last_progress = None
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback):
+        with self._lock:
+            self._subscribers.append(callback)
+            last_progress = self._last_progress
+        if last_progress is not None:
+            self._notify(callback, *last_progress)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def publish(self, percent, desc=""):
+        """leader 작업에 progress 콜백으로 넘겨지며, 모든 구독자에게 진행률을 전달합니다."""
+        with self._lock:
+            self._last_progress = (percent, desc)
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            self._notify(callback, percent, desc)
+
+    @staticmethod
+    def _notify(callback, percent, desc):
+        try:
+            callback(percent, desc=desc)
+        except Exception as e:
+            print(f"[SingleFlight] 진행률 전달 중 오류: {e}")
+
+
+class SingleFlight:
+    def __init__(self, name: str = "single-flight"):
+        self.name = name
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn, progress=None):
+        """
+        fn(progress)를 key 단위로 한 번만 실행하고 결과를 반환합니다.
+
+        같은 key의 작업이 실행 중이면 새로 실행하지 않고 완료될 때까지 기다렸다가 같은 결과를 반환합니다.
+        leader 작업이 예외로 끝나면 기다리던 요청에도 같은 예외가 전달됩니다.
+
+        Args:
+            key: 작업을 구분하는 키 (예: 분석 캐시 키)
+            fn: 진행률 콜백 하나를 인자로 받는 작업 함수
+            progress: 진행률을 받을 콜백 (percent, desc=""). None이면 진행률을 받지 않음
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = _Flight()
+                self._flights[key] = flight
+            else:
+                flight.followers += 1
+        if progress is not None:
+            flight.subscribe(progress)
+
+        if not is_leader:
+            print(f"[{self.name}] 실행 중인 동일 작업에 합류: {key} (대기 {flight.followers}건)")
+            try:
+                flight.done.wait()
+            finally:
+                if progress is not None:
+                    flight.unsubscribe(progress)
+            if flight.error is not None:
+                raise flight.error
+            return dict(flight.result) if isinstance(flight.result, dict) else flight.result
+
+        try:
+            flight.result = fn(flight.publish)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def in_flight(self) -> list:
+        """현재 실행 중인 작업 키 목록을 반환합니다."""
+        with self._lock:
+            return list(self._flights)
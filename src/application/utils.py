@@ -3,21 +3,21 @@ import os
 import pandas as pd
 import re
 import math
-import json
 import hashlib
-from datetime import datetime, timedelta
+from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 import traceback
 from ..infrastructure.llm_client import get_llm_client  # 상대 경로 임포트 수정
+from ..infrastructure.cache.analysis_cache_store import get_analysis_cache_backend
+from ..infrastructure.cache.memory_cache import get_memory_cache
 
 PAGE_SIZE = 10
 
-# 캐시 설정
-CACHE_DIR = "cache"
-CACHE_EXPIRY_DAYS = 30  # 캐시 만료 기간 (일)
+# 캐시 저장 위치와 만료 기간(30일)은 infrastructure/cache/analysis_cache_store.py 백엔드가 관리하고,
+# 복원까지 끝난 결과는 infrastructure/cache/memory_cache.py의 메모리 LRU에 보관합니다.
 
 
 def get_cache_key(keyword: str, num_reviews: int) -> str:
@@ -26,37 +26,58 @@ def get_cache_key(keyword: str, num_reviews: int) -> str:
     return hashlib.md5(key_str.encode("utf-8")).hexdigest()
 
 
-def get_cache_path(cache_key: str) -> str:
-    """캐시 파일 경로 반환"""
-    os.makedirs(CACHE_DIR, exist_ok=True)
-    return os.path.join(CACHE_DIR, f"{cache_key}.json")
+def _load_cached_value(cache_key: str, restore: bool = False):
+    """메모리 캐시 → 디스크 캐시 순서로 조회합니다. restore=True면 DataFrame/datetime을 복원해 보관합니다."""
+    memory_cache = get_memory_cache()
+    value = memory_cache.get(cache_key)
+    if value is not None:
+        return value
+
+    cached_data = get_analysis_cache_backend().get(cache_key)
+    if cached_data is None:
+        return None
+    value = _restore_cached_values(cached_data) if restore else cached_data
+    memory_cache.put(cache_key, value)
+    return dict(value)
 
 
-def is_cache_valid(cache_path: str) -> bool:
-    """캐시 파일이 유효한지 확인 (존재 여부 및 만료 기간)"""
-    if not os.path.exists(cache_path):
-        return False
+def _save_cached_value(cache_key: str, payload: dict, kind: str) -> None:
+    """디스크 캐시에 저장하고 메모리 캐시의 이전 값을 무효화합니다."""
+    get_analysis_cache_backend().put(cache_key, payload, kind=kind)
+    get_memory_cache().invalidate(cache_key)
 
-    # 캐시 파일 수정 시간 확인
-    file_mtime = datetime.fromtimestamp(os.path.getmtime(cache_path))
-    expiry_date = datetime.now() - timedelta(days=CACHE_EXPIRY_DAYS)
 
-    return file_mtime > expiry_date
+def _restore_cached_values(cached_data: dict) -> dict:
+    """캐시에 저장된 DataFrame/datetime 표현을 원래 객체로 복원합니다."""
+    restored_results = {}
+    for key, value in cached_data.items():
+        if isinstance(value, dict) and value.get("_type") == "DataFrame":
+            # DataFrame 복원
+            restored_results[key] = pd.DataFrame(
+                value["data"], columns=value["columns"]
+            )
+        elif isinstance(value, dict) and value.get("_type") == "datetime":
+            # datetime 복원
+            restored_results[key] = (
+                datetime.fromisoformat(value["value"])
+                if value["value"]
+                else None
+            )
+        else:
+            restored_results[key] = value
+    return restored_results
 
 
 def load_cached_analysis(keyword: str, num_reviews: int) -> dict:
     """캐시된 분석 결과 로드"""
     try:
         cache_key = get_cache_key(keyword, num_reviews)
-        cache_path = get_cache_path(cache_key)
-
-        if not is_cache_valid(cache_path):
+        cached_data = _load_cached_value(cache_key)
+        if cached_data is None:
             return None
 
-        with open(cache_path, "r", encoding="utf-8") as f:
-            cached_data = json.load(f)
-            print(f"✅ 캐시된 분석 결과 사용: {keyword} (num_reviews={num_reviews})")
-            return cached_data
+        print(f"✅ 캐시된 분석 결과 사용: {keyword} (num_reviews={num_reviews})")
+        return cached_data
     except Exception as e:
         print(f"⚠️ 캐시 로드 실패: {e}")
         return None
@@ -66,7 +87,6 @@ def save_analysis_to_cache(keyword: str, num_reviews: int, results: dict) -> Non
     """분석 결과를 캐시에 저장 (API 형식용)"""
     try:
         cache_key = get_cache_key(keyword, num_reviews)
-        cache_path = get_cache_path(cache_key)
 
         # pandas DataFrame을 dict로 변환할 수 있도록 처리
         cacheable_results = {}
@@ -81,9 +101,8 @@ def save_analysis_to_cache(keyword: str, num_reviews: int, results: dict) -> Non
                 # 직렬화할 수 없는 타입은 문자열로 변환
                 cacheable_results[key] = str(value)
 
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(cacheable_results, f, ensure_ascii=False, indent=2)
-            print(f"💾 분석 결과 캐시 저장: {keyword} (num_reviews={num_reviews})")
+        _save_cached_value(cache_key, cacheable_results, kind="api")
+        print(f"💾 분석 결과 캐시 저장: {keyword} (num_reviews={num_reviews})")
     except Exception as e:
         print(f"⚠️ 캐시 저장 실패 (분석은 계속 진행됨): {e}")
 
@@ -92,7 +111,6 @@ def save_raw_analysis_to_cache(keyword: str, num_reviews: int, results: dict) ->
     """원본 분석 결과를 캐시에 저장 (내부 재사용용)"""
     try:
         cache_key = get_cache_key(keyword, num_reviews) + "_raw"
-        cache_path = get_cache_path(cache_key)
 
         # pandas DataFrame과 datetime을 JSON 직렬화 가능하도록 변환
         cacheable_results = {}
@@ -123,9 +141,8 @@ def save_raw_analysis_to_cache(keyword: str, num_reviews: int, results: dict) ->
                 # 직렬화할 수 없는 타입은 문자열로 변환
                 cacheable_results[key] = str(value)
 
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(cacheable_results, f, ensure_ascii=False, indent=2)
-            print(f"💾 원본 분석 결과 캐시 저장: {keyword} (num_reviews={num_reviews})")
+        _save_cached_value(cache_key, cacheable_results, kind="raw")
+        print(f"💾 원본 분석 결과 캐시 저장: {keyword} (num_reviews={num_reviews})")
     except Exception as e:
         print(f"⚠️ 원본 캐시 저장 실패 (분석은 계속 진행됨): {e}")
 
@@ -134,36 +151,15 @@ def load_raw_cached_analysis(keyword: str, num_reviews: int) -> dict:
     """캐시된 원본 분석 결과 로드"""
     try:
         cache_key = get_cache_key(keyword, num_reviews) + "_raw"
-        cache_path = get_cache_path(cache_key)
-
-        if not is_cache_valid(cache_path):
+        # DataFrame과 datetime 복원 (메모리 캐시에는 복원된 결과를 보관)
+        restored_results = _load_cached_value(cache_key, restore=True)
+        if restored_results is None:
             return None
 
-        with open(cache_path, "r", encoding="utf-8") as f:
-            cached_data = json.load(f)
-
-            # DataFrame과 datetime 복원
-            restored_results = {}
-            for key, value in cached_data.items():
-                if isinstance(value, dict) and value.get("_type") == "DataFrame":
-                    # DataFrame 복원
-                    restored_results[key] = pd.DataFrame(
-                        value["data"], columns=value["columns"]
-                    )
-                elif isinstance(value, dict) and value.get("_type") == "datetime":
-                    # datetime 복원
-                    restored_results[key] = (
-                        datetime.fromisoformat(value["value"])
-                        if value["value"]
-                        else None
-                    )
-                else:
-                    restored_results[key] = value
-
-            print(
-                f"✅ 캐시된 원본 분석 결과 사용: {keyword} (num_reviews={num_reviews})"
-            )
-            return restored_results
+        print(
+            f"✅ 캐시된 원본 분석 결과 사용: {keyword} (num_reviews={num_reviews})"
+        )
+        return restored_results
     except Exception as e:
         print(f"⚠️ 원본 캐시 로드 실패: {e}")
         traceback.print_exc()
@@ -184,34 +180,15 @@ def load_category_cached_analysis(
         cache_key = (
             get_category_cache_key(cat1, cat2, cat3, num_reviews) + "_category_raw"
         )
-        cache_path = get_cache_path(cache_key)
-
-        if not is_cache_valid(cache_path):
+        # DataFrame과 datetime 복원 (메모리 캐시에는 복원된 결과를 보관)
+        restored_results = _load_cached_value(cache_key, restore=True)
+        if restored_results is None:
             return None
 
-        with open(cache_path, "r", encoding="utf-8") as f:
-            cached_data = json.load(f)
-
-            # DataFrame과 datetime 복원
-            restored_results = {}
-            for key, value in cached_data.items():
-                if isinstance(value, dict) and value.get("_type") == "DataFrame":
-                    restored_results[key] = pd.DataFrame(
-                        value["data"], columns=value["columns"]
-                    )
-                elif isinstance(value, dict) and value.get("_type") == "datetime":
-                    restored_results[key] = (
-                        datetime.fromisoformat(value["value"])
-                        if value["value"]
-                        else None
-                    )
-                else:
-                    restored_results[key] = value
-
-            print(
-                f"✅ 캐시된 카테고리 분석 결과 사용: {cat1}>{cat2}>{cat3} (num_reviews={num_reviews})"
-            )
-            return restored_results
+        print(
+            f"✅ 캐시된 카테고리 분석 결과 사용: {cat1}>{cat2}>{cat3} (num_reviews={num_reviews})"
+        )
+        return restored_results
     except Exception as e:
         print(f"⚠️ 카테고리 캐시 로드 실패: {e}")
         traceback.print_exc()
@@ -226,7 +203,6 @@ def save_category_analysis_to_cache(
         cache_key = (
             get_category_cache_key(cat1, cat2, cat3, num_reviews) + "_category_raw"
         )
-        cache_path = get_cache_path(cache_key)
 
         cacheable_results = {}
         for key, value in results.items():
@@ -262,11 +238,10 @@ def save_category_analysis_to_cache(
             else:
                 cacheable_results[key] = str(value)
 
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(cacheable_results, f, ensure_ascii=False, indent=2)
-            print(
-                f"💾 카테고리 분석 결과 캐시 저장: {cat1}>{cat2}>{cat3} (num_reviews={num_reviews})"
-            )
+        _save_cached_value(cache_key, cacheable_results, kind="category_raw")
+        print(
+            f"💾 카테고리 분석 결과 캐시 저장: {cat1}>{cat2}>{cat3} (num_reviews={num_reviews})"
+        )
     except Exception as e:
         print(f"⚠️ 카테고리 캐시 저장 실패 (분석은 계속 진행됨): {e}")
 
@@ -402,25 +377,37 @@ def create_festinsight_table(results: dict, keyword: str) -> pd.DataFrame:
 
 
 def create_festinsight_table_for_category(
-    results: dict, category_name: str
+    results: dict, category_name: str, festival_details: dict = None
 ) -> pd.DataFrame:
-    """카테고리 분석 결과를 FestInsight_Analysis_Table 형식으로 변환합니다."""
+    """
+    카테고리 분석 결과를 FestInsight_Analysis_Table 형식으로 변환합니다.
+
+    festival_details: {축제명: 축제 정보} (get_festival_details_bulk 결과). None이면 축제 목록 전체를 한 번에 조회합니다.
+    """
     try:
         festival_results = results.get("individual_festival_results_df", pd.DataFrame())
 
         if festival_results.empty:
             return pd.DataFrame()
 
+        if festival_details is None:
+            from ..infrastructure.web.tour_api_client import get_festival_details_bulk
+
+            festival_details = get_festival_details_bulk(
+                [name for name in festival_results.get("축제명", []) if isinstance(name, str)]
+            )
+
         # 기존 축제 요약 데이터프레임을 FestInsight 형식으로 변환
         table_data_list = []
         for _, row in festival_results.iterrows():
+            details = festival_details.get(row.get("축제명")) or {}
             table_data = {
                 "keyword": row.get("축제명", "N/A"),
-                "addr1": "N/A",
-                "addr2": "N/A",
-                "areaCode": "N/A",
-                "eventStartDate": "N/A",
-                "eventEndDate": "N/A",
+                "addr1": details.get("addr1") or "N/A",
+                "addr2": details.get("addr2") or "N/A",
+                "areaCode": details.get("areacode") or "N/A",
+                "eventStartDate": details.get("start_date") or "N/A",
+                "eventEndDate": details.get("end_date") or "N/A",
                 "eventPeriod": row.get("축제 기간 (일)", "N/A"),
                 "trend_index": row.get("트렌드 지수 (%)", "N/A"),
                 "sentiment_score": row.get("감성 점수", "N/A"),
@@ -53,5 +53,126 @@ def get_google_api_key():
         return None
     return api_key
 
+def _get_int_env(name: str, default: int, minimum: int = 1) -> int:
+    """정수형 환경 변수를 읽습니다. 값이 없거나 잘못된 경우 기본값을 사용합니다."""
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return max(minimum, int(value))
+    except ValueError:
+        print(f"Warning: {name} must be an integer (got '{value}'). Using default {default}.")
+        return default
+
+def _get_float_env(name: str, default: float) -> float:
+    """실수형 환경 변수를 읽습니다. 값이 없거나 잘못된 경우 기본값을 사용합니다."""
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        print(f"Warning: {name} must be a number (got '{value}'). Using default {default}.")
+        return default
+
+def _get_bool_env(name: str, default: bool) -> bool:
+    """불리언 환경 변수를 읽습니다. (true/1/yes/on 이면 True)"""
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in ("true", "1", "yes", "on")
+
+def get_analysis_max_workers():
+    """블로그 후보를 동시에 크롤링/평가할 작업자 수를 반환합니다. (1이면 순차 처리)"""
+    return _get_int_env("ANALYSIS_MAX_WORKERS", 1)
+
+def get_group_analysis_max_workers():
+    """카테고리/그룹 분석에서 동시에 분석할 축제 수를 반환합니다. (1이면 순차 처리)"""
+    return _get_int_env("GROUP_ANALYSIS_MAX_WORKERS", 1)
+
+def get_job_max_workers():
+    """백그라운드 분석 작업을 동시에 실행할 작업자 수를 반환합니다."""
+    return _get_int_env("JOB_MAX_WORKERS", 1)
+
+def get_job_max_attempts():
+    """백그라운드 작업 하나를 (서버 재시작으로 다시 실행하는 경우 포함) 최대 몇 번 시작할지 반환합니다."""
+    return _get_int_env("JOB_MAX_ATTEMPTS", 3)
+
+def get_webdriver_pool_size():
+    """API 서버가 동시에 유지할 최대 WebDriver 수를 반환합니다."""
+    return _get_int_env("WEBDRIVER_POOL_SIZE", 2)
+
+def get_webdriver_max_pages():
+    """WebDriver 하나가 재생성 전까지 처리할 최대 페이지 수를 반환합니다."""
+    return _get_int_env("WEBDRIVER_MAX_PAGES", 200)
+
+def is_scraper_fast_path_enabled():
+    """블로그 본문을 브라우저 없이 HTTP로 먼저 가져올지 여부를 반환합니다."""
+    return _get_bool_env("SCRAPER_HTTP_FAST_PATH", True)
+
+def get_blog_content_ttl_days():
+    """크롤링한 블로그 본문을 재사용할 기간(일)을 반환합니다."""
+    return _get_int_env("BLOG_CONTENT_TTL_DAYS", 30)
+
+def get_batch_validation_size():
+    """후보 블로그를 한 번의 LLM 요청으로 일괄 검증할 개수를 반환합니다. (0이면 사용하지 않음)"""
+    return _get_int_env("BATCH_VALIDATION_SIZE", 0, minimum=0)
+
+def get_analysis_cache_backend_name():
+    """분석 결과 캐시 백엔드 이름을 반환합니다. ('sqlite' 또는 'json')"""
+    value = (os.getenv("ANALYSIS_CACHE_BACKEND") or "sqlite").strip().lower()
+    if value not in ("sqlite", "json"):
+        print(f"Warning: ANALYSIS_CACHE_BACKEND must be 'sqlite' or 'json' (got '{value}'). Using 'sqlite'.")
+        return "sqlite"
+    return value
+
+def get_analysis_memory_cache_mb():
+    """분석 결과 메모리 캐시의 최대 크기(MB)를 반환합니다. (0이면 사용하지 않음)"""
+    return _get_int_env("ANALYSIS_MEMORY_CACHE_MB", 256, minimum=0)
+
+def get_prefilter_enabled():
+    """LLM 관련성 검증 전 규칙 기반 사전 필터 사용 여부를 반환합니다. (관련성 정확도를 측정하기 전까지 기본값은 사용 안 함)"""
+    return _get_bool_env("PREFILTER_ENABLED", False)
+
+def get_prefilter_threshold():
+    """규칙 기반 사전 필터의 통과 기준 점수를 반환합니다. 점수가 이보다 낮은 글만 LLM 검증 없이 제외합니다."""
+    return _get_float_env("PREFILTER_THRESHOLD", 0.2)
+
+def get_naver_search_qps():
+    """네이버 블로그 검색 API의 초당 최대 호출 수를 반환합니다. (0 이하면 제한 없음)"""
+    return _get_float_env("NAVER_SEARCH_QPS", 10.0)
+
+def get_naver_search_concurrency():
+    """키워드 하나의 블로그 검색에서 동시에 요청할 검색 결과 페이지 수를 반환합니다."""
+    return _get_int_env("NAVER_SEARCH_CONCURRENCY", 3)
+
+def get_naver_http_pool_size():
+    """네이버 오픈 API 공유 HTTP 클라이언트가 유지할 최대 연결 수를 반환합니다."""
+    return _get_int_env("NAVER_HTTP_POOL_SIZE", 10)
+
+def get_naver_http_timeout():
+    """네이버 오픈 API 요청의 기본 타임아웃(초)을 반환합니다."""
+    return _get_float_env("NAVER_HTTP_TIMEOUT", 10.0)
+
+def get_naver_http_retries():
+    """네이버 오픈 API 요청이 연결 오류나 429/5xx 응답으로 실패했을 때 재시도할 횟수를 반환합니다."""
+    return _get_int_env("NAVER_HTTP_RETRIES", 3, minimum=0)
+
+def get_trend_refresh_hours():
+    """저장된 검색어 트렌드 중 최근 며칠의 값을 다시 받기까지의 시간을 반환합니다."""
+    return _get_float_env("TREND_REFRESH_HOURS", 12.0)
+
+def get_db_mmap_size_mb():
+    """tour_data.db 읽기 연결이 메모리 매핑할 최대 크기(MB)를 반환합니다. (0이면 사용하지 않음)"""
+    return _get_int_env("DB_MMAP_SIZE_MB", 64, minimum=0)
+
+def get_db_cache_size_mb():
+    """tour_data.db 읽기 연결 하나가 사용할 페이지 캐시 크기(MB)를 반환합니다."""
+    return _get_int_env("DB_CACHE_SIZE_MB", 8)
+
+def get_db_read_immutable():
+    """tour_data.db를 변경되지 않는 파일(immutable)로 열지 여부를 반환합니다."""
+    return _get_bool_env("DB_READ_IMMUTABLE", False)
+
 # 초기 환경 설정 실행
 setup_environment()
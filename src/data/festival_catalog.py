@@ -0,0 +1,205 @@
+# src/data/festival_catalog.py
+"""
+축제 분류 카탈로그
+
+festivals/*.json의 대분류 → 중분류 → 소분류 → 축제 목록을 한 번만 읽어, 조회에 필요한 결과를 미리 계산해 둡니다.
+
+- 축제 이름은 sys.intern으로 공유하고, 이름 정렬 순서대로 정수 ID를 부여합니다.
+- 대분류/중분류/소분류 노드마다 하위 축제 전체를 중복 제거·정렬한 목록과 하위 분류 목록을 미리 만들어 둡니다.
+- 축제 이름 → 분류(cat1, cat2, cat3) 역방향 맵도 함께 만듭니다. 프로세스 전체가 공유하므로 읽기 전용 뷰로만 내보냅니다.
+- 만든 카탈로그는 cache/festival_catalog.pkl에 저장하고, JSON 파일이 바뀌지 않았으면(수정 시각, 크기) 다음 실행에서 그대로 불러옵니다.
+"""
+import json
+import os
+import pickle
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+FESTIVALS_DIR = os.path.join(PROJECT_ROOT, "festivals")
+SNAPSHOT_PATH = os.path.join(PROJECT_ROOT, "cache", "festival_catalog.pkl")
+SNAPSHOT_VERSION = 2
+
+CATEGORY_FILES = [
+    "festivals_type_계절과_자연.json",
+    "festivals_type_도시와_커뮤니티.json",
+    "festivals_type_레저와_스포츠.json",
+    "festivals_type_문화와_예술.json",
+    "festivals_type_미식과_특산물.json",
+    "festivals_type_전통과_역사.json",
+    "festivals_type_종교와_영성.json",
+    "festivals_type_체험과_교육.json",
+]
+
+
+def _strip_keys(pairs):
+    """json.load의 object_pairs_hook: 파싱하면서 키의 앞뒤 공백을 제거합니다."""
+    return {key.strip(): value for key, value in pairs}
+
+
+class FestivalCatalog:
+    def __init__(self, tree: dict):
+        """
+        Args:
+            tree: {대분류: {중분류: {소분류: [축제 이름, ...]}}} (키의 공백은 제거된 상태)
+        """
+        self.tree = tree
+        self.names = tuple(sorted({
+            sys.intern(name)
+            for cat2_data in tree.values() for cat3_data in cat2_data.values()
+            for festivals in cat3_data.values() for name in festivals
+        }))
+        self.ids = {name: festival_id for festival_id, name in enumerate(self.names)}
+
+        self.cat1_choices = list(tree.keys())
+        self.cat2_choices = {cat1: list(cat2_data.keys()) for cat1, cat2_data in tree.items()}
+        self.cat3_choices = {
+            (cat1, cat2): list(cat3_data.keys())
+            for cat1, cat2_data in tree.items() for cat2, cat3_data in cat2_data.items()
+        }
+
+        # (cat1,), (cat1, cat2), (cat1, cat2, cat3) → 정렬된 축제 이름 목록 (중복 제거)
+        self.members = {}
+        self._category_map = {}
+        self._category_view = None
+        for cat1, cat2_data in tree.items():
+            cat1_ids = set()
+            for cat2, cat3_data in cat2_data.items():
+                cat2_ids = set()
+                for cat3, festivals in cat3_data.items():
+                    cat3_ids = {self.ids[name] for name in festivals}
+                    self.members[(cat1, cat2, cat3)] = self._names_of(cat3_ids)
+                    cat2_ids |= cat3_ids
+                    for name in festivals:
+                        self._category_map[self.names[self.ids[name]]] = {"cat1": cat1, "cat2": cat2, "cat3": cat3}
+                self.members[(cat1, cat2)] = self._names_of(cat2_ids)
+                cat1_ids |= cat2_ids
+            self.members[(cat1,)] = self._names_of(cat1_ids)
+
+    def __getstate__(self):
+        # MappingProxyType은 pickle할 수 없으므로 읽기 전용 뷰는 스냅샷에서 빼고 불러온 뒤 다시 만듭니다.
+        state = dict(self.__dict__)
+        state["_category_view"] = None
+        return state
+
+    @property
+    def category_map(self):
+        """{축제명: {cat1, cat2, cat3}} 역방향 맵의 읽기 전용 뷰 (바깥 맵과 각 분류 dict 모두 수정할 수 없음)"""
+        if self._category_view is None:
+            self._category_view = MappingProxyType({
+                name: MappingProxyType(categories) for name, categories in self._category_map.items()
+            })
+        return self._category_view
+
+    def _names_of(self, festival_ids: set) -> tuple:
+        # ID가 이름 정렬 순서이므로 ID로 정렬하면 이름순이 됩니다.
+        return tuple(self.names[festival_id] for festival_id in sorted(festival_ids))
+
+    def get_cat2_choices(self, cat1: str) -> list:
+        if not cat1:
+            return []
+        return list(self.cat2_choices.get(cat1.strip(), ()))
+
+    def get_cat3_choices(self, cat1: str, cat2: str) -> list:
+        if not cat1 or not cat2:
+            return []
+        return list(self.cat3_choices.get((cat1.strip(), cat2.strip()), ()))
+
+    def get_festivals(self, cat1: str, cat2: str = None, cat3: str = None) -> list:
+        """선택된 분류에 속한 축제를 이름순으로 반환합니다. 중분류 없이 소분류만 지정하면 빈 목록"""
+        if not cat1 or (cat3 and not cat2):
+            return []
+        key = tuple(cat.strip() for cat in (cat1, cat2, cat3) if cat)
+        return list(self.members.get(key, ()))
+
+    def festival_id(self, festival_name: str) -> int | None:
+        """축제 이름의 정수 ID (카탈로그에 없으면 None)"""
+        return self.ids.get(festival_name)
+
+
+def _source_signature() -> list:
+    """JSON 파일별 (파일명, 수정 시각, 크기). 스냅샷이 최신인지 확인하는 데 사용합니다."""
+    signature = []
+    for filename in CATEGORY_FILES:
+        try:
+            stat = os.stat(os.path.join(FESTIVALS_DIR, filename))
+            signature.append((filename, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append((filename, None, None))
+    return signature
+
+
+def _load_tree() -> dict:
+    """각 파일이 대분류를 최상위 키로 갖는 구조에 맞춰 데이터를 로드하고 합칩니다."""
+    combined_data = {}
+    for filename in CATEGORY_FILES:
+        file_path = os.path.join(FESTIVALS_DIR, filename)
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                combined_data.update(json.load(f, object_pairs_hook=_strip_keys))
+        except FileNotFoundError:
+            print(f"Warning: Festival JSON file not found at {file_path}")
+            continue
+        except json.JSONDecodeError:
+            print(f"Warning: Could not decode JSON from {file_path}")
+            continue
+    return combined_data
+
+
+def _load_snapshot(signature: list) -> FestivalCatalog | None:
+    try:
+        with open(SNAPSHOT_PATH, "rb") as f:
+            snapshot = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Warning: Could not load festival catalog snapshot ({e}). Rebuilding.")
+        return None
+    if snapshot.get("version") != SNAPSHOT_VERSION or snapshot.get("signature") != signature:
+        return None
+    return snapshot["catalog"]
+
+
+def _save_snapshot(catalog: FestivalCatalog, signature: list):
+    tmp_path = f"{SNAPSHOT_PATH}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(SNAPSHOT_PATH), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"version": SNAPSHOT_VERSION, "signature": signature, "catalog": catalog}, f, protocol=5)
+        os.replace(tmp_path, SNAPSHOT_PATH)
+    except OSError as e:
+        print(f"Warning: Could not save festival catalog snapshot: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def build_festival_catalog(use_snapshot: bool = True) -> FestivalCatalog:
+    """
+    카탈로그를 만듭니다. use_snapshot이면 JSON 파일이 바뀌지 않은 스냅샷을 불러오고,
+    없거나 오래되었으면 JSON에서 새로 만들어 스냅샷으로 저장합니다.
+    """
+    signature = _source_signature()
+    if use_snapshot:
+        catalog = _load_snapshot(signature)
+        if catalog is not None:
+            return catalog
+    catalog = FestivalCatalog(_load_tree())
+    if use_snapshot:
+        _save_snapshot(catalog, signature)
+    return catalog
+
+
+@lru_cache(maxsize=1)
+def get_festival_catalog() -> FestivalCatalog:
+    """프로세스 전체에서 공유하는 축제 카탈로그를 반환합니다."""
+    return build_festival_catalog()
+
+
+if __name__ == "__main__":
+    # 스냅샷 미리 만들기: python -m src.data.festival_catalog
+    # (__main__이 아닌 모듈 경로로 클래스를 pickle하도록 패키지에서 다시 import합니다.)
+    from src.data import festival_catalog as module
+    catalog = module.build_festival_catalog(use_snapshot=False)
+    module._save_snapshot(catalog, module._source_signature())
+    print(f"[OK] 축제 카탈로그 저장: {len(catalog.names)}개 축제, {len(catalog.members)}개 분류 → {SNAPSHOT_PATH}")
@@ -11,3 +11,7 @@ class LLMGraphState(TypedDict):
     feedback_message: str | None
     re_summarize_count: int
     aspect_sentiment_pairs: List[tuple]  # (주체, 감성표현) 쌍을 저장
+    prefilter_score: float  # 규칙 기반 사전 필터 점수
+    prefilter_rejected: bool  # 사전 필터에서 제외되어 LLM 검증을 생략했는지 여부
+    pre_validated: bool  # 일괄 검증에서 이미 관련 글로 판별되었는지 여부
+    llm_error: bool  # LLM 호출 오류 여부 (오류가 난 결과는 재사용하지 않음)
@@ -0,0 +1 @@
+# src/infrastructure/cache/__init__.py
@@ -0,0 +1,262 @@
+# src/infrastructure/cache/analysis_cache_store.py
+"""
+분석 결과 캐시 저장소
+
+utils.py의 load_*/save_* 함수가 사용하는 저장 백엔드입니다. 저장하는 값(payload)은
+utils.py에서 JSON 호환 형태로 변환한 dict이며, 백엔드는 캐시 키 단위로 저장/조회만 담당합니다.
+
+- sqlite (기본값): cache/analysis_cache.db 한 파일에 pickle(protocol 5) + zlib으로 압축해 저장합니다.
+  종류(kind), 크기, 생성/만료 시각을 함께 기록해 인덱스 조회, 용량 집계, 일괄 삭제를 지원합니다.
+  SQLite에 없는 키는 기존 JSON 캐시 파일에서 찾아 옮겨 담습니다.
+  zstd/msgpack은 프로젝트 의존성이 아니어서 표준 라이브러리의 zlib과 pickle을 사용합니다.
+  pickle은 읽는 순간 임의의 코드를 실행할 수 있으므로, 이 서버가 직접 쓴 캐시 디렉터리만 사용하고
+  다른 곳에서 받은(신뢰할 수 없는) analysis_cache.db를 넣어 두지 마세요.
+- json: 기존과 같이 cache/{cache_key}.json 파일에 저장하고 파일 수정 시각으로 만료를 판단합니다.
+"""
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+
+from src.config import get_analysis_cache_backend_name
+
+# 기존 JSON 캐시(utils.CACHE_DIR)와 같은 위치를 사용합니다.
+DEFAULT_CACHE_DIR = "cache"
+DEFAULT_TTL_DAYS = 30
+
+
+class JsonFileCacheBackend:
+    """캐시 키마다 JSON 파일 하나를 사용하는 기존 방식의 백엔드"""
+
+    name = "json"
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl_days: int = DEFAULT_TTL_DAYS):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+
+    def _path(self, cache_key: str) -> str:
+        return os.path.join(self.cache_dir, f"{cache_key}.json")
+
+    def get(self, cache_key: str):
+        path = self._path(cache_key)
+        if not os.path.exists(path):
+            return None
+        if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def mtime(self, cache_key: str):
+        """캐시 파일의 수정 시각을 반환합니다. 파일이 없으면 None"""
+        path = self._path(cache_key)
+        return os.path.getmtime(path) if os.path.exists(path) else None
+
+    def put(self, cache_key: str, payload: dict, kind: str):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self._path(cache_key), "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+
+    def delete(self, cache_key: str):
+        path = self._path(cache_key)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _json_files(self):
+        if not os.path.isdir(self.cache_dir):
+            return []
+        return [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir) if name.endswith(".json")]
+
+    def evict_expired(self) -> int:
+        removed = 0
+        now = time.time()
+        for path in self._json_files():
+            if now - os.path.getmtime(path) > self.ttl_seconds:
+                os.remove(path)
+                removed += 1
+        return removed
+
+    def stats(self) -> dict:
+        files = self._json_files()
+        return {
+            "backend": self.name,
+            "entries": len(files),
+            "size_bytes": sum(os.path.getsize(path) for path in files),
+        }
+
+
+class SQLiteCacheBackend:
+    """하나의 SQLite 파일에 압축된 바이너리로 저장하는 백엔드"""
+
+    name = "sqlite"
+
+    def __init__(self, db_path: str = None, ttl_days: int = DEFAULT_TTL_DAYS, legacy_backend: JsonFileCacheBackend = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (기본값: cache/analysis_cache.db)
+            ttl_days: 캐시 유효 기간(일)
+            legacy_backend: SQLite에 없는 키를 찾아볼 기존 JSON 백엔드. None이면 사용하지 않음
+        """
+        self.db_path = db_path or os.path.join(DEFAULT_CACHE_DIR, "analysis_cache.db")
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.legacy_backend = legacy_backend
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._initialize()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _initialize(self):
+        conn = self._connect()
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS analysis_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_analysis_cache_expires_at ON analysis_cache(expires_at)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_analysis_cache_kind ON analysis_cache(kind)')
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _encode(payload: dict) -> bytes:
+        return zlib.compress(pickle.dumps(payload, protocol=5), 3)
+
+    @staticmethod
+    def _decode(blob: bytes) -> dict:
+        return pickle.loads(zlib.decompress(blob))
+
+    def get(self, cache_key: str):
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                'SELECT payload, expires_at FROM analysis_cache WHERE cache_key = ?', (cache_key,)
+            ).fetchone()
+        finally:
+            conn.close()
+
+        if row is not None:
+            payload, expires_at = row
+            if expires_at > time.time():
+                return self._decode(payload)
+            return None
+
+        # 기존 JSON 캐시 파일이 남아 있으면 한 번 읽어서 SQLite로 옮깁니다.
+        if self.legacy_backend is not None:
+            payload = self.legacy_backend.get(cache_key)
+            if payload is not None:
+                # 만료 시각이 늘어나지 않도록 원래 파일의 저장 시각을 유지합니다.
+                self.put(cache_key, payload, kind=self._guess_kind(cache_key),
+                         created_at=self.legacy_backend.mtime(cache_key))
+                return payload
+        return None
+
+    @staticmethod
+    def _guess_kind(cache_key: str) -> str:
+        if cache_key.endswith("_category_raw"):
+            return "category_raw"
+        if cache_key.endswith("_raw"):
+            return "raw"
+        return "api"
+
+    def put(self, cache_key: str, payload: dict, kind: str, created_at: float = None):
+        blob = self._encode(payload)
+        created_at = created_at or time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO analysis_cache (cache_key, kind, payload, size_bytes, created_at, expires_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (cache_key, kind, blob, len(blob), created_at, created_at + self.ttl_seconds)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def delete(self, cache_key: str):
+        conn = self._connect()
+        try:
+            conn.execute('DELETE FROM analysis_cache WHERE cache_key = ?', (cache_key,))
+            conn.commit()
+        finally:
+            conn.close()
+        if self.legacy_backend is not None:
+            self.legacy_backend.delete(cache_key)
+
+    def evict(self, kind: str = None, created_before: float = None) -> int:
+        """조건에 맞는 캐시를 일괄 삭제하고 삭제한 개수를 반환합니다. 조건이 없으면 전체 삭제"""
+        clauses, params = [], []
+        if kind is not None:
+            clauses.append("kind = ?")
+            params.append(kind)
+        if created_before is not None:
+            clauses.append("created_at < ?")
+            params.append(created_before)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        conn = self._connect()
+        try:
+            cursor = conn.execute(f'DELETE FROM analysis_cache{where}', params)
+            conn.commit()
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    def evict_expired(self) -> int:
+        """만료된 캐시를 삭제하고 삭제한 개수를 반환합니다."""
+        conn = self._connect()
+        try:
+            cursor = conn.execute('DELETE FROM analysis_cache WHERE expires_at <= ?', (time.time(),))
+            conn.commit()
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    def stats(self) -> dict:
+        """종류별 항목 수와 압축된 크기를 반환합니다."""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                'SELECT kind, COUNT(*), COALESCE(SUM(size_bytes), 0) FROM analysis_cache GROUP BY kind'
+            ).fetchall()
+            expired = conn.execute(
+                'SELECT COUNT(*) FROM analysis_cache WHERE expires_at <= ?', (time.time(),)
+            ).fetchone()[0]
+        finally:
+            conn.close()
+        return {
+            "backend": self.name,
+            "entries": sum(count for _, count, _ in rows),
+            "size_bytes": sum(size for _, _, size in rows),
+            "expired": expired,
+            "by_kind": {kind: {"entries": count, "size_bytes": size} for kind, count, size in rows},
+        }
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_analysis_cache_backend():
+    """ANALYSIS_CACHE_BACKEND 설정에 맞는 분석 캐시 백엔드를 반환합니다."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                legacy = JsonFileCacheBackend()
+                if get_analysis_cache_backend_name() == "json":
+                    _backend = legacy
+                else:
+                    _backend = SQLiteCacheBackend(legacy_backend=legacy)
+                print(f"[AnalysisCache] '{_backend.name}' 백엔드 사용")
+    return _backend
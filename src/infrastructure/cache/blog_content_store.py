@@ -0,0 +1,160 @@
+# src/infrastructure/cache/blog_content_store.py
+"""
+크롤링한 블로그 본문 저장소
+
+같은 블로그 글이 여러 키워드, 여러 num_reviews 값, 겹치는 축제의 카테고리 분석에 반복해서
+등장하므로, 본문을 정규화된 글 주소(blogId/logNo)를 키로 SQLite에 압축 저장해 두고
+네트워크 요청 전에 먼저 조회합니다.
+
+- 본문은 zlib으로 압축해 저장합니다.
+- 가져온 시각(fetched_at)과 TTL을 함께 기록하고, TTL이 지난 본문은 없는 것으로 취급합니다.
+- 본문의 SHA-1 해시(content_hash)를 함께 저장합니다.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from ..web.scraper import parse_blog_post_id
+from src.config import get_blog_content_ttl_days
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+DEFAULT_DB_PATH = os.path.join(PROJECT_ROOT, "cache", "blog_contents.db")
+
+
+def normalize_blog_url(url: str) -> str | None:
+    """블로그 URL을 'blogId/logNo' 형태의 저장 키로 변환합니다. 네이버 블로그 글이 아니면 None"""
+    post_id = parse_blog_post_id(url)
+    if not post_id:
+        return None
+    blog_id, log_no = post_id
+    return f"{blog_id}/{log_no}"
+
+
+def content_hash(content: str) -> str:
+    """본문 텍스트의 SHA-1 해시를 반환합니다."""
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+class BlogContentStore:
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, ttl_days: int = 30):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            ttl_days: 저장한 본문의 유효 기간(일)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "writes": 0}
+        self._stats_lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._initialize()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _initialize(self):
+        conn = self._connect()
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS blog_contents (
+                    post_key TEXT PRIMARY KEY,
+                    url TEXT,
+                    content BLOB NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    ttl_seconds REAL NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_blog_contents_fetched_at ON blog_contents(fetched_at)')
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def get(self, url: str) -> str | None:
+        """저장된 본문을 반환합니다. 없거나 TTL이 지났으면 None을 반환합니다."""
+        post_key = normalize_blog_url(url)
+        if not post_key:
+            return None
+
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                'SELECT content, fetched_at, ttl_seconds FROM blog_contents WHERE post_key = ?',
+                (post_key,)
+            ).fetchone()
+        finally:
+            conn.close()
+
+        if row is None:
+            self._count("misses")
+            return None
+        content, fetched_at, ttl_seconds = row
+        if time.time() - fetched_at > ttl_seconds:
+            self._count("expired")
+            return None
+        self._count("hits")
+        return zlib.decompress(content).decode("utf-8")
+
+    def put(self, url: str, content: str):
+        """본문을 압축해 저장합니다. 이미 있으면 새 본문과 가져온 시각으로 덮어씁니다."""
+        post_key = normalize_blog_url(url)
+        if not post_key or not content:
+            return
+
+        compressed = zlib.compress(content.encode("utf-8"), 6)
+        conn = self._connect()
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO blog_contents '
+                '(post_key, url, content, content_hash, fetched_at, ttl_seconds) VALUES (?, ?, ?, ?, ?, ?)',
+                (post_key, url, compressed, content_hash(content), time.time(), self.ttl_seconds)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        self._count("writes")
+
+    def purge_expired(self) -> int:
+        """TTL이 지난 본문을 삭제하고 삭제한 개수를 반환합니다."""
+        conn = self._connect()
+        try:
+            cursor = conn.execute('DELETE FROM blog_contents WHERE fetched_at + ttl_seconds < ?', (time.time(),))
+            conn.commit()
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    def stats(self) -> dict:
+        """저장된 글 수, 압축 크기, 누적 조회 통계를 반환합니다."""
+        conn = self._connect()
+        try:
+            count, size = conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(LENGTH(content)), 0) FROM blog_contents'
+            ).fetchone()
+        finally:
+            conn.close()
+        with self._stats_lock:
+            return {"entries": count, "compressed_bytes": size, **self._stats}
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_blog_content_store() -> BlogContentStore:
+    """프로세스 전체에서 공유하는 BlogContentStore를 반환합니다."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = BlogContentStore(ttl_days=get_blog_content_ttl_days())
+    return _store
@@ -0,0 +1,166 @@
+# src/infrastructure/cache/category_checkpoint_store.py
+"""
+카테고리(그룹) 분석 체크포인트 저장소
+
+카테고리 분석은 모든 축제가 끝나야 결과 캐시를 저장하므로, 중간에 서버가 죽거나 작업이 중단되면
+끝난 축제의 분석도 다시 해야 합니다. 축제 하나가 끝날 때마다 그 결과(DataFrame 포함)를
+실행 키(카테고리 캐시 키) 단위로 저장해 두고, 다시 실행하면 끝난 축제는 건너뜁니다.
+
+- checkpoint_runs: 실행 키별 그룹 이름, 축제 목록, 시작 시각 (매니페스트)
+- checkpoint_festivals: 완료된 축제별 결과 (pickle + zlib). 후기를 찾지 못한 축제도 완료로 기록하지만,
+  검색/LLM 오류나 취소처럼 다시 시도해야 하는 실패는 호출 측에서 기록하지 않습니다.
+
+집계가 끝난 실행의 체크포인트도 바로 지우지 않고 남겨 두어, 크롤링 없이 집계만 다시 계산할 때 사용합니다.
+유효 기간(max_age_days)이 지난 체크포인트는 같은 실행 키로 다시 시작할 때 삭제됩니다.
+pickle은 읽을 때 코드를 실행할 수 있으므로 신뢰할 수 없는 곳에서 받은 DB 파일은 사용하지 마세요.
+"""
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+DEFAULT_DB_PATH = os.path.join(PROJECT_ROOT, "cache", "category_checkpoints.db")
+DEFAULT_MAX_AGE_DAYS = 30
+
+
+class CategoryCheckpointStore:
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, max_age_days: int = DEFAULT_MAX_AGE_DAYS):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            max_age_days: 체크포인트 유효 기간(일). 분석 캐시와 같이 오래된 결과는 다시 분석합니다.
+        """
+        self.db_path = db_path
+        self.max_age_seconds = max_age_days * 24 * 60 * 60
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._initialize()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _initialize(self):
+        conn = self._connect()
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS checkpoint_runs (
+                    run_key TEXT PRIMARY KEY,
+                    group_name TEXT NOT NULL,
+                    festivals TEXT NOT NULL,
+                    started_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS checkpoint_festivals (
+                    run_key TEXT NOT NULL,
+                    festival_name TEXT NOT NULL,
+                    has_result INTEGER NOT NULL,
+                    result BLOB,
+                    completed_at REAL NOT NULL,
+                    PRIMARY KEY (run_key, festival_name)
+                )
+            ''')
+            conn.commit()
+        finally:
+            conn.close()
+
+    def start(self, run_key: str, group_name: str, festivals: list) -> dict:
+        """
+        실행을 시작(또는 재개)하고, 이미 끝난 축제의 결과를 {축제명: 결과 또는 None} 형태로 반환합니다.
+        유효 기간이 지난 체크포인트는 삭제하고 새로 시작합니다.
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT started_at FROM checkpoint_runs WHERE run_key = ?', (run_key,)).fetchone()
+            if row is not None and now - row[0] > self.max_age_seconds:
+                conn.execute('DELETE FROM checkpoint_festivals WHERE run_key = ?', (run_key,))
+                conn.execute('DELETE FROM checkpoint_runs WHERE run_key = ?', (run_key,))
+                row = None
+            if row is None:
+                conn.execute(
+                    'INSERT INTO checkpoint_runs (run_key, group_name, festivals, started_at, updated_at) VALUES (?, ?, ?, ?, ?)',
+                    (run_key, group_name, json.dumps(festivals, ensure_ascii=False), now, now)
+                )
+            else:
+                conn.execute(
+                    'UPDATE checkpoint_runs SET group_name = ?, festivals = ?, updated_at = ? WHERE run_key = ?',
+                    (group_name, json.dumps(festivals, ensure_ascii=False), now, run_key)
+                )
+            conn.commit()
+        finally:
+            conn.close()
+        return self.load_results(run_key)
+
+    def load_results(self, run_key: str) -> dict:
+        """완료된 축제의 결과를 {축제명: 결과 또는 None} 형태로 반환합니다."""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                'SELECT festival_name, has_result, result FROM checkpoint_festivals WHERE run_key = ?', (run_key,)
+            ).fetchall()
+        finally:
+            conn.close()
+        return {
+            name: pickle.loads(zlib.decompress(blob)) if has_result else None
+            for name, has_result, blob in rows
+        }
+
+    def load_manifest(self, run_key: str) -> dict | None:
+        """실행의 그룹 이름과 축제 목록을 반환합니다. 없으면 None"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                'SELECT group_name, festivals, started_at FROM checkpoint_runs WHERE run_key = ?', (run_key,)
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        return {"group_name": row[0], "festivals": json.loads(row[1]), "started_at": row[2]}
+
+    def save_festival(self, run_key: str, festival_name: str, result: dict | None):
+        """축제 하나의 결과를 완료로 기록합니다. result가 None이면 유효한 결과 없이 완료된 것으로 기록합니다."""
+        blob = zlib.compress(pickle.dumps(result, protocol=5), 3) if result is not None else None
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO checkpoint_festivals (run_key, festival_name, has_result, result, completed_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (run_key, festival_name, 1 if result is not None else 0, blob, now)
+            )
+            conn.execute('UPDATE checkpoint_runs SET updated_at = ? WHERE run_key = ?', (now, run_key))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def clear(self, run_key: str):
+        """실행의 체크포인트를 모두 삭제합니다."""
+        conn = self._connect()
+        try:
+            conn.execute('DELETE FROM checkpoint_festivals WHERE run_key = ?', (run_key,))
+            conn.execute('DELETE FROM checkpoint_runs WHERE run_key = ?', (run_key,))
+            conn.commit()
+        finally:
+            conn.close()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_category_checkpoint_store() -> CategoryCheckpointStore:
+    """프로세스 전체에서 공유하는 CategoryCheckpointStore를 반환합니다."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = CategoryCheckpointStore()
+    return _store
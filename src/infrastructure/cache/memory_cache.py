@@ -0,0 +1,102 @@
+# src/infrastructure/cache/memory_cache.py
+"""
+분석 결과 메모리 캐시 (LRU)
+
+디스크 캐시 앞에 두어, 자주 요청되는 축제는 파일/DB 읽기와 DataFrame 복원 없이 바로 응답합니다.
+항목 수가 아니라 추정 메모리 크기(바이트)로 용량을 제한하며, 가장 오래 사용하지 않은 항목부터 내보냅니다.
+"""
+import sys
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from src.config import get_analysis_memory_cache_mb
+
+
+def estimate_size(value) -> int:
+    """분석 결과 객체가 차지하는 메모리를 대략적으로 계산합니다."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class MemoryLRUCache:
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: 보관할 최대 추정 크기(바이트). 0이면 아무것도 보관하지 않음
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, key: str):
+        """값을 반환합니다. 호출 측이 최상위 키를 바꿔도 캐시가 변하지 않도록 dict는 얕은 복사본을 반환합니다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            value = entry[0]
+        return dict(value) if isinstance(value, dict) else value
+
+    def put(self, key: str, value):
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._current_bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._current_bytes += size
+            while self._current_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._current_bytes -= evicted_size
+                self._stats["evictions"] += 1
+
+    def invalidate(self, key: str):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._current_bytes -= entry[1]
+                self._stats["invalidations"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._current_bytes,
+                "max_bytes": self.max_bytes,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                **self._stats,
+            }
+
+
+_memory_cache = None
+_memory_cache_lock = threading.Lock()
+
+
+def get_memory_cache() -> MemoryLRUCache:
+    """프로세스 전체에서 공유하는 분석 결과 메모리 캐시를 반환합니다."""
+    global _memory_cache
+    if _memory_cache is None:
+        with _memory_cache_lock:
+            if _memory_cache is None:
+                _memory_cache = MemoryLRUCache(get_analysis_memory_cache_mb() * 1024 * 1024)
+    return _memory_cache
@@ -0,0 +1,149 @@
+# src/infrastructure/cache/post_result_store.py
+"""
+블로그 글 단위 LLM 분석 결과 저장소
+
+분석 캐시 키는 '키워드_리뷰수'이므로 리뷰 수만 바꿔 다시 분석하면 이미 평가한 글도 LLM 그래프
+(관련성 검증 → 요약 → 규칙 채점)를 다시 거칩니다. 글 하나의 그래프 결과를
+(키워드, 글 주소, 본문 해시, 파이프라인 버전) 단위로 저장해 두고 재사용합니다.
+
+파이프라인 버전은 프롬프트 버전 문자열과 감성 사전(dic/*.csv) 내용의 해시로 만들어지므로,
+프롬프트나 사전이 바뀌면 이전 결과는 자동으로 사용되지 않습니다.
+"""
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+
+from .blog_content_store import normalize_blog_url, content_hash
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+DEFAULT_DB_PATH = os.path.join(PROJECT_ROOT, "cache", "post_results.db")
+
+# 저장하는 그래프 결과 필드
+RESULT_FIELDS = ("is_relevant", "llm_summary", "final_judgments", "aspect_sentiment_pairs")
+
+
+def _to_builtin(value):
+    """numpy 스칼라 등 JSON으로 바로 저장할 수 없는 값을 변환합니다."""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+@lru_cache(maxsize=None)
+def compute_pipeline_version(prompt_version: str, dic_path: str) -> str:
+    """프롬프트 버전과 감성 사전 파일 내용으로 파이프라인 버전 문자열을 만듭니다. (프로세스당 1회 계산)"""
+    digest = hashlib.sha1(prompt_version.encode("utf-8"))
+    for path in sorted(glob.glob(os.path.join(dic_path, "*.csv"))):
+        digest.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return f"{prompt_version}-{digest.hexdigest()[:12]}"
+
+
+class PostResultStore:
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self._stats = {"hits": 0, "misses": 0, "writes": 0}
+        self._stats_lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._initialize()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _initialize(self):
+        conn = self._connect()
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS post_results (
+                    result_key TEXT PRIMARY KEY,
+                    keyword TEXT NOT NULL,
+                    post_key TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    pipeline_version TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_post_results_keyword ON post_results(keyword)')
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _make_key(keyword: str, url: str, content: str, pipeline_version: str):
+        post_key = normalize_blog_url(url) or url
+        body_hash = content_hash(content)
+        raw = "\0".join([keyword, post_key, body_hash, pipeline_version])
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest(), post_key, body_hash
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def get(self, keyword: str, url: str, content: str, pipeline_version: str) -> dict | None:
+        """저장된 그래프 결과(RESULT_FIELDS)를 반환합니다. 없으면 None"""
+        result_key, _, _ = self._make_key(keyword, url, content, pipeline_version)
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT result FROM post_results WHERE result_key = ?', (result_key,)).fetchone()
+        finally:
+            conn.close()
+
+        if row is None:
+            self._count("misses")
+            return None
+        self._count("hits")
+        result = json.loads(row[0])
+        # JSON에는 튜플이 없으므로 (주체, 감성표현) 쌍을 튜플로 되돌립니다.
+        result["aspect_sentiment_pairs"] = [tuple(p) for p in result.get("aspect_sentiment_pairs") or []]
+        return result
+
+    def put(self, keyword: str, url: str, content: str, pipeline_version: str, final_state: dict):
+        """그래프 최종 상태에서 RESULT_FIELDS만 골라 저장합니다."""
+        result_key, post_key, body_hash = self._make_key(keyword, url, content, pipeline_version)
+        result = {field: final_state.get(field) for field in RESULT_FIELDS}
+        conn = self._connect()
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO post_results '
+                '(result_key, keyword, post_key, content_hash, pipeline_version, result, created_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (result_key, keyword, post_key, body_hash, pipeline_version,
+                 json.dumps(result, ensure_ascii=False, default=_to_builtin), time.time())
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        self._count("writes")
+
+    def stats(self) -> dict:
+        """저장된 결과 수와 누적 조회 통계를 반환합니다."""
+        conn = self._connect()
+        try:
+            count = conn.execute('SELECT COUNT(*) FROM post_results').fetchone()[0]
+        finally:
+            conn.close()
+        with self._stats_lock:
+            return {"entries": count, **self._stats}
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_post_result_store() -> PostResultStore:
+    """프로세스 전체에서 공유하는 PostResultStore를 반환합니다."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = PostResultStore()
+    return _store
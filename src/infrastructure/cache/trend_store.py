@@ -0,0 +1,227 @@
+# src/infrastructure/cache/trend_store.py
+"""
+검색어 트렌드 시계열 저장소
+
+키워드 분석마다 1년 트렌드와 축제 기간(±30일) 트렌드를 데이터랩에 따로 요청했지만, 집중 기간은 대부분
+1년 기간 안에 있고 지난 날짜의 값은 바뀌지 않습니다. 키워드별 일자 값을 SQLite에 (keyword, date, ratio, fetched_at)
+형태로 저장해 두고, 요청 기간 중 저장되지 않은 날짜만 API로 받아 채웁니다.
+
+- 데이터랩 값은 요청 기간 안의 최댓값을 100으로 둔 상대값이므로, 새로 받은 구간은 이미 저장된 날짜와 겹치게 요청해
+  겹친 날짜의 비율로 저장된 값과 같은 기준으로 맞춘 뒤 저장합니다. 겹치는 값이 없으면 새로 받은 구간이 저장된 기간 전체를
+  덮을 때만 교체하고, 그렇지 않으면 저장된 값은 그대로 두고 비어 있던 날짜만 채웁니다.
+- 조회 결과는 요청 기간의 최댓값이 100이 되도록 다시 정규화해 API를 직접 호출한 결과와 같은 기준으로 돌려줍니다.
+- 최근 며칠의 값은 아직 집계 중일 수 있으므로 refresh_hours가 지나면 다시 받습니다.
+"""
+import datetime
+import os
+import sqlite3
+import statistics
+import threading
+import time
+
+import pandas as pd
+
+from src.config import get_trend_refresh_hours
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+DEFAULT_DB_PATH = os.path.join(PROJECT_ROOT, "cache", "trends.db")
+RECENT_DAYS = 3  # 오늘 포함 최근 며칠을 아직 바뀔 수 있는 값으로 볼지
+OVERLAP_DAYS = 7  # 새로 받는 구간 앞뒤로 함께 요청해 기준을 맞출 때 사용할 날짜 수
+
+
+def _to_date(value) -> datetime.date:
+    return value.date() if isinstance(value, datetime.datetime) else value
+
+
+class TrendStore:
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, refresh_hours: float = 12):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            refresh_hours: 최근 RECENT_DAYS일의 값을 다시 받기까지의 시간
+        """
+        self.db_path = db_path
+        self.refresh_seconds = refresh_hours * 60 * 60
+        self._stats = {"hits": 0, "partial_hits": 0, "misses": 0, "rescaled": 0, "replaced": 0, "unscaled": 0}
+        self._stats_lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._initialize()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _initialize(self):
+        conn = self._connect()
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS trend_points (
+                    keyword TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    ratio REAL NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (keyword, date)
+                )
+            ''')
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def _load(self, keyword: str, start_date, end_date) -> dict:
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                'SELECT date, ratio, fetched_at FROM trend_points WHERE keyword = ? AND date BETWEEN ? AND ?',
+                (keyword, _to_date(start_date).isoformat(), _to_date(end_date).isoformat())
+            ).fetchall()
+        finally:
+            conn.close()
+        return {date: (ratio, fetched_at) for date, ratio, fetched_at in rows}
+
+    def _stored_span(self, keyword: str):
+        """키워드의 저장된 첫 날짜와 마지막 날짜 (ISO 문자열). 저장된 값이 없으면 None"""
+        conn = self._connect()
+        try:
+            first, last = conn.execute(
+                'SELECT MIN(date), MAX(date) FROM trend_points WHERE keyword = ?', (keyword,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return None if first is None else (first, last)
+
+    def plan_fetch(self, keyword: str, start_date, end_date, record_stats: bool = True):
+        """
+        기간을 채우기 위해 API로 받아야 할 (시작일, 종료일)을 반환합니다. 저장된 값으로 충분하면 None
+
+        빠진 날짜 전체를 덮고, 저장된 값과 기준을 맞출 수 있도록 앞뒤로 OVERLAP_DAYS일씩 넓힌 기간입니다.
+        record_stats가 False이면 조회 통계(hits/partial_hits/misses)에 넣지 않습니다. (미리 확인만 할 때)
+        """
+        today = datetime.date.today()
+        start_date, end_date = _to_date(start_date), min(_to_date(end_date), today)
+        if start_date > end_date:
+            return None
+        stored = self._load(keyword, start_date, end_date)
+        stale_before = time.time() - self.refresh_seconds
+        recent_from = today - datetime.timedelta(days=RECENT_DAYS - 1)
+
+        missing = []
+        day = start_date
+        while day <= end_date:
+            point = stored.get(day.isoformat())
+            if point is None or (day >= recent_from and point[1] < stale_before):
+                missing.append(day)
+            day += datetime.timedelta(days=1)
+
+        if not missing:
+            if record_stats:
+                self._count("hits")
+            return None
+        if record_stats:
+            self._count("partial_hits" if stored else "misses")
+        fetch_start = missing[0] - datetime.timedelta(days=OVERLAP_DAYS)
+        fetch_end = min(missing[-1] + datetime.timedelta(days=OVERLAP_DAYS), today)
+        return fetch_start, fetch_end
+
+    def merge(self, keyword: str, df: pd.DataFrame, start_date, end_date):
+        """
+        API로 받은 start_date ~ end_date 기간의 값을 저장합니다. 값이 없는 날짜는 0으로 저장합니다.
+
+        기간 안에 이미 저장된 날짜가 있으면 겹친 날짜의 비율(중앙값)로 새 값을 저장된 기준에 맞춥니다.
+        기준을 맞출 수 없을 때(겹친 날짜가 없거나 한쪽 값이 모두 0)는 새 구간이 저장된 기간 전체를 덮으면 교체하고,
+        일부만 덮으면 저장된 값을 지우지 않고 비어 있던 날짜만 새 값 그대로 채웁니다.
+        (최근 며칠만 다시 받았는데 모두 0으로 온 경우 등에 1년치 값이 지워지지 않도록)
+        """
+        start_date, end_date = _to_date(start_date), _to_date(end_date)
+        fetched = {}
+        if not df.empty:
+            fetched = {_to_date(period).isoformat(): float(ratio) for period, ratio in zip(df['period'].dt.date, df['ratio'])}
+        day = start_date
+        while day <= end_date:
+            fetched.setdefault(day.isoformat(), 0.0)
+            day += datetime.timedelta(days=1)
+
+        stored = self._load(keyword, start_date, end_date)
+        # 아직 바뀔 수 있는 최근 값보다 확정된 과거 값으로 기준을 맞춥니다.
+        recent_from = (datetime.date.today() - datetime.timedelta(days=RECENT_DAYS - 1)).isoformat()
+        pairs = [(stored[date][0], value, date) for date, value in fetched.items() if date in stored and value > 0 and stored[date][0] > 0]
+        ratios = [old / new for old, new, date in pairs if date < recent_from] or [old / new for old, new, _ in pairs]
+        span = None if ratios else self._stored_span(keyword)
+        now = time.time()
+        conn = self._connect()
+        try:
+            if ratios:
+                scale = statistics.median(ratios)
+                points = fetched
+                self._count("rescaled")
+            elif span is None or (start_date.isoformat() <= span[0] and span[1] <= end_date.isoformat()):
+                scale = 1.0
+                points = fetched
+                conn.execute('DELETE FROM trend_points WHERE keyword = ?', (keyword,))
+                self._count("replaced")
+            else:
+                scale = 1.0
+                points = {date: value for date, value in fetched.items() if date not in stored}
+                # 값은 유지하되 다시 받은 것으로 기록해 refresh_hours 동안 같은 구간을 반복 요청하지 않습니다.
+                conn.execute(
+                    'UPDATE trend_points SET fetched_at = ? WHERE keyword = ? AND date BETWEEN ? AND ?',
+                    (now, keyword, start_date.isoformat(), end_date.isoformat())
+                )
+                self._count("unscaled")
+            conn.executemany(
+                'INSERT OR REPLACE INTO trend_points (keyword, date, ratio, fetched_at) VALUES (?, ?, ?, ?)',
+                [(keyword, date, value * scale, now) for date, value in points.items()]
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, keyword: str, start_date, end_date) -> pd.DataFrame:
+        """
+        저장된 기간의 값을 get_trend_data와 같은 형식(period, ratio, keyword)으로 반환합니다.
+        기간 안의 최댓값이 100이 되도록 정규화하며, 값이 없거나 모두 0이면 빈 DataFrame을 반환합니다.
+        """
+        stored = self._load(keyword, start_date, end_date)
+        if not stored:
+            return pd.DataFrame()
+        df = pd.DataFrame(
+            [(date, ratio) for date, (ratio, _) in sorted(stored.items())],
+            columns=['period', 'ratio']
+        )
+        max_ratio = df['ratio'].max()
+        if max_ratio <= 0:
+            return pd.DataFrame()
+        df['period'] = pd.to_datetime(df['period'])
+        df['ratio'] = df['ratio'] / max_ratio * 100
+        df['keyword'] = keyword
+        return df
+
+    def stats(self) -> dict:
+        """저장된 키워드 수, 일자 값 수와 누적 조회 통계를 반환합니다."""
+        conn = self._connect()
+        try:
+            keywords, points = conn.execute(
+                'SELECT COUNT(DISTINCT keyword), COUNT(*) FROM trend_points'
+            ).fetchone()
+        finally:
+            conn.close()
+        with self._stats_lock:
+            return {"keywords": keywords, "points": points, **self._stats}
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_trend_store() -> TrendStore:
+    """프로세스 전체에서 공유하는 TrendStore를 반환합니다."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = TrendStore(refresh_hours=get_trend_refresh_hours())
+    return _store
@@ -1,8 +1,18 @@
 # src/infrastructure/database/csv_importer.py
-"""CSV 파일을 SQLite 데이터베이스로 import하는 모듈"""
-import pandas as pd
+"""CSV 파일을 SQLite 데이터베이스로 import하는 모듈
+
+CSV를 청크 단위로 읽어 컬럼별로 한 번에 변환한 뒤, 테이블마다 하나의 트랜잭션 안에서 executemany로 저장합니다.
+
+- 기본(전체 import): 기존 데이터를 지우고 다시 넣습니다. 한 트랜잭션이므로 import 중에도 조회 측은 이전 데이터를 봅니다.
+- 증분 import(incremental=True): contentid 기준으로 바뀐 행만 갱신(upsert)하고, CSV에서 사라진 행은 삭제합니다.
+"""
+import argparse
 import os
-from .db_manager import get_connection, initialize_database
+import time
+import traceback
+
+import pandas as pd
+from .db_manager import write_connection, initialize_database, ensure_festival_title_index, ensure_spatial_index
 
 # CSV 파일 경로
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
@@ -10,158 +20,179 @@ FESTIVAL_CSV = os.path.join(BASE_DIR, "database", "축제공연행사csv.CSV")
 CULTURE_CSV = os.path.join(BASE_DIR, "database", "문화시설csv.CSV")
 COURSE_CSV = os.path.join(BASE_DIR, "database", "여행코스csv.CSV")
 
-def import_festivals():
-    """축제 CSV 데이터를 데이터베이스에 import합니다."""
-    print("축제 데이터 import 시작...")
+DEFAULT_CHUNK_SIZE = 5000
+
+FESTIVAL_COLUMNS = [
+    'contentid', 'title', 'eventstartdate', 'eventenddate', 'addr1', 'addr2',
+    'areacode', 'cat1', 'cat2', 'cat3', 'contenttypeid', 'mapx', 'mapy',
+    'tel', 'firstimage', 'firstimage2'
+]
+CULTURE_COLUMNS = [
+    'contentid', 'title', 'addr1', 'addr2', 'areacode', 'cat1', 'cat2', 'cat3',
+    'contenttypeid', 'mapx', 'mapy', 'tel', 'firstimage', 'firstimage2'
+]
+COURSE_COLUMNS = [
+    'contentid', 'title', 'addr1', 'addr2', 'areacode', 'cat1', 'cat2', 'cat3',
+    'contenttypeid', 'mapx', 'mapy', 'firstimage', 'firstimage2'
+]
+
+
+def _table_schema(conn, table: str) -> dict:
+    """테이블 컬럼별 (선언 타입, NOT NULL 여부)를 반환합니다."""
+    return {
+        row["name"]: (row["type"].upper(), bool(row["notnull"]))
+        for row in conn.execute(f'PRAGMA table_info({table})').fetchall()
+    }
+
+
+def _prepare_chunk(chunk: pd.DataFrame, schema: dict, key_column: str, incremental: bool):
+    """
+    청크를 테이블 컬럼 타입에 맞게 변환해 executemany에 넘길 튜플 목록과 건너뛴 행 수를 반환합니다.
+    NaN은 None으로 바꾸고, NOT NULL 컬럼이 비어 있는 행(증분 import에서는 contentid가 없는 행 포함)은 건너뜁니다.
+    """
+    for column in chunk.columns:
+        declared_type = schema[column][0]
+        if declared_type == "INTEGER":
+            chunk[column] = pd.to_numeric(chunk[column], errors='coerce').round().astype('Int64')
+        elif declared_type == "REAL":
+            chunk[column] = pd.to_numeric(chunk[column], errors='coerce')
+
+    required = [column for column in chunk.columns if schema[column][1]]
+    if incremental and key_column in chunk.columns:
+        required.append(key_column)
+    valid = chunk[required].notna().all(axis=1) if required else pd.Series(True, index=chunk.index)
+    chunk = chunk[valid]
+
+    chunk = chunk.astype(object).where(chunk.notna(), None)
+    return list(chunk.itertuples(index=False, name=None)), int((~valid).sum())
+
+
+def _import_csv(table: str, csv_path: str, columns_to_import: list, label: str,
+                incremental: bool = False, chunksize: int = DEFAULT_CHUNK_SIZE, key_column: str = 'contentid') -> int:
+    """CSV 하나를 테이블로 import하고 저장한 행 수를 반환합니다."""
+    print(f"{label} 데이터 import 시작...")
+    started = time.perf_counter()
+
+    if not os.path.exists(csv_path):
+        print(f"  [ERROR] {label} 데이터 import 실패: CSV 파일이 없습니다 ({csv_path})")
+        return 0
 
     try:
-        # CSV 읽기 (cp949 인코딩)
-        df = pd.read_csv(FESTIVAL_CSV, encoding='cp949', low_memory=False)
-        print(f"  - CSV 읽기 완료: {len(df)}개 행")
-
-        # 필요한 컬럼만 선택
-        columns_to_import = [
-            'contentid', 'title', 'eventstartdate', 'eventenddate', 'addr1', 'addr2',
-            'areacode', 'cat1', 'cat2', 'cat3', 'contenttypeid', 'mapx', 'mapy',
-            'tel', 'firstimage', 'firstimage2'
-        ]
-
         # CSV에 실제로 존재하는 컬럼만 선택
-        available_columns = [col for col in columns_to_import if col in df.columns]
-        df_filtered = df[available_columns].copy()
-
-        # NaN을 None으로 변환
-        df_filtered = df_filtered.where(pd.notna(df_filtered), None)
-
-        # 데이터베이스에 저장
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        # 기존 데이터 삭제
-        cursor.execute('DELETE FROM festivals')
-
-        # 데이터 삽입
-        inserted = 0
-        for _, row in df_filtered.iterrows():
+        header = pd.read_csv(csv_path, encoding='cp949', nrows=0).columns
+        available_columns = [col for col in columns_to_import if col in header]
+        if incremental and key_column not in available_columns:
+            print(f"  [ERROR] {label} 증분 import에는 {key_column} 컬럼이 필요합니다.")
+            return 0
+
+        with write_connection() as conn:
+            conn.isolation_level = None  # 트랜잭션을 직접 관리
+            conn.execute('PRAGMA synchronous=OFF')
+            schema = _table_schema(conn, table)
+
+            columns_str = ', '.join(available_columns)
+            placeholders = ', '.join('?' for _ in available_columns)
+            if incremental:
+                update_columns = [col for col in available_columns if col != key_column]
+                query = (
+                    f'INSERT INTO {table} ({columns_str}) VALUES ({placeholders}) '
+                    f'ON CONFLICT({key_column}) DO UPDATE SET '
+                    + ', '.join(f'{col} = excluded.{col}' for col in update_columns)
+                    # 바뀐 값이 없는 행은 다시 쓰지 않습니다.
+                    + ' WHERE ' + ' OR '.join(f'{col} IS NOT excluded.{col}' for col in update_columns)
+                )
+            else:
+                # 기존 import와 같이 contentid가 중복된 행은 처음 행만 남깁니다.
+                query = f'INSERT OR IGNORE INTO {table} ({columns_str}) VALUES ({placeholders})'
+
+            total_rows, skipped = 0, 0
+            conn.execute('BEGIN IMMEDIATE')
             try:
-                placeholders = ', '.join(['?' for _ in available_columns])
-                columns_str = ', '.join(available_columns)
-                query = f'INSERT INTO festivals ({columns_str}) VALUES ({placeholders})'
-                cursor.execute(query, tuple(row[col] for col in available_columns))
-                inserted += 1
-            except Exception as e:
-                print(f"    경고: 행 삽입 실패 - {e}")
-                continue
-
-        conn.commit()
-        conn.close()
-
-        print(f"  [OK] 축제 데이터 import 완료: {inserted}개")
-        return inserted
+                if incremental:
+                    conn.execute('CREATE TEMP TABLE IF NOT EXISTS import_seen_keys (key INTEGER PRIMARY KEY)')
+                    conn.execute('DELETE FROM import_seen_keys')
+                else:
+                    # 기존 데이터 삭제
+                    conn.execute(f'DELETE FROM {table}')
+                written = 0
+
+                key_index = available_columns.index(key_column) if key_column in available_columns else None
+                for chunk in pd.read_csv(csv_path, encoding='cp949', usecols=available_columns,
+                                         dtype={col: str for col in available_columns if schema[col][0] == "TEXT"},
+                                         chunksize=chunksize):
+                    rows, chunk_skipped = _prepare_chunk(chunk[available_columns], schema, key_column, incremental)
+                    written += conn.executemany(query, rows).rowcount
+                    if incremental:
+                        conn.executemany('INSERT OR IGNORE INTO import_seen_keys (key) VALUES (?)', ((row[key_index],) for row in rows))
+                    total_rows += len(rows) + chunk_skipped
+                    skipped += chunk_skipped
+
+                removed = 0
+                if incremental:
+                    # CSV에서 사라진 행 삭제
+                    removed = conn.execute(
+                        f'DELETE FROM {table} WHERE {key_column} NOT IN (SELECT key FROM import_seen_keys)'
+                    ).rowcount
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+
+            count = conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+        elapsed = time.perf_counter() - started
+        rate = total_rows / elapsed if elapsed > 0 else 0.0
+        print(f"  - CSV 읽기 완료: {total_rows}개 행 ({elapsed:.2f}초, {rate:,.0f}행/초)" + (f", 건너뜀 {skipped}개" if skipped else ""))
+        if incremental:
+            print(f"  [OK] {label} 데이터 증분 import 완료: 추가/변경 {written}개, 삭제 {removed}개 (현재 {count}개)")
+        else:
+            print(f"  [OK] {label} 데이터 import 완료: {count}개")
+        return count
 
     except Exception as e:
-        print(f"  [ERROR] 축제 데이터 import 실패: {e}")
-        import traceback
+        print(f"  [ERROR] {label} 데이터 import 실패: {e}")
         traceback.print_exc()
         return 0
 
-def import_culture_facilities():
-    """문화시설 CSV 데이터를 데이터베이스에 import합니다."""
-    print("문화시설 데이터 import 시작...")
-
-    try:
-        df = pd.read_csv(CULTURE_CSV, encoding='cp949', low_memory=False)
-        print(f"  - CSV 읽기 완료: {len(df)}개 행")
-
-        columns_to_import = [
-            'contentid', 'title', 'addr1', 'addr2', 'areacode', 'cat1', 'cat2', 'cat3',
-            'contenttypeid', 'mapx', 'mapy', 'tel', 'firstimage', 'firstimage2'
-        ]
 
-        available_columns = [col for col in columns_to_import if col in df.columns]
-        df_filtered = df[available_columns].copy()
-        df_filtered = df_filtered.where(pd.notna(df_filtered), None)
+def _ensure_search_indexes():
+    """제목 검색(FTS5)과 좌표(R*Tree) 인덱스를 준비합니다. import 중의 변경은 트리거가 인덱스에 반영합니다."""
+    with write_connection() as conn:
+        ensure_festival_title_index(conn)
+        ensure_spatial_index(conn)
 
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM culture_facilities')
 
-        inserted = 0
-        for _, row in df_filtered.iterrows():
-            try:
-                placeholders = ', '.join(['?' for _ in available_columns])
-                columns_str = ', '.join(available_columns)
-                query = f'INSERT INTO culture_facilities ({columns_str}) VALUES ({placeholders})'
-                cursor.execute(query, tuple(row[col] for col in available_columns))
-                inserted += 1
-            except Exception as e:
-                continue
+def import_festivals(incremental: bool = False, chunksize: int = DEFAULT_CHUNK_SIZE):
+    """축제 CSV 데이터를 데이터베이스에 import합니다."""
+    _ensure_search_indexes()
+    return _import_csv('festivals', FESTIVAL_CSV, FESTIVAL_COLUMNS, "축제", incremental, chunksize)
 
-        conn.commit()
-        conn.close()
 
-        print(f"  [OK] 문화시설 데이터 import 완료: {inserted}개")
-        return inserted
+def import_culture_facilities(incremental: bool = False, chunksize: int = DEFAULT_CHUNK_SIZE):
+    """문화시설 CSV 데이터를 데이터베이스에 import합니다."""
+    _ensure_search_indexes()
+    return _import_csv('culture_facilities', CULTURE_CSV, CULTURE_COLUMNS, "문화시설", incremental, chunksize)
 
-    except Exception as e:
-        print(f"  [ERROR] 문화시설 데이터 import 실패: {e}")
-        return 0
 
-def import_travel_courses():
+def import_travel_courses(incremental: bool = False, chunksize: int = DEFAULT_CHUNK_SIZE):
     """여행코스 CSV 데이터를 데이터베이스에 import합니다."""
-    print("여행코스 데이터 import 시작...")
-
-    try:
-        df = pd.read_csv(COURSE_CSV, encoding='cp949', low_memory=False)
-        print(f"  - CSV 읽기 완료: {len(df)}개 행")
-
-        columns_to_import = [
-            'contentid', 'title', 'addr1', 'addr2', 'areacode', 'cat1', 'cat2', 'cat3',
-            'contenttypeid', 'mapx', 'mapy', 'firstimage', 'firstimage2'
-        ]
+    _ensure_search_indexes()
+    return _import_csv('travel_courses', COURSE_CSV, COURSE_COLUMNS, "여행코스", incremental, chunksize)
 
-        available_columns = [col for col in columns_to_import if col in df.columns]
-        df_filtered = df[available_columns].copy()
-        df_filtered = df_filtered.where(pd.notna(df_filtered), None)
 
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM travel_courses')
-
-        inserted = 0
-        for _, row in df_filtered.iterrows():
-            try:
-                placeholders = ', '.join(['?' for _ in available_columns])
-                columns_str = ', '.join(available_columns)
-                query = f'INSERT INTO travel_courses ({columns_str}) VALUES ({placeholders})'
-                cursor.execute(query, tuple(row[col] for col in available_columns))
-                inserted += 1
-            except Exception as e:
-                continue
-
-        conn.commit()
-        conn.close()
-
-        print(f"  [OK] 여행코스 데이터 import 완료: {inserted}개")
-        return inserted
-
-    except Exception as e:
-        print(f"  [ERROR] 여행코스 데이터 import 실패: {e}")
-        return 0
-
-def import_all_data():
+def import_all_data(incremental: bool = False, chunksize: int = DEFAULT_CHUNK_SIZE):
     """모든 CSV 데이터를 데이터베이스에 import합니다."""
     print("="*60)
-    print("CSV 데이터 import 시작")
+    print("CSV 데이터 import 시작" + (" (증분)" if incremental else ""))
     print("="*60)
 
     # 데이터베이스 초기화
     initialize_database()
 
     # 각 CSV import
-    festival_count = import_festivals()
-    culture_count = import_culture_facilities()
-    course_count = import_travel_courses()
+    festival_count = import_festivals(incremental, chunksize)
+    culture_count = import_culture_facilities(incremental, chunksize)
+    course_count = import_travel_courses(incremental, chunksize)
 
     print("="*60)
     print("CSV 데이터 import 완료")
@@ -171,5 +202,10 @@ def import_all_data():
     print(f"  - 총합: {festival_count + culture_count + course_count}개")
     print("="*60)
 
+
 if __name__ == "__main__":
-    import_all_data()
+    parser = argparse.ArgumentParser(description="CSV 데이터를 tour_data.db로 import")
+    parser.add_argument("--incremental", action="store_true", help="전체 삭제 후 다시 넣지 않고 contentid 기준으로 바뀐 행만 갱신")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNK_SIZE, help=f"한 번에 읽을 CSV 행 수 (기본 {DEFAULT_CHUNK_SIZE})")
+    args = parser.parse_args()
+    import_all_data(incremental=args.incremental, chunksize=args.chunksize)
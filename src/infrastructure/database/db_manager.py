@@ -1,21 +1,142 @@
 # src/infrastructure/database/db_manager.py
-"""SQLite 데이터베이스 관리 모듈"""
+"""SQLite 데이터베이스 관리 모듈
+
+- get_read_connection(): 스레드마다 하나씩 재사용하는 읽기 전용 연결 (mode=ro, mmap/page cache 설정).
+  연결을 계속 쓰므로 sqlite3 모듈의 prepared statement 캐시도 유지되어, 자주 쓰는 제목 조회 쿼리를 다시 파싱하지 않습니다.
+- write_connection(): import 등 쓰기 작업용 연결을 여는 context manager (WAL, 정상 종료 시 commit).
+- get_connection_stats(): 연결 생성 수와 읽기 쿼리 수 (모니터링용)
+"""
 import sqlite3
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
+from src.config import get_db_mmap_size_mb, get_db_cache_size_mb, get_db_read_immutable
+
 # 데이터베이스 파일 경로
 DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "database", "tour_data.db")
+FESTIVAL_TITLE_FTS = "festival_title_fts"  # 축제 제목 trigram 검색 인덱스 (FTS5)
+SPATIAL_TABLES = ("festivals", "culture_facilities", "travel_courses")  # 좌표(mapx, mapy) R*Tree 인덱스를 둘 테이블
+STATEMENT_CACHE_SIZE = 256  # 연결별로 보관할 prepared statement 수
+
+_local = threading.local()
+_stats = {"read_opens": 0, "write_opens": 0, "read_queries": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(key: str):
+    with _stats_lock:
+        _stats[key] += 1
+
+
+class _CountingConnection(sqlite3.Connection):
+    """execute 호출 수를 세는 읽기 전용 연결"""
+
+    def execute(self, *args, **kwargs):
+        _count("read_queries")
+        return super().execute(*args, **kwargs)
+
 
 def get_connection():
-    """SQLite 데이터베이스 연결을 반환합니다."""
-    conn = sqlite3.connect(DB_PATH)
+    """SQLite 데이터베이스 연결을 반환합니다. 호출한 쪽에서 닫아야 합니다."""
+    conn = sqlite3.connect(DB_PATH, timeout=30, cached_statements=STATEMENT_CACHE_SIZE)
     conn.row_factory = sqlite3.Row  # 컬럼 이름으로 접근 가능하게
     return conn
 
+def get_read_connection():
+    """
+    현재 스레드의 읽기 전용 연결을 반환합니다. 스레드 안에서 재사용하므로 닫지 않습니다.
+
+    DB_READ_IMMUTABLE=true이면 immutable=1로 열어 잠금/변경 확인을 생략합니다.
+    서버가 실행 중일 때 import하지 않는 배포 환경에서만 사용하세요 (변경 내용이 보이지 않습니다).
+    immutable 연결은 WAL 파일을 읽지 않으므로 체크포인트되지 않은 변경도 보이지 않습니다.
+    """
+    conn = getattr(_local, "read_conn", None)
+    if conn is None:
+        uri = Path(DB_PATH).resolve().as_uri() + ("?immutable=1" if get_db_read_immutable() else "?mode=ro")
+        conn = sqlite3.connect(uri, uri=True, timeout=30, factory=_CountingConnection,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+        # 설정용 PRAGMA는 쿼리 수에 세지 않습니다.
+        sqlite3.Connection.execute(conn, f"PRAGMA mmap_size={get_db_mmap_size_mb() * 1024 * 1024}")
+        sqlite3.Connection.execute(conn, f"PRAGMA cache_size={-get_db_cache_size_mb() * 1024}")  # 음수는 KiB 단위
+        _local.read_conn = conn
+        _count("read_opens")
+    return conn
+
+@contextmanager
+def write_connection():
+    """
+    쓰기용 연결을 열어 넘겨주고, 블록이 정상 종료되면 commit, 예외가 나면 rollback한 뒤 닫습니다.
+    WAL 모드로 열어 쓰는 동안에도 읽기 연결은 이전 데이터를 계속 읽을 수 있습니다.
+    """
+    conn = get_connection()
+    _count("write_opens")
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        yield conn
+        if conn.in_transaction:
+            conn.commit()
+    except Exception:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+def get_connection_stats() -> dict:
+    """읽기/쓰기 연결 생성 수와 읽기 연결에서 실행한 쿼리 수를 반환합니다."""
+    with _stats_lock:
+        return dict(_stats)
+
+def has_table(conn, name: str) -> bool:
+    """
+    연결에서 테이블(가상 테이블 포함)을 조회할 수 있는지 확인합니다. 읽기 전용 연결에서도 사용할 수 있으며,
+    테이블이 없거나 가상 테이블 모듈(FTS5, R*Tree)이 SQLite에 없으면 False입니다.
+    """
+    try:
+        conn.execute(f'SELECT 1 FROM {name} LIMIT 1').fetchall()
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+def prepare_search_indexes() -> dict:
+    """
+    제목 검색(FTS5)과 좌표(R*Tree) 인덱스를 만들어 둡니다. 서버 시작 시 한 번 호출합니다.
+
+    조회 경로에서는 인덱스를 만들지 않고 읽기 연결로 있는지만 확인하므로, 인덱스가 없는 DB는
+    이 단계(또는 initialize_database, CSV import)를 거쳐야 부분 일치/주변 장소 검색에 인덱스를 사용합니다.
+    DB_READ_IMMUTABLE=true인 읽기 연결은 WAL 파일을 보지 않으므로, 만든 뒤 체크포인트로 DB 파일에 반영합니다.
+    DB 파일이 없거나 쓸 수 없으면 경고만 출력합니다.
+
+    Returns:
+        {"title_index": bool, "spatial_index": bool}
+    """
+    if not os.path.exists(DB_PATH):
+        print(f"[WARN] 데이터베이스 파일이 없어 검색 인덱스를 준비하지 않습니다: {DB_PATH}")
+        return {"title_index": False, "spatial_index": False}
+    try:
+        with write_connection() as conn:
+            title_index = ensure_festival_title_index(conn)
+            spatial_index = ensure_spatial_index(conn)
+            conn.commit()
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    except sqlite3.OperationalError as e:
+        # 테이블이 아직 없거나 DB 파일이 읽기 전용인 경우 등
+        print(f"[WARN] 검색 인덱스를 준비하지 못했습니다: {e}")
+        return {"title_index": False, "spatial_index": False}
+    return {"title_index": title_index, "spatial_index": spatial_index}
+
 def initialize_database():
     """데이터베이스 테이블을 초기화합니다."""
-    conn = get_connection()
+    with write_connection() as conn:
+        _create_tables(conn)
+
+    print(f"[OK] 데이터베이스 초기화 완료: {DB_PATH}")
+
+def _create_tables(conn):
+    """테이블, 제목 인덱스, 축제 제목 검색 인덱스를 만듭니다."""
     cursor = conn.cursor()
 
     # 축제 테이블
@@ -112,10 +233,113 @@ def initialize_database():
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_culture_title ON culture_facilities(title)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_courses_title ON travel_courses(title)')
 
+    # 축제 제목 부분 일치 검색을 위한 FTS5 trigram 인덱스
+    ensure_festival_title_index(conn)
+    # 주변 장소 검색을 위한 좌표 R*Tree 인덱스
+    ensure_spatial_index(conn)
+
+def ensure_festival_title_index(conn) -> bool:
+    """
+    축제 제목 FTS5(trigram) 인덱스와 동기화 트리거를 만들고, 인덱스가 festivals와 어긋나 있으면 다시 채웁니다.
+
+    인덱스에는 띄어쓰기를 뺀 제목을 contentid(rowid)와 함께 저장하므로 "강릉 커피 축제"와 "강릉커피축제"가
+    같은 제목으로 검색됩니다. festivals에 대한 INSERT/DELETE/UPDATE는 트리거가 반영하므로 CSV import(전체/증분)
+    후에도 따로 갱신할 필요가 없습니다.
+
+    Returns:
+        FTS5를 사용할 수 있으면 True, SQLite에 FTS5(trigram)가 없으면 False
+    """
+    try:
+        conn.execute(f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS {FESTIVAL_TITLE_FTS}
+            USING fts5(title_compact, tokenize='trigram')
+        ''')
+    except sqlite3.OperationalError as e:
+        print(f"[WARN] FTS5 trigram 인덱스를 만들 수 없어 LIKE 검색을 사용합니다: {e}")
+        return False
+
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS festivals_title_fts_insert AFTER INSERT ON festivals BEGIN
+            INSERT INTO {FESTIVAL_TITLE_FTS}(rowid, title_compact) VALUES (new.contentid, replace(new.title, ' ', ''));
+        END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS festivals_title_fts_delete AFTER DELETE ON festivals BEGIN
+            DELETE FROM {FESTIVAL_TITLE_FTS} WHERE rowid = old.contentid;
+        END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS festivals_title_fts_update AFTER UPDATE OF contentid, title ON festivals BEGIN
+            DELETE FROM {FESTIVAL_TITLE_FTS} WHERE rowid = old.contentid;
+            INSERT INTO {FESTIVAL_TITLE_FTS}(rowid, title_compact) VALUES (new.contentid, replace(new.title, ' ', ''));
+        END
+    ''')
+
+    # 트리거가 생기기 전에 들어간 데이터가 있으면 인덱스를 다시 채웁니다.
+    indexed = conn.execute(f'SELECT COUNT(*) FROM {FESTIVAL_TITLE_FTS}').fetchone()[0]
+    total = conn.execute('SELECT COUNT(*) FROM festivals').fetchone()[0]
+    if indexed != total:
+        conn.execute(f'DELETE FROM {FESTIVAL_TITLE_FTS}')
+        conn.execute(f'''
+            INSERT INTO {FESTIVAL_TITLE_FTS}(rowid, title_compact)
+            SELECT contentid, replace(title, ' ', '') FROM festivals
+        ''')
+        print(f"[OK] 축제 제목 검색 인덱스 재구성: {total}개")
     conn.commit()
-    conn.close()
+    return True
 
-    print(f"[OK] 데이터베이스 초기화 완료: {DB_PATH}")
+def spatial_index_name(table: str) -> str:
+    """테이블의 좌표 R*Tree 인덱스 이름"""
+    return f"{table}_rtree"
+
+def ensure_spatial_index(conn) -> bool:
+    """
+    SPATIAL_TABLES의 좌표(mapx=경도, mapy=위도) R*Tree 인덱스와 동기화 트리거를 만들고,
+    인덱스가 테이블과 어긋나 있으면 다시 채웁니다. 좌표가 없거나 0인 행은 인덱스에 넣지 않습니다.
+
+    Returns:
+        R*Tree를 사용할 수 있으면 True, SQLite에 R*Tree 모듈이 없으면 False
+    """
+    for table in SPATIAL_TABLES:
+        index = spatial_index_name(table)
+        try:
+            conn.execute(f'CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING rtree(id, min_x, max_x, min_y, max_y)')
+        except sqlite3.OperationalError as e:
+            print(f"[WARN] R*Tree 좌표 인덱스를 만들 수 없어 주변 장소 검색을 사용할 수 없습니다: {e}")
+            return False
+
+        has_coords = "{row}.mapx IS NOT NULL AND {row}.mapy IS NOT NULL AND {row}.mapx != 0 AND {row}.mapy != 0"
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {index}_insert AFTER INSERT ON {table}
+            WHEN {has_coords.format(row="new")} BEGIN
+                INSERT INTO {index}(id, min_x, max_x, min_y, max_y) VALUES (new.contentid, new.mapx, new.mapx, new.mapy, new.mapy);
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {index}_delete AFTER DELETE ON {table} BEGIN
+                DELETE FROM {index} WHERE id = old.contentid;
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {index}_update AFTER UPDATE OF contentid, mapx, mapy ON {table} BEGIN
+                DELETE FROM {index} WHERE id = old.contentid;
+                INSERT INTO {index}(id, min_x, max_x, min_y, max_y)
+                SELECT new.contentid, new.mapx, new.mapx, new.mapy, new.mapy WHERE {has_coords.format(row="new")};
+            END
+        ''')
+
+        # 트리거가 생기기 전에 들어간 데이터가 있으면 인덱스를 다시 채웁니다.
+        indexed = conn.execute(f'SELECT COUNT(*) FROM {index}').fetchone()[0]
+        total = conn.execute(f'SELECT COUNT(*) FROM {table} WHERE {has_coords.format(row=table)}').fetchone()[0]
+        if indexed != total:
+            conn.execute(f'DELETE FROM {index}')
+            conn.execute(f'''
+                INSERT INTO {index}(id, min_x, max_x, min_y, max_y)
+                SELECT contentid, mapx, mapx, mapy, mapy FROM {table} WHERE {has_coords.format(row=table)}
+            ''')
+            print(f"[OK] {table} 좌표 인덱스 재구성: {total}개")
+    conn.commit()
+    return True
 
 if __name__ == "__main__":
     initialize_database()
@@ -1,13 +1,135 @@
 # src/infrastructure/database/festival_repository.py
 """데이터베이스에서 축제 정보를 조회하는 Repository"""
-from .db_manager import get_connection
+import re
+from .db_manager import get_read_connection, has_table, FESTIVAL_TITLE_FTS
 from functools import lru_cache
 
+_DETAIL_COLUMNS = (
+    "contentid, title, eventstartdate, eventenddate, addr1, addr2, "
+    "mapx, mapy, cat1, cat2, cat3, areacode"
+)
+MIN_TRIGRAM_QUERY_LENGTH = 3  # trigram 인덱스로 찾을 수 있는 최소 글자 수 (띄어쓰기 제외)
+MIN_TITLE_COVERAGE = 0.8  # 부분 일치가 없을 때, 제목의 trigram 중 검색어에 들어 있어야 하는 최소 비율
+MAX_FUZZY_CANDIDATES = 50
+_EXACT_BATCH_SIZE = 500  # IN 절 하나에 넣을 최대 이름 수 (SQLite 변수 개수 제한)
+
+_fts_available = False
+
+
+def _has_title_index(conn) -> bool:
+    """
+    읽기 연결로 FTS 인덱스를 사용할 수 있는지 확인합니다. 인덱스는 만들지 않습니다. (db_manager.prepare_search_indexes)
+    한 번 확인되면 다시 조회하지 않고, 없으면 나중에 만들어질 수 있으므로 호출할 때마다 확인합니다.
+    """
+    global _fts_available
+    if not _fts_available:
+        _fts_available = has_table(conn, FESTIVAL_TITLE_FTS)
+    return _fts_available
+
+
+def _compact(text: str) -> str:
+    """띄어쓰기를 모두 빼고 대소문자를 통일한 비교용 문자열"""
+    return re.sub(r"\s+", "", text).casefold()
+
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _match_score(compact_query: str, title: str) -> tuple:
+    """
+    정렬 키를 반환합니다. 작을수록 좋은 후보입니다.
+    (띄어쓰기 무시 일치 0 / 앞부분 일치 1 / 포함 2 / 그 외 3, 제목 길이 차이)
+    """
+    compact_title = _compact(title)
+    if compact_title == compact_query:
+        tier = 0
+    elif compact_title.startswith(compact_query):
+        tier = 1
+    elif compact_query in compact_title:
+        tier = 2
+    else:
+        tier = 3
+    return tier, abs(len(compact_title) - len(compact_query))
+
+
+def _row_to_details(row) -> dict:
+    return {
+        "contentid": row["contentid"],
+        "title": row["title"],
+        "start_date": _format_date(row["eventstartdate"]),
+        "end_date": _format_date(row["eventenddate"]),
+        "addr1": row["addr1"],
+        "addr2": row["addr2"],
+        "mapx": row["mapx"],
+        "mapy": row["mapy"],
+        "cat1": row["cat1"],
+        "cat2": row["cat2"],
+        "cat3": row["cat3"],
+        "areacode": row["areacode"]
+    }
+
+
+def _fts_phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _find_partial_matches(conn, festival_name: str, limit: int = 5) -> list:
+    """
+    띄어쓰기를 무시한 부분 일치 후보를 점수 순으로 최대 limit개 반환합니다.
+
+    - 3글자 이상이면 FTS5 trigram 인덱스로 제목에 검색어가 포함된 축제를 찾습니다.
+    - 포함된 축제가 없으면 제목의 trigram 중 MIN_TITLE_COVERAGE 이상이 검색어에 들어 있는 축제를 찾습니다.
+      ("제20회 강릉 커피축제"처럼 제목 앞뒤에 다른 말이 붙은 검색어)
+    - 2글자 이하이거나 FTS 인덱스가 없으면 띄어쓰기를 뺀 제목에 LIKE 검색을 합니다.
+    같은 점수에서는 제목 길이 차이, contentid 순으로 정렬해 결과가 항상 같습니다.
+    """
+    compact_query = _compact(festival_name)
+    if not compact_query:
+        return []
+
+    if len(compact_query) >= MIN_TRIGRAM_QUERY_LENGTH and _has_title_index(conn):
+        rows = conn.execute(f'''
+            SELECT {_DETAIL_COLUMNS}
+            FROM {FESTIVAL_TITLE_FTS} JOIN festivals ON festivals.contentid = {FESTIVAL_TITLE_FTS}.rowid
+            WHERE {FESTIVAL_TITLE_FTS} MATCH ?
+        ''', (_fts_phrase(compact_query),)).fetchall()
+        if rows:
+            return sorted(rows, key=lambda row: (*_match_score(compact_query, row["title"]), row["contentid"]))[:limit]
+
+        query_trigrams = _trigrams(compact_query)
+        rows = conn.execute(f'''
+            SELECT {_DETAIL_COLUMNS}
+            FROM {FESTIVAL_TITLE_FTS} JOIN festivals ON festivals.contentid = {FESTIVAL_TITLE_FTS}.rowid
+            WHERE {FESTIVAL_TITLE_FTS} MATCH ?
+            ORDER BY rank
+            LIMIT {MAX_FUZZY_CANDIDATES}
+        ''', (" OR ".join(_fts_phrase(trigram) for trigram in sorted(query_trigrams)),)).fetchall()
+        scored = []
+        for row in rows:
+            title_trigrams = _trigrams(_compact(row["title"]))
+            if not title_trigrams:
+                continue
+            coverage = len(query_trigrams & title_trigrams) / len(title_trigrams)
+            if coverage >= MIN_TITLE_COVERAGE:
+                scored.append(((-coverage, *_match_score(compact_query, row["title"]), row["contentid"]), row))
+        return [row for _, row in sorted(scored, key=lambda item: item[0])[:limit]]
+
+    rows = conn.execute(f'''
+        SELECT {_DETAIL_COLUMNS}
+        FROM festivals
+        WHERE replace(title, ' ', '') LIKE ?
+    ''', (f'%{compact_query}%',)).fetchall()
+    return sorted(rows, key=lambda row: (*_match_score(compact_query, row["title"]), row["contentid"]))[:limit]
+
+
 @lru_cache(maxsize=256)
 def search_festival_by_title(festival_name: str) -> dict | None:
     """
     축제 이름으로 축제 정보를 검색합니다.
 
+    정확히 일치하는 제목이 없으면 띄어쓰기를 무시한 부분 일치 검색(_find_partial_matches)의 최상위 결과를 사용합니다.
+
     Args:
         festival_name: 검색할 축제 이름
 
@@ -22,54 +144,23 @@ def search_festival_by_title(festival_name: str) -> dict | None:
         - contentid: 컨텐츠 ID
         - cat1, cat2, cat3: 카테고리
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = get_read_connection()
 
     # 1. 정확히 일치하는 제목 검색
-    cursor.execute('''
-        SELECT contentid, title, eventstartdate, eventenddate, addr1, addr2,
-               mapx, mapy, cat1, cat2, cat3, areacode
+    result = conn.execute(f'''
+        SELECT {_DETAIL_COLUMNS}
         FROM festivals
         WHERE title = ?
-    ''', (festival_name,))
-
-    result = cursor.fetchone()
+        ORDER BY contentid
+        LIMIT 1
+    ''', (festival_name,)).fetchone()
 
     if result:
-        conn.close()
         print(f"[DB] Exact match found for '{festival_name}'")
-        return {
-            "contentid": result["contentid"],
-            "title": result["title"],
-            "start_date": _format_date(result["eventstartdate"]),
-            "end_date": _format_date(result["eventenddate"]),
-            "addr1": result["addr1"],
-            "addr2": result["addr2"],
-            "mapx": result["mapx"],
-            "mapy": result["mapy"],
-            "cat1": result["cat1"],
-            "cat2": result["cat2"],
-            "cat3": result["cat3"],
-            "areacode": result["areacode"]
-        }
+        return _row_to_details(result)
 
     # 2. 부분 일치 검색 (정확한 일치를 찾지 못한 경우)
-    cursor.execute('''
-        SELECT contentid, title, eventstartdate, eventenddate, addr1, addr2,
-               mapx, mapy, cat1, cat2, cat3, areacode
-        FROM festivals
-        WHERE title LIKE ?
-        ORDER BY
-            CASE
-                WHEN title = ? THEN 1
-                WHEN title LIKE ? THEN 2
-                ELSE 3
-            END
-        LIMIT 5
-    ''', (f'%{festival_name}%', festival_name, f'{festival_name}%'))
-
-    results = cursor.fetchall()
-    conn.close()
+    results = _find_partial_matches(conn, festival_name)
 
     if results:
         print(f"[DB] Found {len(results)} partial matches for '{festival_name}':")
@@ -79,25 +170,54 @@ def search_festival_by_title(festival_name: str) -> dict | None:
         # 첫 번째 결과 반환
         best_match = results[0]
         print(f"[DB] Using best match: '{best_match['title']}'")
-
-        return {
-            "contentid": best_match["contentid"],
-            "title": best_match["title"],
-            "start_date": _format_date(best_match["eventstartdate"]),
-            "end_date": _format_date(best_match["eventenddate"]),
-            "addr1": best_match["addr1"],
-            "addr2": best_match["addr2"],
-            "mapx": best_match["mapx"],
-            "mapy": best_match["mapy"],
-            "cat1": best_match["cat1"],
-            "cat2": best_match["cat2"],
-            "cat3": best_match["cat3"],
-            "areacode": best_match["areacode"]
-        }
+        return _row_to_details(best_match)
 
     print(f"[DB] No match found for '{festival_name}'")
     return None
 
+
+def search_festivals_by_titles(festival_names) -> dict:
+    """
+    여러 축제 이름을 한 번에 검색합니다.
+
+    연결 하나로 정확히 일치하는 제목을 IN 쿼리로 먼저 찾고, 남은 이름만 부분 일치 검색을 합니다.
+    각 이름의 결과는 search_festival_by_title과 같습니다.
+
+    Args:
+        festival_names: 검색할 축제 이름 목록
+
+    Returns:
+        {축제 이름: 축제 정보 딕셔너리 또는 None}
+    """
+    names = list(dict.fromkeys(festival_names))
+    if not names:
+        return {}
+
+    results = {}
+    conn = get_read_connection()
+    for i in range(0, len(names), _EXACT_BATCH_SIZE):
+        batch = names[i:i + _EXACT_BATCH_SIZE]
+        placeholders = ", ".join("?" for _ in batch)
+        rows = conn.execute(f'''
+            SELECT {_DETAIL_COLUMNS}
+            FROM festivals
+            WHERE title IN ({placeholders})
+            ORDER BY contentid
+        ''', batch).fetchall()
+        for row in rows:
+            # 같은 제목이 여러 개면 단건 검색과 같이 하나만 사용
+            results.setdefault(row["title"], _row_to_details(row))
+    exact_count = len(results)
+
+    for name in names:
+        if name not in results:
+            matches = _find_partial_matches(conn, name, limit=1)
+            results[name] = _row_to_details(matches[0]) if matches else None
+
+    found = sum(1 for details in results.values() if details)
+    print(f"[DB] Resolved {found}/{len(names)} festival names (exact {exact_count}, partial {found - exact_count})")
+    return results
+
 def _format_date(date_value) -> str | None:
     """날짜 값을 YYYYMMDD 형식 문자열로 변환합니다."""
     if date_value is None:
@@ -0,0 +1,126 @@
+# src/infrastructure/database/job_store.py
+"""백그라운드 분석 작업 상태 저장소 (SQLite)"""
+import json
+import os
+import sqlite3
+import time
+import uuid
+
+# 작업 DB 파일 경로 (tour_data.db와 같은 database 폴더)
+JOBS_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "database", "jobs.db")
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+FINISHED_STATUSES = (SUCCEEDED, FAILED)
+
+
+class JobStore:
+    def __init__(self, db_path: str = JOBS_DB_PATH):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._initialize()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _initialize(self):
+        conn = self._connect()
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    job_type TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    progress REAL NOT NULL DEFAULT 0,
+                    message TEXT,
+                    result TEXT,
+                    error TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)')
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _execute(self, query: str, params: tuple):
+        conn = self._connect()
+        try:
+            conn.execute(query, params)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def create(self, job_type: str, params: dict) -> str:
+        """새 작업을 대기 상태로 등록하고 작업 ID를 반환합니다."""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        self._execute(
+            'INSERT INTO jobs (job_id, job_type, params, status, message, created_at, updated_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (job_id, job_type, json.dumps(params, ensure_ascii=False), QUEUED, "대기 중...", now, now)
+        )
+        return job_id
+
+    def get(self, job_id: str) -> dict | None:
+        """작업 정보를 dict로 반환합니다. 없으면 None"""
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT * FROM jobs WHERE job_id = ?', (job_id,)).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def list_unfinished(self) -> list:
+        """완료되지 않은(대기/실행 중) 작업을 생성 순서대로 반환합니다."""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                'SELECT job_id FROM jobs WHERE status IN (?, ?) ORDER BY created_at', (QUEUED, RUNNING)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [row["job_id"] for row in rows]
+
+    def mark_running(self, job_id: str):
+        now = time.time()
+        self._execute(
+            'UPDATE jobs SET status = ?, attempts = attempts + 1, started_at = ?, updated_at = ? WHERE job_id = ?',
+            (RUNNING, now, now, job_id)
+        )
+
+    def update_progress(self, job_id: str, progress: float, message: str):
+        self._execute(
+            'UPDATE jobs SET progress = ?, message = ?, updated_at = ? WHERE job_id = ?',
+            (progress, message, time.time(), job_id)
+        )
+
+    def mark_succeeded(self, job_id: str, result: dict):
+        now = time.time()
+        self._execute(
+            'UPDATE jobs SET status = ?, progress = 1, message = ?, result = ?, updated_at = ?, finished_at = ? WHERE job_id = ?',
+            (SUCCEEDED, "분석 완료", json.dumps(result, ensure_ascii=False, default=str), now, now, job_id)
+        )
+
+    def mark_failed(self, job_id: str, error: str):
+        now = time.time()
+        self._execute(
+            'UPDATE jobs SET status = ?, error = ?, updated_at = ?, finished_at = ? WHERE job_id = ?',
+            (FAILED, error, now, now, job_id)
+        )
@@ -0,0 +1,98 @@
+# src/infrastructure/database/place_repository.py
+"""축제 주변의 문화시설, 여행코스를 좌표(R*Tree) 인덱스로 조회하는 Repository"""
+import math
+from .db_manager import get_read_connection, has_table, spatial_index_name
+from .festival_repository import search_festival_by_title
+
+# 장소 종류 → 테이블
+PLACE_TABLES = {
+    "festival": "festivals",
+    "culture_facility": "culture_facilities",
+    "travel_course": "travel_courses",
+}
+ATTRACTION_TYPES = ("culture_facility", "travel_course")  # 축제 분석 결과에 붙이는 주변 관광지 종류
+DEFAULT_RADIUS_KM = 5.0
+DEFAULT_LIMIT = 10
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+
+_spatial_available = False
+
+
+def _has_spatial_index(conn) -> bool:
+    """
+    읽기 연결로 장소 테이블의 좌표 인덱스를 모두 사용할 수 있는지 확인합니다. 인덱스는 만들지 않습니다.
+    (db_manager.prepare_search_indexes) 없으면 나중에 만들어질 수 있으므로 호출할 때마다 확인합니다.
+    """
+    global _spatial_available
+    if not _spatial_available:
+        _spatial_available = all(has_table(conn, spatial_index_name(table)) for table in PLACE_TABLES.values())
+    return _spatial_available
+
+
+def haversine_km(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
+    """두 좌표(경도, 위도) 사이의 대원 거리(km)"""
+    lon1, lat1, lon2, lat2 = map(math.radians, (lon1, lat1, lon2, lat2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def find_nearby_places(mapx: float, mapy: float, radius_km: float = DEFAULT_RADIUS_KM, limit: int = DEFAULT_LIMIT,
+                       place_types=ATTRACTION_TYPES, exclude_contentid: int = None) -> list:
+    """
+    좌표(mapx=경도, mapy=위도)에서 radius_km 안에 있는 장소를 가까운 순으로 최대 limit개 반환합니다.
+
+    R*Tree로 반경을 감싸는 경위도 사각형 안의 행만 읽은 뒤 실제 거리(haversine)로 걸러 정렬합니다.
+    같은 거리에서는 contentid 순입니다.
+
+    Args:
+        place_types: PLACE_TABLES의 키 목록 (기본: 문화시설, 여행코스)
+        exclude_contentid: 결과에서 뺄 contentid (기준 축제 자신 등)
+
+    Returns:
+        [{place_type, contentid, title, addr1, mapx, mapy, cat1, cat2, cat3, firstimage, distance_km}, ...]
+    """
+    if not mapx or not mapy or radius_km <= 0 or limit <= 0:
+        return []
+    conn = get_read_connection()
+    if not _has_spatial_index(conn):
+        return []
+
+    lat_delta = radius_km / KM_PER_DEGREE_LAT
+    lon_delta = radius_km / (KM_PER_DEGREE_LAT * max(math.cos(math.radians(mapy)), 1e-6))
+    bounds = (mapx + lon_delta, mapx - lon_delta, mapy + lat_delta, mapy - lat_delta)
+
+    places = []
+    for place_type in place_types:
+        table = PLACE_TABLES[place_type]
+        index = spatial_index_name(table)
+        rows = conn.execute(f'''
+            SELECT t.contentid, t.title, t.addr1, t.mapx, t.mapy, t.cat1, t.cat2, t.cat3, t.firstimage
+            FROM {index} r JOIN {table} t ON t.contentid = r.id
+            WHERE r.min_x <= ? AND r.max_x >= ? AND r.min_y <= ? AND r.max_y >= ?
+        ''', bounds).fetchall()
+        for row in rows:
+            if row["contentid"] == exclude_contentid:
+                continue
+            distance = haversine_km(mapx, mapy, row["mapx"], row["mapy"])
+            if distance <= radius_km:
+                places.append({"place_type": place_type, **dict(row), "distance_km": round(distance, 3)})
+
+    places.sort(key=lambda place: (place["distance_km"], place["contentid"]))
+    return places[:limit]
+
+
+def find_nearby_attractions(festival_name: str, radius_km: float = DEFAULT_RADIUS_KM, limit: int = DEFAULT_LIMIT,
+                            place_types=ATTRACTION_TYPES) -> dict | None:
+    """
+    축제 이름으로 축제를 찾아 그 좌표 주변의 장소를 반환합니다.
+
+    Returns:
+        {"festival": 축제 정보, "places": find_nearby_places 결과}. 축제를 찾지 못하면 None
+    """
+    festival = search_festival_by_title(festival_name)
+    if not festival:
+        return None
+    places = find_nearby_places(festival["mapx"], festival["mapy"], radius_km, limit, place_types,
+                                exclude_contentid=festival["contentid"] if "festival" in place_types else None)
+    return {"festival": festival, "places": places}
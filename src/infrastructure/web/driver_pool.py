@@ -0,0 +1,161 @@
+# src/infrastructure/web/driver_pool.py
+"""
+Selenium WebDriver 풀
+
+여러 스레드(요청, 블로그 평가 작업자)가 하나의 Chrome을 공유하면 프레임 전환
+(switch_to.frame/default_content) 상태가 서로 꼬이므로, 드라이버를 작업 단위로 빌려주고 반납받습니다.
+
+- 드라이버는 처음 필요할 때 생성합니다 (lazy warm-up).
+- 빌려줄 때마다 응답 여부를 확인하고, 죽은 드라이버는 폐기 후 새로 만듭니다.
+- max_pages 이상 사용했거나 사용 중 예외가 발생한 드라이버는 반납 시 종료하고 다음 요청 때 새로 만듭니다.
+"""
+import threading
+from contextlib import contextmanager
+
+
+class _PooledDriver:
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+
+
+class WebDriverPool:
+    def __init__(self, factory, size: int = 2, max_pages: int = 200):
+        """
+        Args:
+            factory: 새 WebDriver를 생성하는 함수 (예: create_driver)
+            size: 동시에 유지할 최대 드라이버 수
+            max_pages: 드라이버 하나가 처리할 최대 페이지 수 (초과 시 재생성)
+        """
+        self._factory = factory
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self._idle = []
+        self._created = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats = {"created": 0, "recycled": 0, "crashed": 0, "leases": 0}
+
+    def _is_healthy(self, driver) -> bool:
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _new_entry(self) -> _PooledDriver:
+        """슬롯을 이미 확보한 상태에서 새 드라이버를 생성합니다. 실패하면 슬롯을 되돌립니다."""
+        try:
+            driver = self._factory()
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._stats["created"] += 1
+        return _PooledDriver(driver)
+
+    def _acquire(self, timeout=None) -> _PooledDriver:
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("WebDriverPool이 이미 종료되었습니다.")
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._created < self.size:
+                    self._created += 1
+                    entry = None
+                    break
+                if not self._cond.wait(timeout):
+                    raise TimeoutError(f"{timeout}초 안에 사용 가능한 WebDriver가 없습니다.")
+            self._stats["leases"] += 1
+
+        if entry is None:
+            return self._new_entry()
+
+        if not self._is_healthy(entry.driver):
+            print("[WebDriverPool] 응답하지 않는 드라이버를 폐기하고 새로 생성합니다.")
+            self._quit(entry.driver)
+            with self._cond:
+                self._stats["crashed"] += 1
+            return self._new_entry()
+        return entry
+
+    def _release(self, entry: _PooledDriver, broken: bool):
+        entry.pages += 1
+        retire = broken or self._closed or entry.pages >= self.max_pages
+        if retire:
+            self._quit(entry.driver)
+        with self._cond:
+            if retire:
+                self._created -= 1
+                if broken:
+                    self._stats["crashed"] += 1
+                elif not self._closed:
+                    self._stats["recycled"] += 1
+            else:
+                self._idle.append(entry)
+            self._cond.notify()
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """
+        드라이버 하나를 빌려줍니다. with 블록이 끝나면 자동으로 반납됩니다.
+
+        Args:
+            timeout: 사용 가능한 드라이버를 기다릴 최대 시간(초). None이면 무한 대기
+
+        Example:
+            with pool.lease() as driver:
+                content = scrape_blog_content(driver, url)
+        """
+        entry = self._acquire(timeout)
+        broken = False
+        try:
+            yield entry.driver
+        except BaseException:
+            broken = True
+            raise
+        finally:
+            self._release(entry, broken)
+
+    def warm_up(self, count: int = 1):
+        """드라이버를 미리 count개(최대 size개)까지 생성해 둡니다."""
+        while True:
+            with self._cond:
+                if self._closed or self._created >= min(count, self.size):
+                    return
+                self._created += 1
+            entry = self._new_entry()
+            with self._cond:
+                self._idle.append(entry)
+                self._cond.notify()
+
+    def stats(self) -> dict:
+        """풀 상태와 누적 통계를 반환합니다."""
+        with self._cond:
+            return {
+                "size": self.size,
+                "alive": self._created,
+                "idle": len(self._idle),
+                "in_use": self._created - len(self._idle),
+                **self._stats,
+            }
+
+    def close(self):
+        """유휴 드라이버를 모두 종료합니다. 사용 중인 드라이버는 반납 시 종료됩니다."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            self._quit(entry.driver)
@@ -0,0 +1,108 @@
+# src/infrastructure/web/http_client.py
+"""
+공유 HTTP 클라이언트
+
+외부 API를 호출할 때마다 requests.get/post를 새로 쓰면 매번 TCP/TLS 연결을 새로 맺습니다.
+HttpClient는 연결 풀을 가진 세션 하나를 공유해 keep-alive 연결을 재사용하고,
+기본 타임아웃, 429/5xx 응답에 대한 지수 백오프 재시도, 엔드포인트별 응답 시간 통계를 제공합니다.
+"""
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config import get_naver_http_pool_size, get_naver_http_timeout, get_naver_http_retries
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class HttpClient:
+    def __init__(self, name: str, pool_size: int = 10, timeout: float = 10, retries: int = 3, backoff_factor: float = 0.5):
+        """
+        Args:
+            name: 로그와 통계에 표시할 클라이언트 이름
+            pool_size: 호스트당 유지할 최대 연결 수
+            timeout: 요청에 timeout을 지정하지 않았을 때 사용할 기본 타임아웃(초)
+            retries: 연결 오류, 429/5xx 응답 시 최대 재시도 횟수 (0이면 재시도하지 않음)
+            backoff_factor: 재시도 대기 시간 계수 (backoff_factor * 2^(시도 횟수-1)초). Retry-After 헤더가 있으면 그 값을 따름
+        """
+        self.name = name
+        self.timeout = timeout
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,  # 재시도 후에도 실패하면 마지막 응답을 그대로 반환
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def request(self, method: str, url: str, endpoint: str = None, **kwargs) -> requests.Response:
+        """
+        요청을 보내고 응답을 반환합니다. 재시도를 포함한 전체 소요 시간을 endpoint(없으면 URL) 단위로 기록합니다.
+        연결 오류나 타임아웃은 재시도 후에도 실패하면 requests 예외를 그대로 발생시킵니다.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        started = time.perf_counter()
+        status = None
+        try:
+            response = self.session.request(method, url, **kwargs)
+            status = response.status_code
+            return response
+        finally:
+            self._record(endpoint or url, time.perf_counter() - started, status)
+
+    def get(self, url: str, endpoint: str = None, **kwargs) -> requests.Response:
+        return self.request("GET", url, endpoint=endpoint, **kwargs)
+
+    def post(self, url: str, endpoint: str = None, **kwargs) -> requests.Response:
+        return self.request("POST", url, endpoint=endpoint, **kwargs)
+
+    def _record(self, endpoint: str, elapsed: float, status):
+        with self._lock:
+            metric = self._metrics.setdefault(endpoint, {"requests": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+            metric["requests"] += 1
+            if status is None or status >= 400:
+                metric["errors"] += 1
+            metric["total_seconds"] += elapsed
+            metric["max_seconds"] = max(metric["max_seconds"], elapsed)
+
+    def stats(self) -> dict:
+        """엔드포인트별 요청 수, 실패 수(연결 오류/4xx/5xx), 평균/최대 응답 시간(ms)을 반환합니다."""
+        with self._lock:
+            return {
+                endpoint: {
+                    "requests": m["requests"],
+                    "errors": m["errors"],
+                    "avg_ms": round(m["total_seconds"] / m["requests"] * 1000, 1) if m["requests"] else 0.0,
+                    "max_ms": round(m["max_seconds"] * 1000, 1),
+                }
+                for endpoint, m in self._metrics.items()
+            }
+
+
+_naver_client = None
+_naver_client_lock = threading.Lock()
+
+
+def get_naver_http_client() -> HttpClient:
+    """네이버 오픈 API(검색, 데이터랩) 호출에 공유하는 HttpClient를 반환합니다."""
+    global _naver_client
+    if _naver_client is None:
+        with _naver_client_lock:
+            if _naver_client is None:
+                _naver_client = HttpClient(
+                    "naver-openapi",
+                    pool_size=get_naver_http_pool_size(),
+                    timeout=get_naver_http_timeout(),
+                    retries=get_naver_http_retries(),
+                )
+    return _naver_client
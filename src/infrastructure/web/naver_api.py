@@ -1,20 +1,87 @@
+import math
 import requests
+import threading
 import urllib.parse
-from src.config import get_naver_api_keys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from src.config import get_naver_api_keys, get_naver_search_qps, get_naver_search_concurrency
+from .http_client import get_naver_http_client
+from .rate_limiter import TokenBucket
+
+SEARCH_PAGE_SIZE = 100  # 검색 API가 한 번에 돌려주는 최대 결과 수 (display)
+SEARCH_MAX_START = 1000  # 검색 API가 허용하는 최대 start 값
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def _get_rate_limiter() -> TokenBucket:
+    """모든 스레드가 공유하는 검색 API 호출 속도 제한기를 반환합니다."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = TokenBucket(get_naver_search_qps())
+    return _rate_limiter
+
 
 def search_naver_blog_page(query, start_index=1):
     client_id, client_secret = get_naver_api_keys()
     encText = urllib.parse.quote(query)
-    url = f"https://openapi.naver.com/v1/search/blog.json?query={encText}&display=100&start={start_index}"
+    url = f"https://openapi.naver.com/v1/search/blog.json?query={encText}&display={SEARCH_PAGE_SIZE}&start={start_index}"
     headers = {
         "X-Naver-Client-Id": client_id,
         "X-Naver-Client-Secret": client_secret,
     }
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        _get_rate_limiter().acquire()
+        response = get_naver_http_client().get(url, endpoint="blog_search", headers=headers)
         response.raise_for_status()  # HTTP 오류 발생 시 예외 발생
         data = response.json()
         return data.get("items", [])
     except requests.exceptions.RequestException as e:
         print(f"API 호출 오류: {e}")
         return []
+
+
+def iter_naver_blog_pages(query, max_pages=10, expected_items=None):
+    """
+    검색 결과 페이지(start=1, 101, 201, ...)를 병렬로 미리 요청하고, 페이지 순서대로 결과 목록을 생성합니다.
+
+    소비 측이 앞 페이지를 처리하는 동안 뒤 페이지를 받아 두며, 동시에 요청하는 페이지는 최대
+    NAVER_SEARCH_CONCURRENCY개입니다. expected_items를 넘기면 그 수를 채우는 데 필요한 페이지 수 이상은
+    미리 요청하지 않아 API 호출량을 아낍니다. 결과가 비었거나 한 페이지를 다 채우지 못하면 마지막 페이지로
+    보고 멈추고, 소비 측이 순회를 멈추면 아직 시작하지 않은 요청은 취소됩니다.
+    """
+    start_indexes = [
+        1 + page * SEARCH_PAGE_SIZE for page in range(max_pages)
+        if 1 + page * SEARCH_PAGE_SIZE <= SEARCH_MAX_START
+    ]
+    if not start_indexes:
+        return
+    prefetch_pages = min(get_naver_search_concurrency(), len(start_indexes))
+    if expected_items:
+        prefetch_pages = min(prefetch_pages, math.ceil(expected_items / SEARCH_PAGE_SIZE))
+    prefetch_pages = max(1, prefetch_pages)
+
+    executor = ThreadPoolExecutor(max_workers=prefetch_pages, thread_name_prefix="naver-search")
+    remaining = iter(start_indexes)
+    pending = deque()
+    try:
+        for start_index in remaining:
+            pending.append(executor.submit(search_naver_blog_page, query, start_index))
+            if len(pending) >= prefetch_pages:
+                break
+        while pending:
+            items = pending.popleft().result()
+            if not items:
+                return
+            is_last_page = len(items) < SEARCH_PAGE_SIZE
+            next_start = None if is_last_page else next(remaining, None)
+            if next_start is not None:
+                pending.append(executor.submit(search_naver_blog_page, query, next_start))
+            yield items
+            if is_last_page:
+                return
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
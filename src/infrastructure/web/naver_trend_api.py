@@ -9,8 +9,12 @@ matplotlib.use('Agg')  # GUI 없는 백엔드 사용 (FastAPI 비동기 환경 
 import matplotlib.pyplot as plt
 from matplotlib import font_manager
 import io
+import threading
 import uuid
+from collections import OrderedDict
 from ...config import get_naver_trend_api_keys
+from .http_client import get_naver_http_client
+from ..cache.trend_store import get_trend_store
 
 # 한글 폰트 설정
 try:
@@ -39,10 +43,26 @@ def safe_filename(name: str) -> str:
     }
     return re.sub(invalid_pattern, lambda m: replace_map[m.group()], name)
 
-def get_trend_data(keyword, start_date, end_date):
-    """네이버 데이터랩 트렌드 API를 호출하여 데이터를 반환합니다."""
+DATALAB_SEARCH_URL = "https://openapi.naver.com/v1/datalab/search"
+DATALAB_MAX_KEYWORD_GROUPS = 5  # 데이터랩 검색어 트렌드 API가 한 요청에 허용하는 최대 주제어 수
+TREND_HISTORY_DAYS = 365  # create_trend_graph가 조회하는 기간(일)
+
+# hint_trend_keywords()로 알려 둔 (기간 → 키워드 목록)
+_PREFETCH_MAX_WINDOWS = 8
+_prefetch_hints = OrderedDict()  # (start, end) -> [keyword, ...]
+_prefetch_lock = threading.Lock()
+
+
+def _window_key(start_date, end_date) -> tuple:
+    return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+
+
+def _request_trend_groups(keywords: list, start_date, end_date, before_request=None):
+    """
+    keywords를 주제어 그룹으로 한 번에 요청하고 결과 목록을 반환합니다. 실패하면 None
+    before_request를 넘기면 HTTP 요청을 보내기 직전에 호출합니다. (요청 속도 제한 등)
+    """
     client_id, client_secret = get_naver_trend_api_keys()
-    url = "https://openapi.naver.com/v1/datalab/search"
     headers = {
         "X-Naver-Client-Id": client_id,
         "X-Naver-Client-Secret": client_secret,
@@ -52,30 +72,155 @@ def get_trend_data(keyword, start_date, end_date):
         "startDate": start_date.strftime("%Y-%m-%d"),
         "endDate": end_date.strftime("%Y-%m-%d"),
         "timeUnit": "date",
-        "keywordGroups": [{"groupName": keyword, "keywords": [keyword]}]
+        "keywordGroups": [{"groupName": keyword, "keywords": [keyword]} for keyword in keywords]
     }
-    res = requests.post(url, headers=headers, json=body)
+    label = ", ".join(keywords)
+    if before_request is not None:
+        before_request()
+    try:
+        res = get_naver_http_client().post(DATALAB_SEARCH_URL, endpoint="datalab_search", headers=headers, json=body)
+    except requests.exceptions.RequestException as e:
+        print(f"❌ {label} 요청 실패: {e}")
+        return None
 
     if res.status_code != 200:
-        print(f"❌ {keyword} 오류: {res.status_code}")
-        return pd.DataFrame()
+        print(f"❌ {label} 오류: {res.status_code}")
+        return None
+    return res.json().get('results', [])
 
-    results = res.json().get('results', [])
-    if not results or not results[0].get('data'):
-        print(f"⚠️ {keyword} 검색 결과 없음")
-        return pd.DataFrame()
 
-    df = pd.DataFrame(results[0]['data'])
+def _to_trend_df(keyword: str, data: list) -> pd.DataFrame:
+    """API 응답의 data 목록을 DataFrame으로 바꾸고, 해당 키워드의 최댓값이 100이 되도록 다시 정규화합니다."""
+    df = pd.DataFrame(data)
     df['period'] = pd.to_datetime(df['period'])
     df['ratio'] = df['ratio'].astype(float)
+    max_ratio = df['ratio'].max()
+    if max_ratio > 0:
+        df['ratio'] = df['ratio'] / max_ratio * 100
     df['keyword'] = keyword
     return df
 
+
+def _fetch_trend_batch(keywords: list, start_date, end_date, before_request=None):
+    """
+    keywords를 한 번에 요청해 {키워드: DataFrame}을 반환합니다. 요청 자체가 실패하면 None
+
+    데이터랩은 한 요청 안의 모든 주제어를 함께 정규화(전체 최댓값 = 100)하므로, 키워드마다 자신의 최댓값이
+    100이 되도록 다시 정규화합니다. 검색량이 큰 키워드와 묶여 값이 모두 0으로 내려간 키워드는 따로 한 번 더
+    요청하며, 그 요청이 실패한 키워드는 결과에서 빠집니다. before_request는 다시 요청할 때를 포함해
+    HTTP 요청마다 호출됩니다.
+    """
+    results = _request_trend_groups(keywords, start_date, end_date, before_request)
+    if results is None:
+        return None
+
+    data_by_keyword = {result.get('title'): result.get('data') for result in results}
+    trends = {}
+    for keyword in keywords:
+        data = data_by_keyword.get(keyword)
+        if data and any(float(point.get('ratio', 0)) > 0 for point in data):
+            trends[keyword] = _to_trend_df(keyword, data)
+        elif data and len(keywords) > 1:
+            # 함께 요청한 키워드에 비해 검색량이 너무 작아 0으로 표시된 경우
+            trends.update(_fetch_trend_batch([keyword], start_date, end_date, before_request) or {})
+        else:
+            print(f"⚠️ {keyword} 검색 결과 없음")
+            trends[keyword] = pd.DataFrame()
+    return trends
+
+
+def get_trend_data_batch(keywords: list, start_date, end_date, before_request=None) -> dict:
+    """
+    최대 5개 키워드의 트렌드를 한 번의 요청으로 받아 {키워드: DataFrame} 형태로 반환합니다.
+
+    키워드마다 자신의 최댓값이 100이 되도록 다시 정규화하므로 키워드 하나씩 요청한 결과와 같은 기준입니다.
+    검색 결과가 없는 키워드는 빈 DataFrame이고, 요청에 실패한 키워드는 결과에 포함되지 않습니다.
+    값이 모두 0으로 내려간 키워드는 따로 다시 요청하므로 요청이 최대 5번까지 늘어날 수 있으며,
+    before_request(예: 토큰 버킷의 acquire)는 그 요청마다 호출됩니다.
+    """
+    keywords = list(dict.fromkeys(keywords))
+    if len(keywords) > DATALAB_MAX_KEYWORD_GROUPS:
+        raise ValueError(f"한 번에 요청할 수 있는 키워드는 최대 {DATALAB_MAX_KEYWORD_GROUPS}개입니다. ({len(keywords)}개 요청)")
+    if not keywords:
+        return {}
+    return _fetch_trend_batch(keywords, start_date, end_date, before_request) or {}
+
+
+def hint_trend_keywords(keywords: list, start_date, end_date):
+    """
+    곧 같은 기간으로 조회할 키워드 목록을 알려 둡니다.
+
+    이후 get_trend_data()가 이 기간으로 호출되면 아직 조회하지 않은 다른 키워드 중 받아야 할 구간이
+    이번 요청 구간 안에 들어가는 키워드를 최대 4개까지 함께 요청하고,
+    받아 둔 결과는 해당 키워드가 조회될 때 바로 반환합니다. (카테고리 분석처럼 여러 축제를 연달아 조회할 때 사용)
+    """
+    window = _window_key(start_date, end_date)
+    with _prefetch_lock:
+        hinted = _prefetch_hints.setdefault(window, [])
+        hinted.extend(k for k in dict.fromkeys(keywords) if k not in hinted)
+        _prefetch_hints.move_to_end(window)
+        while len(_prefetch_hints) > _PREFETCH_MAX_WINDOWS:
+            _prefetch_hints.popitem(last=False)
+
+
+def _claim_companions(store, keyword, start_date, end_date, fetch_start, fetch_end) -> list:
+    """
+    같은 기간으로 조회 예정인 키워드 중 keyword와 함께 요청할 키워드를 최대 4개 골라 알림 목록에서 꺼냅니다.
+
+    함께 받은 구간은 그 키워드의 저장 값에 그대로 병합되므로, 키워드 자신이 받아야 할 구간이
+    이번 요청 구간(fetch_start ~ fetch_end) 안에 들어가는 키워드만 고릅니다.
+    나머지는 자기 차례에 따로 요청하도록 목록에 남겨 둡니다.
+    """
+    with _prefetch_lock:
+        hinted = _prefetch_hints.get(_window_key(start_date, end_date), [])
+        if keyword not in hinted:
+            return []
+        hinted.remove(keyword)
+        candidates = list(hinted)
+
+    companions = []
+    for candidate in candidates:
+        if len(companions) >= DATALAB_MAX_KEYWORD_GROUPS - 1:
+            break
+        candidate_range = store.plan_fetch(candidate, start_date, end_date, record_stats=False)
+        if candidate_range is not None and fetch_start <= candidate_range[0] and candidate_range[1] <= fetch_end:
+            companions.append(candidate)
+
+    with _prefetch_lock:
+        # 확인하는 동안 다른 스레드가 꺼내 간 키워드는 빼서 중복 요청하지 않습니다.
+        companions = [candidate for candidate in companions if candidate in hinted]
+        for candidate in companions:
+            hinted.remove(candidate)
+    return companions
+
+
+def get_trend_data(keyword, start_date, end_date):
+    """
+    키워드의 기간별 검색량 트렌드를 반환합니다.
+
+    트렌드 저장소(cache/trends.db)에 없는 날짜만 네이버 데이터랩 트렌드 API로 받아 채운 뒤,
+    저장된 값에서 요청 기간을 잘라 최댓값 100 기준으로 돌려줍니다.
+    """
+    store = get_trend_store()
+    fetch_range = store.plan_fetch(keyword, start_date, end_date)
+    if fetch_range is not None:
+        fetch_start, fetch_end = fetch_range
+        companions = _claim_companions(store, keyword, start_date, end_date, fetch_start, fetch_end)
+        trends = _fetch_trend_batch([keyword, *companions], fetch_start, fetch_end)
+        for fetched_keyword, df in (trends or {}).items():
+            store.merge(fetched_keyword, df, fetch_start, fetch_end)
+
+    return store.get(keyword, start_date, end_date)
+
+
+def get_trend_history_window():
+    """create_trend_graph가 조회하는 기간 (오늘 기준 지난 1년)을 (시작일, 종료일)로 반환합니다."""
+    today = datetime.date.today()
+    return today - datetime.timedelta(days=TREND_HISTORY_DAYS), today
+
 def create_trend_graph(keyword: str, festival_start_date=None, festival_end_date=None):
     """특정 키워드에 대한 트렌드 그래프를 생성하여 이미지 파일 경로와 데이터프레임을 반환합니다."""
-    today = datetime.date.today()
-    start_for_api = today - datetime.timedelta(days=365)
-    end_for_api = today
+    start_for_api, end_for_api = get_trend_history_window()
 
     df_trend = get_trend_data(keyword, start_for_api, end_for_api)
 
@@ -0,0 +1,38 @@
+# src/infrastructure/web/rate_limiter.py
+"""
+외부 API 호출 속도 제한 (토큰 버킷)
+
+검색 페이지를 여러 스레드에서 동시에 요청해도 초당 호출 수가 API 허용량을 넘지 않도록,
+호출 전에 acquire()로 토큰을 하나씩 받아 갑니다. 토큰은 초당 rate개씩 채워지며 최대 burst개까지 쌓입니다.
+"""
+import threading
+import time
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int = None):
+        """
+        Args:
+            rate: 초당 허용 호출 수. 0 이하이면 제한하지 않음
+            burst: 한 번에 몰아서 쓸 수 있는 최대 토큰 수. None이면 rate(최소 1)
+        """
+        self.rate = rate
+        self.capacity = max(1, int(burst if burst is not None else rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰을 하나 받을 때까지 기다립니다."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
@@ -1,9 +1,25 @@
 import re
+import urllib.parse
+import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
+from src.config import is_scraper_fast_path_enabled
+
+# 블로그 본문(PostView)을 브라우저 없이 가져올 때 사용하는 공유 세션 (keep-alive 연결 재사용)
+_BLOG_HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Referer": "https://blog.naver.com/",
+}
+_blog_session = requests.Session()
+_blog_session.headers.update(_BLOG_HTTP_HEADERS)
+_blog_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
 def parse_component_text(element):
     text = element.get_text(strip=True)
@@ -17,7 +33,135 @@ def parse_component_text(element):
     sentences = re.split(r'(?<=[.?!~…])\s+', text)
     return [s.strip() for s in sentences if s.strip()]
 
-def scrape_blog_content(driver, url: str) -> str:
+def parse_blog_post_id(url: str) -> tuple[str, str] | None:
+    """
+    네이버 블로그 URL에서 (blogId, logNo)를 추출합니다.
+
+    지원 형식:
+        - https://blog.naver.com/{blogId}/{logNo}
+        - https://m.blog.naver.com/{blogId}/{logNo}
+        - https://blog.naver.com/PostView.naver?blogId=...&logNo=...
+    """
+    try:
+        parsed = urllib.parse.urlparse(url)
+    except ValueError:
+        return None
+    if not parsed.netloc.endswith("blog.naver.com"):
+        return None
+
+    query = urllib.parse.parse_qs(parsed.query)
+    if query.get("blogId") and query.get("logNo"):
+        return query["blogId"][0], query["logNo"][0]
+
+    parts = [p for p in parsed.path.split("/") if p]
+    if len(parts) >= 2 and parts[1].isdigit():
+        return parts[0], parts[1]
+    return None
+
+def build_postview_url(blog_id: str, log_no: str) -> str:
+    """mainFrame iframe이 실제로 불러오는 PostView 주소를 만듭니다."""
+    query = urllib.parse.urlencode({
+        "blogId": blog_id, "logNo": log_no,
+        "redirect": "Dlog", "widgetTypeCall": "true", "directAccess": "false",
+    })
+    return f"https://blog.naver.com/PostView.naver?{query}"
+
+def parse_blog_html(html_content: str) -> str:
+    """본문 컨테이너(se-main-container 또는 postViewArea)의 HTML에서 문장을 추출합니다."""
+    soup = BeautifulSoup(html_content, "html.parser")
+
+    # 스마트에디터 ONE 컴포넌트 기반 파싱
+    parsed_sentences = []
+    components = soup.find_all("div", class_="se-component", recursive=False)
+    if not components: # 구형 에디터 또는 다른 구조일 경우 대비
+        components = soup.select("div.se-component") # 더 넓은 범위로 탐색
+
+    for component in components:
+        if "se-text" in component.get("class", []):
+            parsed_sentences.extend(parse_component_text(component))
+        elif "se-image" in component.get("class", []):
+            caption = component.select_one(".se-caption")
+            if caption:
+                parsed_sentences.extend(parse_component_text(caption))
+        elif "se-list" in component.get("class", []):
+            list_items = component.select("li")
+            for li in list_items:
+                parsed_sentences.extend(parse_component_text(li))
+        elif "se-quote" in component.get("class", []):
+            parsed_sentences.extend(parse_component_text(component))
+        # 추가적인 se-component 타입들 (지도, 링크, 테이블 등) 파싱
+        elif "se-map" in component.get("class", []):
+            map_title = component.select_one(".se-map-title")
+            if map_title:
+                parsed_sentences.extend(parse_component_text(map_title))
+        elif "se-oglink" in component.get("class", []):
+            link_title = component.select_one(".se-oglink-title")
+            if link_title:
+                parsed_sentences.extend(parse_component_text(link_title))
+        elif "se-table" in component.get("class", []):
+            cells = component.select("td, th")
+            for cell in cells:
+                parsed_sentences.extend(parse_component_text(cell))
+
+    # 인사말, 마무리말 등 필터링
+    final_sentences = []
+    greeting_pattern = re.compile(r"^(안녕하세요|여러분|구독자님)")
+    closing_pattern = re.compile(r"(감사합니다|구동과|좋아요|알림 설정)") # '구독과' 오타 수정
+    for i, sentence in enumerate(parsed_sentences):
+        sentence = re.sub(r'\s+', ' ', sentence).strip()
+        sentence = sentence.replace("\u200b", "") # 제로폭 공백 제거
+        if i < 2 and greeting_pattern.search(sentence):
+            continue
+        if i > len(parsed_sentences) - 3 and closing_pattern.search(sentence):
+            continue
+        if sentence:
+            final_sentences.append(sentence)
+
+    return "\n".join(final_sentences)
+
+def fetch_blog_content_http(url: str, timeout: float = 5) -> str | None:
+    """
+    브라우저 없이 PostView HTML을 직접 받아 본문을 추출합니다 (fast path).
+
+    네이버 블로그 URL이 아니거나, 요청/파싱에 실패하면 None을 반환하므로
+    호출 측은 Selenium 경로로 대체할 수 있습니다.
+    """
+    if not is_scraper_fast_path_enabled():
+        return None
+    post_id = parse_blog_post_id(url)
+    if not post_id:
+        return None
+
+    try:
+        response = _blog_session.get(build_postview_url(*post_id), timeout=timeout)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        print(f"블로그 HTTP 요청 실패, Selenium으로 대체 ({url}): {e}")
+        return None
+
+    soup = BeautifulSoup(response.text, "html.parser")
+    content_element = soup.select_one("div.se-main-container") or soup.select_one("div#postViewArea")
+    if content_element is None:
+        return None
+
+    content = parse_blog_html(content_element.decode_contents())
+    if not content:
+        content = content_element.get_text("\n", strip=True)
+    return content or None
+
+def scrape_blog_content(driver, url: str, fast_path: bool = True) -> str:
+    """
+    블로그 본문을 가져옵니다.
+
+    fast_path가 True이면 먼저 HTTP로 PostView를 가져오고, 실패한 경우에만 Selenium을 사용합니다.
+    """
+    if fast_path:
+        content = fetch_blog_content_http(url)
+        if content:
+            return content
+    if driver is None:
+        return "오류: 본문을 HTTP로 가져오지 못했고 사용할 WebDriver가 없습니다."
+
     try:
         driver.get(url)
         WebDriverWait(driver, 10).until(
@@ -34,61 +178,13 @@ def scrape_blog_content(driver, url: str) -> str:
             # 구형 에디터 기준
             content_element = driver.find_element(By.CSS_SELECTOR, "div#postViewArea")
 
-        html_content = content_element.get_attribute("innerHTML")
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        # 스마트에디터 ONE 컴포넌트 기반 파싱
-        parsed_sentences = []
-        components = soup.find_all("div", class_="se-component", recursive=False)
-        if not components: # 구형 에디터 또는 다른 구조일 경우 대비
-            components = soup.select("div.se-component") # 더 넓은 범위로 탐색
-
-        for component in components:
-            if "se-text" in component.get("class", []):
-                parsed_sentences.extend(parse_component_text(component))
-            elif "se-image" in component.get("class", []):
-                caption = component.select_one(".se-caption")
-                if caption:
-                    parsed_sentences.extend(parse_component_text(caption))
-            elif "se-list" in component.get("class", []):
-                list_items = component.select("li")
-                for li in list_items:
-                    parsed_sentences.extend(parse_component_text(li))
-            elif "se-quote" in component.get("class", []):
-                parsed_sentences.extend(parse_component_text(component))
-            # 추가적인 se-component 타입들 (지도, 링크, 테이블 등) 파싱
-            elif "se-map" in component.get("class", []):
-                map_title = component.select_one(".se-map-title")
-                if map_title:
-                    parsed_sentences.extend(parse_component_text(map_title))
-            elif "se-oglink" in component.get("class", []):
-                link_title = component.select_one(".se-oglink-title")
-                if link_title:
-                    parsed_sentences.extend(parse_component_text(link_title))
-            elif "se-table" in component.get("class", []):
-                cells = component.select("td, th")
-                for cell in cells:
-                    parsed_sentences.extend(parse_component_text(cell))
-
-        # 인사말, 마무리말 등 필터링
-        final_sentences = []
-        greeting_pattern = re.compile(r"^(안녕하세요|여러분|구독자님)")
-        closing_pattern = re.compile(r"(감사합니다|구동과|좋아요|알림 설정)") # '구독과' 오타 수정
-        for i, sentence in enumerate(parsed_sentences):
-            sentence = re.sub(r'\s+', ' ', sentence).strip()
-            sentence = sentence.replace("\u200b", "") # 제로폭 공백 제거
-            if i < 2 and greeting_pattern.search(sentence):
-                continue
-            if i > len(parsed_sentences) - 3 and closing_pattern.search(sentence):
-                continue
-            if sentence:
-                final_sentences.append(sentence)
+        content = parse_blog_html(content_element.get_attribute("innerHTML"))
 
         # 파싱된 문장이 없으면, 원본 텍스트라도 반환
-        if not final_sentences:
+        if not content:
             return content_element.text
 
-        return "\n".join(final_sentences)
+        return content
 
     except TimeoutException:
         return "오류: mainFrame을 찾거나 컨텐츠를 로드하는 데 시간이 너무 오래 걸립니다."
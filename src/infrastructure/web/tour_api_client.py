@@ -5,6 +5,7 @@
 """
 from functools import lru_cache
 from ..database.festival_repository import search_festival_by_title as _search_db
+from ..database.festival_repository import search_festivals_by_titles as _search_db_bulk
 
 @lru_cache(maxsize=256)
 def get_festival_details(festival_name: str) -> dict | None:
@@ -20,6 +21,19 @@ def get_festival_details(festival_name: str) -> dict | None:
     """
     return _search_db(festival_name)
 
+def get_festival_details_bulk(festival_names: list) -> dict:
+    """
+    여러 축제 이름의 상세 정보를 DB 연결 하나로 한 번에 조회합니다.
+    카테고리 분석처럼 축제 목록 전체의 정보가 필요할 때 축제마다 따로 조회하지 않도록 사용합니다.
+
+    Args:
+        festival_names: 검색할 축제 이름 목록
+
+    Returns:
+        {축제 이름: 축제 정보 딕셔너리 또는 None}
+    """
+    return _search_db_bulk(festival_names)
+
 def get_festival_period(festival_name: str) -> tuple[str | None, str | None]:
     """
     축제 이름으로 축제 기간을 조회합니다.
@@ -0,0 +1,29 @@
+# tests/conftest.py
+import os
+import sys
+
+# 프로젝트 루트를 import 경로에 추가해 `src.` 패키지를 그대로 불러옵니다.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+
+@pytest.fixture
+def tour_db(tmp_path, monkeypatch):
+    """임시 tour_data.db로 바꾸고 테이블과 검색 인덱스를 만듭니다."""
+    from src.infrastructure.database import db_manager, festival_repository, place_repository
+
+    def reset():
+        conn = getattr(db_manager._local, "read_conn", None)
+        if conn is not None:
+            conn.close()
+        db_manager._local.read_conn = None
+        festival_repository._fts_available = False
+        place_repository._spatial_available = False
+        festival_repository.search_festival_by_title.cache_clear()
+
+    monkeypatch.setattr(db_manager, "DB_PATH", str(tmp_path / "tour_data.db"))
+    reset()
+    db_manager.initialize_database()
+    yield db_manager.DB_PATH
+    reset()
@@ -0,0 +1,54 @@
+# tests/test_category_checkpoint_store.py
+import time
+
+import pandas as pd
+
+from src.infrastructure.cache.category_checkpoint_store import CategoryCheckpointStore
+
+FESTIVALS = ["강릉커피축제", "진해군항제", "보령머드축제"]
+
+
+def test_resume_returns_saved_results_and_empty_outcomes(tmp_path):
+    store = CategoryCheckpointStore(str(tmp_path / "checkpoints.db"))
+    assert store.start("run", "축제", FESTIVALS) == {}
+
+    result = {"total_pos": 3, "blog_results_df": pd.DataFrame({"링크": ["a", "b"]})}
+    store.save_festival("run", "강릉커피축제", result)
+    store.save_festival("run", "진해군항제", None)  # 후기를 찾지 못한 축제
+
+    finished = CategoryCheckpointStore(str(tmp_path / "checkpoints.db")).start("run", "축제", FESTIVALS)
+    assert set(finished) == {"강릉커피축제", "진해군항제"}
+    assert finished["진해군항제"] is None
+    assert finished["강릉커피축제"]["total_pos"] == 3
+    pd.testing.assert_frame_equal(finished["강릉커피축제"]["blog_results_df"], result["blog_results_df"])
+
+
+def test_manifest_records_group_and_festivals(tmp_path):
+    store = CategoryCheckpointStore(str(tmp_path / "checkpoints.db"))
+    assert store.load_manifest("run") is None
+    store.start("run", "계절과 자연", FESTIVALS)
+    manifest = store.load_manifest("run")
+    assert manifest["group_name"] == "계절과 자연"
+    assert manifest["festivals"] == FESTIVALS
+
+
+def test_expired_run_starts_over(tmp_path):
+    store = CategoryCheckpointStore(str(tmp_path / "checkpoints.db"))
+    store.start("run", "축제", FESTIVALS)
+    store.save_festival("run", "강릉커피축제", {"total_pos": 1})
+
+    store.max_age_seconds = 0
+    time.sleep(0.01)
+    assert store.start("run", "축제", FESTIVALS) == {}
+
+
+def test_clear_removes_only_that_run(tmp_path):
+    store = CategoryCheckpointStore(str(tmp_path / "checkpoints.db"))
+    for run_key in ("run-a", "run-b"):
+        store.start(run_key, "축제", FESTIVALS)
+        store.save_festival(run_key, "강릉커피축제", {"total_pos": 1})
+
+    store.clear("run-a")
+    assert store.load_manifest("run-a") is None
+    assert store.load_results("run-a") == {}
+    assert set(store.load_results("run-b")) == {"강릉커피축제"}
@@ -0,0 +1,56 @@
+# tests/test_csv_importer.py
+import pandas as pd
+
+from src.infrastructure.database import csv_importer
+from src.infrastructure.database.db_manager import FESTIVAL_TITLE_FTS, spatial_index_name, write_connection
+
+
+def _write_festival_csv(path, rows):
+    columns = ["contentid", "title", "eventstartdate", "eventenddate", "addr1", "mapx", "mapy"]
+    pd.DataFrame(rows, columns=columns).to_csv(path, index=False, encoding="cp949")
+
+
+def _festivals():
+    with write_connection() as conn:
+        return {row["contentid"]: dict(row) for row in conn.execute('SELECT * FROM festivals')}
+
+
+def _indexed_ids(table_sql):
+    with write_connection() as conn:
+        return {row[0] for row in conn.execute(table_sql)}
+
+
+def test_incremental_import_upserts_and_deletes(tour_db, tmp_path, monkeypatch):
+    csv_path = tmp_path / "festivals.csv"
+    monkeypatch.setattr(csv_importer, "FESTIVAL_CSV", str(csv_path))
+    _write_festival_csv(csv_path, [
+        (1, "강릉 커피 축제", 20251010, 20251012, "강원 강릉시", 128.9, 37.7),
+        (2, "진해군항제", 20250401, 20250410, "경남 창원시", 128.7, 35.1),
+        (3, "보령머드축제", 20250718, 20250727, "충남 보령시", 126.5, 36.3),
+    ])
+    assert csv_importer.import_festivals() == 3
+
+    _write_festival_csv(csv_path, [
+        (1, "강릉 커피 축제", 20251010, 20251012, "강원 강릉시", 128.9, 37.7),  # 그대로
+        (2, "진해 군항제", 20250401, 20250410, "경남 창원시", 128.7, 35.1),  # 제목 변경
+        (4, "안동탈춤축제", 20250926, 20251005, "경북 안동시", None, None),  # 추가 (좌표 없음)
+        (None, "contentid 없음", 20250101, 20250102, "", 127.0, 37.0),  # 건너뜀
+    ])
+    assert csv_importer.import_festivals(incremental=True) == 3
+
+    festivals = _festivals()
+    assert set(festivals) == {1, 2, 4}
+    assert festivals[2]["title"] == "진해 군항제"
+    assert festivals[4]["eventstartdate"] == "20250926"
+    # 트리거가 검색 인덱스에도 반영
+    assert _indexed_ids(f'SELECT rowid FROM {FESTIVAL_TITLE_FTS}') == {1, 2, 4}
+    assert _indexed_ids(f"SELECT rowid FROM {FESTIVAL_TITLE_FTS} WHERE {FESTIVAL_TITLE_FTS} MATCH '\"진해군항제\"'") == {2}
+    assert _indexed_ids(f'SELECT id FROM {spatial_index_name("festivals")}') == {1, 2}
+
+
+def test_incremental_import_requires_key_column(tour_db, tmp_path, monkeypatch):
+    csv_path = tmp_path / "festivals.csv"
+    monkeypatch.setattr(csv_importer, "FESTIVAL_CSV", str(csv_path))
+    pd.DataFrame({"title": ["강릉커피축제"]}).to_csv(csv_path, index=False, encoding="cp949")
+    assert csv_importer.import_festivals(incremental=True) == 0
+    assert _festivals() == {}
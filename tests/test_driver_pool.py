@@ -0,0 +1,110 @@
+# tests/test_driver_pool.py
+import pytest
+
+from src.infrastructure.web.driver_pool import WebDriverPool
+
+
+class FakeDriver:
+    def __init__(self, number):
+        self.number = number
+        self.alive = True
+        self.quit_called = False
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise RuntimeError("chrome not reachable")
+        return "about:blank"
+
+    def quit(self):
+        self.quit_called = True
+
+
+def _pool(**kwargs):
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver(len(drivers)))
+        return drivers[-1]
+    return WebDriverPool(factory, **kwargs), drivers
+
+
+def test_driver_is_created_lazily_and_reused():
+    pool, drivers = _pool(size=2)
+    assert drivers == []
+    with pool.lease() as first:
+        pass
+    with pool.lease() as second:
+        pass
+    assert first is second
+    assert pool.stats()["created"] == 1
+
+
+def test_driver_is_recycled_after_max_pages():
+    pool, drivers = _pool(size=1, max_pages=2)
+    for _ in range(3):
+        with pool.lease():
+            pass
+    assert drivers[0].quit_called
+    assert len(drivers) == 2
+    stats = pool.stats()
+    assert stats["recycled"] == 1
+    assert stats["alive"] == 1
+
+
+def test_driver_is_retired_when_lease_raises():
+    pool, drivers = _pool(size=1)
+    with pytest.raises(ValueError):
+        with pool.lease():
+            raise ValueError("frame error")
+    assert drivers[0].quit_called
+    with pool.lease() as driver:
+        assert driver is drivers[1]
+    assert pool.stats()["crashed"] == 1
+
+
+def test_dead_idle_driver_is_replaced_on_lease():
+    pool, drivers = _pool(size=1)
+    with pool.lease():
+        pass
+    drivers[0].alive = False
+    with pool.lease() as driver:
+        assert driver is drivers[1]
+    assert pool.stats()["crashed"] == 1
+
+
+def test_lease_times_out_when_pool_is_exhausted():
+    pool, _ = _pool(size=1)
+    with pool.lease():
+        with pytest.raises(TimeoutError):
+            with pool.lease(timeout=0.05):
+                pass
+
+
+def test_failed_factory_releases_slot():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("chromedriver missing")
+        return FakeDriver(len(calls))
+    pool = WebDriverPool(factory, size=1)
+    with pytest.raises(RuntimeError):
+        with pool.lease(timeout=0.05):
+            pass
+    with pool.lease(timeout=0.05) as driver:
+        assert driver.number == 2
+
+
+def test_close_quits_idle_and_returned_drivers():
+    pool, drivers = _pool(size=2)
+    pool.warm_up(1)
+    with pool.lease() as in_use_first, pool.lease():
+        pool.close()
+        assert not in_use_first.quit_called
+    assert all(driver.quit_called for driver in drivers)
+    assert pool.stats()["alive"] == 0
+    with pytest.raises(RuntimeError):
+        with pool.lease():
+            pass
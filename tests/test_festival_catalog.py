@@ -0,0 +1,40 @@
+# tests/test_festival_catalog.py
+import pickle
+
+import pytest
+
+from src.data.festival_catalog import FestivalCatalog
+
+TREE = {
+    "계절과 자연": {
+        "꽃": {"봄꽃": ["진해군항제", "여의도 봄꽃축제"], "가을꽃": ["고양 국화축제"]},
+        "바다": {"해변": ["보령머드축제", "진해군항제"]},
+    },
+    "미식과 특산물": {"음료": {"커피": ["강릉커피축제"]}},
+}
+
+
+def test_members_are_deduplicated_and_sorted():
+    catalog = FestivalCatalog(TREE)
+    assert catalog.get_festivals("계절과 자연") == ["고양 국화축제", "보령머드축제", "여의도 봄꽃축제", "진해군항제"]
+    assert catalog.get_festivals("계절과 자연", "꽃", "봄꽃") == ["여의도 봄꽃축제", "진해군항제"]
+    assert catalog.get_festivals("계절과 자연", cat3="봄꽃") == []
+
+
+def test_category_map_is_read_only():
+    catalog = FestivalCatalog(TREE)
+    category_map = catalog.category_map
+    assert category_map["강릉커피축제"] == {"cat1": "미식과 특산물", "cat2": "음료", "cat3": "커피"}
+    with pytest.raises(TypeError):
+        category_map["새 축제"] = {}
+    with pytest.raises(TypeError):
+        category_map["강릉커피축제"]["cat1"] = "변경"
+    assert catalog.category_map["강릉커피축제"]["cat1"] == "미식과 특산물"
+
+
+def test_catalog_survives_snapshot_pickle():
+    catalog = FestivalCatalog(TREE)
+    catalog.category_map  # 읽기 전용 뷰를 만든 뒤에도 pickle할 수 있어야 함
+    restored = pickle.loads(pickle.dumps(catalog, protocol=5))
+    assert restored.names == catalog.names
+    assert dict(restored.category_map["보령머드축제"]) == {"cat1": "계절과 자연", "cat2": "바다", "cat3": "해변"}
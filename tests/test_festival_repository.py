@@ -0,0 +1,70 @@
+# tests/test_festival_repository.py
+from src.infrastructure.database import db_manager, festival_repository
+from src.infrastructure.database.db_manager import (
+    FESTIVAL_TITLE_FTS, get_connection_stats, prepare_search_indexes, write_connection
+)
+from src.infrastructure.database.festival_repository import search_festival_by_title, search_festivals_by_titles
+
+FESTIVALS = [
+    (1, "강릉 커피 축제", "20251010", "20251012", "강원 강릉시", 128.9, 37.7),
+    (2, "강릉커피축제 야간 공연", "20251011", "20251011", "강원 강릉시", 128.9, 37.7),
+    (3, "진해군항제", "20250401", "20250410", "경남 창원시", 128.7, 35.1),
+    (4, "진해군항제", "20240401", "20240410", "경남 창원시", 128.7, 35.1),
+    (5, "보령머드축제", "20250718", "20250727", "충남 보령시", 126.5, 36.3),
+    (6, "부산 불꽃 축제", "20251115", "20251115", "부산 수영구", 129.1, 35.1),
+]
+
+QUERIES = [
+    "진해군항제",  # 같은 제목 여러 개 → contentid가 작은 행
+    "강릉커피축제",  # 띄어쓰기만 다른 제목
+    "커피",  # 2글자 (LIKE 검색)
+    "제20회 보령 머드축제",  # 앞에 다른 말이 붙은 검색어
+    "부산",
+    "없는 축제 이름",
+    "",
+]
+
+
+def _insert_festivals():
+    with write_connection() as conn:
+        conn.executemany(
+            'INSERT INTO festivals (contentid, title, eventstartdate, eventenddate, addr1, mapx, mapy) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            FESTIVALS
+        )
+
+
+def test_bulk_search_matches_single_search(tour_db):
+    _insert_festivals()
+    bulk = search_festivals_by_titles(QUERIES + ["진해군항제"])
+
+    assert list(bulk) == QUERIES
+    for name in QUERIES:
+        assert bulk[name] == search_festival_by_title(name), name
+
+
+def test_expected_matches(tour_db):
+    _insert_festivals()
+    results = search_festivals_by_titles(QUERIES)
+
+    assert results["진해군항제"]["contentid"] == 3
+    assert results["강릉커피축제"]["contentid"] == 1
+    assert results["제20회 보령 머드축제"]["contentid"] == 5
+    assert results["없는 축제 이름"] is None
+    assert search_festivals_by_titles([]) == {}
+
+
+def test_read_path_falls_back_without_building_index(tour_db):
+    _insert_festivals()
+    with write_connection() as conn:
+        for trigger in ("insert", "delete", "update"):
+            conn.execute(f'DROP TRIGGER festivals_title_fts_{trigger}')
+        conn.execute(f'DROP TABLE {FESTIVAL_TITLE_FTS}')
+
+    write_opens = get_connection_stats()["write_opens"]
+    assert search_festivals_by_titles(["강릉커피축제", "제20회 보령 머드축제"])["강릉커피축제"]["contentid"] == 1
+    assert get_connection_stats()["write_opens"] == write_opens
+    assert not festival_repository._has_title_index(db_manager.get_read_connection())
+
+    assert prepare_search_indexes() == {"title_index": True, "spatial_index": True}
+    assert festival_repository._has_title_index(db_manager.get_read_connection())
+    assert search_festival_by_title("제20회 보령 머드축제")["contentid"] == 5
@@ -0,0 +1,65 @@
+# tests/test_job_manager.py
+import threading
+
+import pytest
+
+from src.application.job_manager import JobManager
+from src.infrastructure.database.job_store import JobStore, FAILED, RUNNING, SUCCEEDED
+
+
+def _wait_finished(store, job_id):
+    for _ in range(500):
+        job = store.get(job_id)
+        if job["status"] in (SUCCEEDED, FAILED):
+            return job
+        threading.Event().wait(0.01)
+    raise AssertionError("작업이 끝나지 않았습니다")
+
+
+def test_job_runs_and_records_result(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    manager = JobManager(store)
+    manager.register("echo", lambda params, progress: {"value": params["value"]})
+    job = _wait_finished(store, manager.submit("echo", {"value": 1}))
+    manager.shutdown()
+
+    assert job["status"] == SUCCEEDED
+    assert job["result"] == {"value": 1}
+    assert job["attempts"] == 1
+
+
+def test_resume_fails_job_after_max_attempts(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    job_id = store.create("echo", {})
+    for _ in range(2):
+        store.mark_running(job_id)  # 실행 중 서버가 두 번 종료된 상황
+    assert store.get(job_id)["status"] == RUNNING
+
+    calls = []
+    manager = JobManager(store, max_attempts=2)
+    manager.register("echo", lambda params, progress: calls.append(1) or {})
+    assert manager.resume_unfinished() == 1
+    job = _wait_finished(store, job_id)
+    manager.shutdown()
+
+    assert calls == []
+    assert job["status"] == FAILED
+
+
+def test_submit_after_shutdown_does_not_leave_active_job(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    manager = JobManager(store)
+    manager.register("echo", lambda params, progress: {})
+    manager.shutdown()
+
+    with pytest.raises(RuntimeError):
+        manager.submit("echo", {})
+    assert manager._active == set()
+    assert len(store.list_unfinished()) == 1  # 다음 실행 때 재개
+
+
+def test_workers_are_daemon_threads(tmp_path):
+    JobManager(JobStore(str(tmp_path / "jobs.db")), max_workers=2)
+    workers = [t for t in threading.enumerate() if t.name.startswith("analysis-job")]
+    assert workers and all(t.daemon for t in workers)
+
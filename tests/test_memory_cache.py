@@ -0,0 +1,65 @@
+# tests/test_memory_cache.py
+import pandas as pd
+
+from src.infrastructure.cache.memory_cache import MemoryLRUCache, estimate_size
+
+
+def _payload(n):
+    return {"df": pd.DataFrame({"text": ["리뷰" * 10] * n})}
+
+
+def test_size_tracks_puts_and_overwrites():
+    small, large = _payload(5), _payload(50)
+    cache = MemoryLRUCache(10 * 1024 * 1024)
+    cache.put("a", small)
+    assert cache.stats()["size_bytes"] == estimate_size(small)
+
+    cache.put("a", large)
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["size_bytes"] == estimate_size(large)
+
+
+def test_evicts_least_recently_used_until_under_limit():
+    value = _payload(20)
+    size = estimate_size(value)
+    cache = MemoryLRUCache(size * 2)
+    cache.put("a", value)
+    cache.put("b", value)
+    assert cache.get("a") is not None  # a를 최근 사용으로 갱신
+    cache.put("c", value)
+
+    stats = cache.stats()
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert stats["evictions"] == 1
+    assert stats["size_bytes"] == size * 2 <= stats["max_bytes"]
+
+
+def test_oversized_value_is_not_stored():
+    cache = MemoryLRUCache(100)
+    cache.put("big", _payload(100))
+    assert cache.get("big") is None
+    assert cache.stats()["size_bytes"] == 0
+
+
+def test_invalidate_and_clear_release_bytes():
+    value = _payload(10)
+    cache = MemoryLRUCache(10 * 1024 * 1024)
+    cache.put("a", value)
+    cache.put("b", value)
+    cache.invalidate("a")
+    cache.invalidate("missing")
+    stats = cache.stats()
+    assert stats["size_bytes"] == estimate_size(value)
+    assert stats["invalidations"] == 1
+
+    cache.clear()
+    assert cache.stats()["size_bytes"] == 0
+
+
+def test_get_returns_shallow_copy_of_dict():
+    cache = MemoryLRUCache(10 * 1024 * 1024)
+    cache.put("a", {"status": "ok"})
+    cache.get("a")["status"] = "changed"
+    assert cache.get("a") == {"status": "ok"}
@@ -0,0 +1,25 @@
+# tests/test_place_repository.py
+from src.infrastructure.database.db_manager import get_connection_stats, write_connection
+from src.infrastructure.database.place_repository import find_nearby_places
+
+
+def test_nearby_places_sorted_by_distance_without_write_connection(tour_db):
+    with write_connection() as conn:
+        conn.executemany(
+            'INSERT INTO culture_facilities (contentid, title, mapx, mapy) VALUES (?, ?, ?, ?)',
+            [(10, "가까운 미술관", 128.901, 37.701), (11, "조금 먼 박물관", 128.93, 37.72), (12, "먼 공연장", 129.5, 37.0)]
+        )
+        conn.execute('INSERT INTO travel_courses (contentid, title, mapx, mapy) VALUES (20, "해안 산책 코스", 128.91, 37.70)')
+
+    write_opens = get_connection_stats()["write_opens"]
+    places = find_nearby_places(128.9, 37.7, radius_km=5)
+    assert [place["contentid"] for place in places] == [10, 20, 11]
+    assert places[0]["distance_km"] < places[1]["distance_km"] < places[2]["distance_km"]
+    assert get_connection_stats()["write_opens"] == write_opens
+
+
+def test_nearby_places_empty_without_spatial_index(tour_db):
+    with write_connection() as conn:
+        conn.execute('INSERT INTO culture_facilities (contentid, title, mapx, mapy) VALUES (10, "미술관", 128.9, 37.7)')
+        conn.execute('DROP TABLE travel_courses_rtree')
+    assert find_nearby_places(128.9, 37.7) == []
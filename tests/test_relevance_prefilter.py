@@ -0,0 +1,61 @@
+# tests/test_relevance_prefilter.py
+from src.application.agents.relevance_prefilter import agent_relevance_prefilter, score_relevance
+
+THRESHOLD = 0.2
+FILLER = "축제장 분위기와 먹거리, 주차 정보까지 정리해 봤어요. " * 20
+
+
+def _state(keyword, title, text):
+    return {"keyword": keyword, "title": title, "original_text": text, "log_details": False}
+
+
+def test_spacing_variant_passes():
+    score, _ = score_relevance("강릉커피축제", "강릉 커피 축제 다녀왔어요", "주말에 강릉 커피 축제에 갔습니다. " + FILLER)
+    assert score >= THRESHOLD
+
+
+def test_partial_official_name_passes():
+    keyword = "제17회 부산국제록페스티벌"
+    score, _ = score_relevance(keyword, "부산 록페스티벌 첫날 후기", "올해 부산록페스티벌 라인업이 좋았어요. " + FILLER)
+    assert score >= THRESHOLD
+
+
+def test_unrelated_post_scores_low():
+    score, reason = score_relevance("강릉커피축제", "제주 한 달 살기 3일차", "제주 바다와 오름을 걸었습니다. " * 30)
+    assert score < THRESHOLD
+    assert reason is not None
+
+
+def test_short_body_is_penalized_not_hard_rejected():
+    long_score, _ = score_relevance("강릉커피축제", "강릉커피축제 후기", "강릉커피축제 " + FILLER)
+    short_score, reason = score_relevance("강릉커피축제", "강릉커피축제 후기", "강릉커피축제 좋아요")
+    assert short_score < long_score
+    assert "짧음" in reason
+    # 기준 점수를 낮추면 짧은 글도 통과시킬 수 있습니다.
+    assert short_score >= -1.0
+
+
+def test_similar_event_title_is_penalized():
+    plain, _ = score_relevance("김치축제", "김치축제 후기", "김치축제 " + FILLER)
+    similar, reason = score_relevance("김치축제", "세계김치축제 후기", "김치축제 " + FILLER)
+    assert similar < plain
+    assert "유사 행사" in reason
+
+
+def test_prefilter_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("PREFILTER_ENABLED", raising=False)
+    result = agent_relevance_prefilter(_state("강릉커피축제", "제주 여행", "제주 " * 10))
+    assert result["prefilter_rejected"] is False
+
+
+def test_prefilter_uses_threshold_when_enabled(monkeypatch):
+    monkeypatch.setenv("PREFILTER_ENABLED", "true")
+    monkeypatch.setenv("PREFILTER_THRESHOLD", "0.2")
+    rejected = agent_relevance_prefilter(_state("강릉커피축제", "제주 한 달 살기", "제주 바다와 오름을 걸었습니다. " * 30))
+    assert rejected["prefilter_rejected"] is True
+    accepted = agent_relevance_prefilter(_state("강릉커피축제", "강릉 커피 축제 후기", "강릉 커피 축제 " + FILLER))
+    assert accepted["prefilter_rejected"] is False
+
+    # 기준 점수를 충분히 낮추면 어떤 규칙으로도 제외되지 않습니다.
+    monkeypatch.setenv("PREFILTER_THRESHOLD", "-10")
+    assert agent_relevance_prefilter(_state("강릉커피축제", "제주", "짧음"))["prefilter_rejected"] is False
@@ -0,0 +1,127 @@
+# tests/test_single_flight.py
+import threading
+
+import pytest
+
+from src.application.single_flight import SingleFlight
+
+
+def _start_follower(flight, key, results, progress=None):
+    def run():
+        try:
+            results.append(flight.do(key, lambda _: "follower-ran", progress=progress))
+        except Exception as e:
+            results.append(e)
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def _wait_for_followers(flight, key, count):
+    for _ in range(200):
+        with flight._lock:
+            current = flight._flights.get(key)
+            if current is not None and current.followers >= count:
+                return
+        threading.Event().wait(0.01)
+    raise AssertionError("follower가 합류하지 않았습니다")
+
+
+def test_followers_share_leader_result():
+    flight = SingleFlight("test")
+    release = threading.Event()
+    calls = []
+
+    def leader_fn(progress):
+        calls.append(1)
+        release.wait(5)
+        return {"status": "ok"}
+
+    results = []
+    leader = _run_leader(flight, "k", leader_fn, results)
+    followers = [_start_follower(flight, "k", results) for _ in range(3)]
+    _wait_for_followers(flight, "k", 3)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert calls == [1]
+    assert results == [{"status": "ok"}] * 4
+    assert flight.in_flight() == []
+
+
+def test_leader_error_is_raised_to_followers():
+    flight = SingleFlight("test")
+    release = threading.Event()
+
+    def leader_fn(progress):
+        release.wait(5)
+        raise ValueError("boom")
+
+    results = []
+    leader = _run_leader(flight, "k", leader_fn, results)
+    follower = _start_follower(flight, "k", results)
+    _wait_for_followers(flight, "k", 1)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert len(results) == 2
+    assert all(isinstance(r, ValueError) for r in results)
+    assert flight.in_flight() == []
+
+
+def test_late_follower_gets_last_progress_then_updates():
+    flight = SingleFlight("test")
+    step = threading.Event()
+    release = threading.Event()
+
+    def leader_fn(progress):
+        progress(0.3, desc="검색")
+        step.wait(5)
+        progress(0.8, desc="분석")
+        release.wait(5)
+        return "done"
+
+    results, received = [], []
+    leader = _run_leader(flight, "k", leader_fn, results)
+    _wait_for_started(flight, "k")
+    follower = _start_follower(flight, "k", results, progress=lambda p, desc="": received.append((p, desc)))
+    _wait_for_followers(flight, "k", 1)
+    step.set()
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert received[0] == (0.3, "검색")
+    assert (0.8, "분석") in received
+    assert results == ["done", "done"]
+
+
+def test_key_is_released_after_completion():
+    flight = SingleFlight("test")
+    assert flight.do("k", lambda _: 1) == 1
+    assert flight.do("k", lambda _: 2) == 2
+    with pytest.raises(RuntimeError):
+        flight.do("k", lambda _: (_ for _ in ()).throw(RuntimeError()))
+    assert flight.in_flight() == []
+
+
+def _run_leader(flight, key, fn, results):
+    def run():
+        try:
+            results.append(flight.do(key, fn))
+        except Exception as e:
+            results.append(e)
+    thread = threading.Thread(target=run)
+    thread.start()
+    _wait_for_started(flight, key)
+    return thread
+
+
+def _wait_for_started(flight, key):
+    for _ in range(200):
+        if key in flight.in_flight():
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("leader 작업이 시작되지 않았습니다")
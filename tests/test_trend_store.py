@@ -0,0 +1,103 @@
+# tests/test_trend_store.py
+import datetime
+
+import pandas as pd
+
+from src.infrastructure.cache.trend_store import TrendStore, OVERLAP_DAYS, RECENT_DAYS
+
+TODAY = datetime.date.today()
+
+
+def _days_ago(n):
+    return TODAY - datetime.timedelta(days=n)
+
+
+def _df(start, end, ratio):
+    periods = pd.date_range(start, end)
+    values = ratio(periods) if callable(ratio) else [ratio] * len(periods)
+    return pd.DataFrame({"period": periods, "ratio": values})
+
+
+def _store(tmp_path, refresh_hours=12):
+    return TrendStore(str(tmp_path / "trends.db"), refresh_hours=refresh_hours)
+
+
+def _year_with_spike(store):
+    spike_day = _days_ago(200)
+    df = _df(_days_ago(372), TODAY, lambda periods: [100.0 if p.date() == spike_day else 5.0 for p in periods])
+    store.merge("축제", df, _days_ago(372), TODAY)
+    return spike_day
+
+
+def test_plan_fetch_covers_missing_days_with_overlap(tmp_path):
+    store = _store(tmp_path)
+    assert store.plan_fetch("축제", _days_ago(30), TODAY) == (_days_ago(30 + OVERLAP_DAYS), TODAY)
+
+    store.merge("축제", _df(_days_ago(30), TODAY, 10.0), _days_ago(30), TODAY)
+    assert store.plan_fetch("축제", _days_ago(30), TODAY) is None
+    assert store.plan_fetch("축제", _days_ago(40), TODAY) == (_days_ago(40 + OVERLAP_DAYS), _days_ago(31) + datetime.timedelta(days=OVERLAP_DAYS))
+
+
+def test_plan_fetch_refreshes_stale_recent_days(tmp_path):
+    store = _store(tmp_path, refresh_hours=-1)
+    store.merge("축제", _df(_days_ago(30), TODAY, 10.0), _days_ago(30), TODAY)
+    assert store.plan_fetch("축제", _days_ago(30), TODAY) == (_days_ago(RECENT_DAYS - 1 + OVERLAP_DAYS), TODAY)
+
+
+def test_merge_rescales_new_window_to_stored_values(tmp_path):
+    store = _store(tmp_path)
+    store.merge("축제", _df(_days_ago(20), _days_ago(10), 10.0), _days_ago(20), _days_ago(10))
+    # 같은 날짜를 절반 기준으로 다시 받은 구간: 겹친 날짜 비율(2배)로 맞춰 저장
+    store.merge("축제", _df(_days_ago(15), _days_ago(5), 5.0), _days_ago(15), _days_ago(5))
+
+    df = store.get("축제", _days_ago(20), _days_ago(5))
+    assert len(df) == 16
+    assert set(df["ratio"].round(6)) == {100.0}
+    assert store.stats()["rescaled"] == 1
+
+
+def test_empty_refresh_keeps_stored_history(tmp_path):
+    store = _store(tmp_path, refresh_hours=-1)
+    spike_day = _year_with_spike(store)
+    fetch_start, fetch_end = store.plan_fetch("축제", _days_ago(365), TODAY)
+    assert (fetch_start, fetch_end) == (_days_ago(9), TODAY)
+
+    store.merge("축제", pd.DataFrame(), fetch_start, fetch_end)
+    df = store.get("축제", _days_ago(365), TODAY)
+    assert len(df) == 366
+    assert df.loc[df["ratio"].idxmax(), "period"].date() == spike_day
+    assert store.stats()["replaced"] == 1  # 처음 저장할 때만
+
+
+def test_all_zero_refresh_keeps_stored_values_and_marks_them_fresh(tmp_path):
+    store = _store(tmp_path, refresh_hours=-1)
+    _year_with_spike(store)
+    fetch_start, fetch_end = store.plan_fetch("축제", _days_ago(365), TODAY)
+    store.merge("축제", _df(fetch_start, fetch_end, 0.0), fetch_start, fetch_end)
+
+    recent = store.get("축제", _days_ago(9), TODAY)
+    assert (recent["ratio"] > 0).all()
+    store.refresh_seconds = 60 * 60
+    assert store.plan_fetch("축제", _days_ago(365), TODAY) is None
+
+
+def test_no_overlap_window_fills_only_new_days(tmp_path):
+    store = _store(tmp_path)
+    store.merge("축제", _df(_days_ago(20), _days_ago(10), 10.0), _days_ago(20), _days_ago(10))
+    store.merge("축제", _df(_days_ago(40), _days_ago(21), 30.0), _days_ago(40), _days_ago(15))
+
+    stored = store._load("축제", _days_ago(40), _days_ago(10))
+    assert len(stored) == 31
+    assert stored[_days_ago(12).isoformat()][0] == 10.0
+    assert stored[_days_ago(30).isoformat()][0] == 30.0
+    assert store.stats()["unscaled"] == 1
+
+
+def test_window_covering_stored_span_replaces_values(tmp_path):
+    store = _store(tmp_path)
+    store.merge("축제", _df(_days_ago(20), _days_ago(10), 0.0), _days_ago(20), _days_ago(10))
+    store.merge("축제", _df(_days_ago(30), _days_ago(5), 40.0), _days_ago(30), _days_ago(5))
+
+    stored = store._load("축제", _days_ago(30), _days_ago(5))
+    assert {ratio for ratio, _ in stored.values()} == {40.0}
+    assert store.stats()["replaced"] == 2